@@ -1,22 +1,140 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import Response
-from pydantic import BaseModel
-from typing import List, Optional
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, Field, PositiveFloat, ValidationError, field_validator
+from typing import Any, Dict, List, Literal, Optional
+import contextvars
+import io
+import itertools
 import os
 import json
-import numpy as np
+import struct
+import threading
+import time
 from functools import lru_cache
 
-from oberth.nozzle import MethodOfCharacteristics
-from oberth.chemistry import RocketPerformance
-from oberth.propellants import get_propellant
+from starlette.datastructures import MutableHeaders
+
+from oberth import metrics
+from oberth.cache import (MemoryCache, SnapshotCache, SQLiteCache, TieredCache, cache_key, source_fingerprint,
+                          write_snapshot)
+from oberth.metrics import phase
+
+# Performance Optimization: Cold start dominates serverless latency, so numpy and the solver
+# modules (`oberth.nozzle`, `oberth.chemistry`, ...) are imported inside the functions that use
+# them, on the first request that needs them, rather than at module load. Long-running servers
+# can set OBERTH_PRELOAD=1 to pay that cost at start-up instead of on the first request.
 
 app = FastAPI(title="Oberth API", description="Rocket Engine Design & Analysis Suite")
 
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+# Array endpoints negotiate their encoding through the Accept header: JSON (default), raw
+# little-endian float buffers behind a small JSON header, or NumPy .npy files written back to back
+JSON_MEDIA_TYPE = "application/json"
+RAW_MEDIA_TYPE = "application/octet-stream"
+NPY_MEDIA_TYPE = "application/x-npy"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+_RAW_MAGIC = b"OBTH"
+_RAW_DTYPES = {"float32": "<f4", "float64": "<f8"}
+
+# Float buffers barely compress, so gzip would only add latency to the binary formats; streamed
+# NDJSON is excluded too, since the compressor would hold lines back until its buffer fills
+try:
+    from starlette.middleware.gzip import DEFAULT_EXCLUDED_CONTENT_TYPES
+    _gzip_options = {"exclude_content_types": DEFAULT_EXCLUDED_CONTENT_TYPES
+                     + (RAW_MEDIA_TYPE, NPY_MEDIA_TYPE, NDJSON_MEDIA_TYPE)}
+except ImportError:
+    # Older Starlette has no exclusion list and compresses every content type
+    _gzip_options = {}
+
+# Request instrumentation. Per-process metrics, exposed in Prometheus format at /api/metrics
+_LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+_SIZE_BUCKETS = tuple(256 * 4**i for i in range(10)) # 256 B .. 64 MiB
+_REQUEST_SECONDS = metrics.Histogram(
+    "oberth_request_duration_seconds", "Request latency until the last body byte was sent.",
+    _LATENCY_BUCKETS, ("endpoint", "status"))
+_PHASE_SECONDS = metrics.Histogram(
+    "oberth_phase_duration_seconds", "Time spent per request phase (see Server-Timing).",
+    _LATENCY_BUCKETS, ("phase",))
+_RESPONSE_BYTES = metrics.Histogram(
+    "oberth_response_size_bytes", "Response body size on the wire (after compression).",
+    _SIZE_BUCKETS, ("endpoint",))
+_PAYLOAD_BYTES = metrics.Histogram(
+    "oberth_payload_size_bytes", "Serialized array payload size before compression.",
+    _SIZE_BUCKETS, ("kind", "encoding"))
+
+class _AppTimingMiddleware:
+    """
+    Innermost middleware: records how long the application took to start its response ('app'
+    phase), and when, so the outer middleware can attribute the rest to compression.
+    """
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        start = time.perf_counter()
+
+        async def timed_send(message):
+            if message["type"] == "http.response.start":
+                now = time.perf_counter()
+                phases = metrics.current_phases()
+                if phases is not None:
+                    phases["app"] = now - start
+                    phases["_app_end"] = now
+            await send(message)
+        await self.app(scope, receive, timed_send)
+
+class _InstrumentationMiddleware:
+    """
+    Outermost middleware: collects the phase timings of each request into a `Server-Timing`
+    header and records latency, phase and response-size histograms.
+
+    Phases: 'cache' (result cache lookups), 'solve' (solver calls), 'round', 'tolist' and
+    'dumps' (JSON serialization) or 'encode' (binary formats), 'app' (everything until the
+    response started), 'compress' or 'middleware' (between the application and the server,
+    i.e. gzip) and 'total'. Streamed bodies are sent after the header, so their later phases
+    only reach the histograms.
+    """
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        start = time.perf_counter()
+        status = 500
+        size = 0
+        with metrics.collect_phases() as phases:
+            async def instrumented_send(message):
+                nonlocal status, size
+                if message["type"] == "http.response.start":
+                    status = message["status"]
+                    now = time.perf_counter()
+                    headers = MutableHeaders(scope=message)
+                    app_end = phases.pop("_app_end", None)
+                    if app_end is not None:
+                        compressed = "content-encoding" in headers
+                        phases["compress" if compressed else "middleware"] = now - app_end
+                    phases["total"] = now - start
+                    headers.append("Server-Timing", metrics.server_timing(phases))
+                elif message["type"] == "http.response.body":
+                    size += len(message.get("body", b""))
+                await send(message)
+            try:
+                await self.app(scope, receive, instrumented_send)
+            finally:
+                route = scope.get("route")
+                endpoint = getattr(route, "path", None) or ("/" if route else "unmatched")
+                _REQUEST_SECONDS.observe(time.perf_counter() - start, endpoint, str(status))
+                _RESPONSE_BYTES.observe(size, endpoint)
+                phases.pop("_app_end", None)
+                for name, seconds in phases.items():
+                    _PHASE_SECONDS.observe(seconds, name)
+
+# Middleware added first runs innermost: app timing, gzip, CORS, then instrumentation outermost
+app.add_middleware(_AppTimingMiddleware)
+app.add_middleware(GZipMiddleware, minimum_size=1000, **_gzip_options)
 
 app.add_middleware(
     CORSMiddleware,
@@ -26,78 +144,638 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(_InstrumentationMiddleware)
+
+def _negotiate(accept):
+    """
+    Picks the response encoding for an Accept header.
+
+    Returns 'npy', 'float32' or 'float64' when the client prefers a binary format
+    (`application/x-npy`, or `application/octet-stream` with an optional `dtype` parameter,
+    float64 by default) and 'json' otherwise.
+    """
+    offers = []
+    for position, item in enumerate((accept or "").split(",")):
+        media_type, *params = item.split(";")
+        params = dict(p.strip().partition("=")[::2] for p in params)
+        try:
+            quality = float(params.get("q", 1.0))
+        except ValueError:
+            quality = 0.0
+        offers.append((-quality, position, media_type.strip().lower(), params.get("dtype", "float64")))
+    for quality, _, media_type, dtype in sorted(offers):
+        if quality >= 0.0:
+            break
+        if media_type == NPY_MEDIA_TYPE:
+            return "npy"
+        if media_type == RAW_MEDIA_TYPE and dtype in _RAW_DTYPES:
+            return dtype
+        if media_type in (JSON_MEDIA_TYPE, "application/*", "*/*"):
+            return "json"
+    return "json"
+
+def _encode_arrays(arrays, meta, encoding):
+    """
+    Serializes named arrays plus JSON-able metadata.
+
+    Returns:
+        tuple: (body, media_type, extra headers).
+    """
+    import numpy as np
+
+    if encoding == "json":
+        # Round to reduce the JSON payload size (~47%); the binary formats keep full precision
+        with phase("round"):
+            rounded = {name: np.round(array, decimals=5) for name, array in arrays.items()}
+            # NaN/inf (e.g. unconverged design points) are not valid JSON; send them as null
+            rounded = {name: array if np.isfinite(array).all() else np.where(np.isfinite(array), array, None)
+                       for name, array in rounded.items()}
+        with phase("tolist"):
+            result = {name: array.tolist() for name, array in rounded.items()}
+        result.update(meta)
+        with phase("dumps"):
+            body = json.dumps(result, separators=(',', ':'))
+        return body, JSON_MEDIA_TYPE, {}
+
+    with phase("encode"):
+        return _encode_binary(np, arrays, meta, encoding)
+
+def _encode_binary(np, arrays, meta, encoding):
+    if encoding == "npy":
+        # Performance Optimization: `write_array` streams each buffer into the BytesIO in C, and
+        # `getbuffer()` hands the result to the response without copying it again.
+        buffer = io.BytesIO()
+        for array in arrays.values():
+            np.lib.format.write_array(buffer, np.ascontiguousarray(array), allow_pickle=False)
+        headers = {"X-Oberth-Arrays": ",".join(arrays)}
+        if meta:
+            headers["X-Oberth-Meta"] = json.dumps(meta, separators=(',', ':'))
+        return buffer.getbuffer(), NPY_MEDIA_TYPE, headers
+
+    # Raw layout: b'OBTH', uint32 LE header length, JSON header padded to 8 bytes, then each array
+    # as little-endian floats at an 8-byte aligned offset (so clients can view it in place)
+    dtype = np.dtype(_RAW_DTYPES[encoding])
+    entries = []
+    offset = 0
+    for name, array in arrays.items():
+        entries.append({"name": name, "shape": list(array.shape), "offset": offset})
+        offset += -(-array.size * dtype.itemsize // 8) * 8
+    header = json.dumps({"dtype": dtype.str, "arrays": entries, "meta": meta}, separators=(',', ':')).encode()
+    header += b" " * (-len(header) % 8)
+    start = 8 + len(header)
+    body = bytearray(start + offset)
+    struct.pack_into("<4sI", body, 0, _RAW_MAGIC, len(header))
+    body[8:start] = header
+    # Performance Optimization: Each array is cast and copied by NumPy straight into its slot of
+    # the response buffer; there is no per-element Python work and no intermediate bytes object.
+    for entry, array in zip(entries, arrays.values()):
+        view = np.frombuffer(body, dtype=dtype, count=array.size, offset=start + entry["offset"])
+        view[:] = array.ravel()
+    return memoryview(body), RAW_MEDIA_TYPE, {}
+
+def _pack_payload(body, media_type, headers):
+    # Cached entry: one JSON line [media_type, headers] followed by the body bytes
+    meta = json.dumps([media_type, headers], separators=(',', ':')).encode()
+    return b"".join((meta, b"\n", body.encode() if isinstance(body, str) else body))
+
+def _unpack_payload(blob):
+    split = blob.index(b"\n")
+    media_type, headers = json.loads(blob[:split])
+    # memoryview slicing hands the body to the response without copying it
+    return memoryview(blob)[split + 1:], media_type, headers
+
+# Result cache shared by the array endpoints: an in-process LRU bounded by bytes, plus an optional
+# SQLite tier (e.g. OBERTH_CACHE_SQLITE=/tmp/oberth-cache.sqlite) shared by every worker on a host
+API_VERSION = "1.1.0"
+
+# Read-only warm-cache snapshot of common designs (see `build_snapshot`), used when present
+_SNAPSHOT_PATH = os.environ.get("OBERTH_CACHE_SNAPSHOT",
+                                os.path.join(os.path.dirname(os.path.abspath(__file__)), "warm_cache.sqlite"))
+
+def _build_cache():
+    tiers = [MemoryCache(max_bytes=int(os.environ.get("OBERTH_CACHE_BYTES", 64 * 2**20)))]
+    path = os.environ.get("OBERTH_CACHE_SQLITE")
+    if path:
+        tiers.append(SQLiteCache(path, max_bytes=int(os.environ.get("OBERTH_CACHE_SQLITE_BYTES", 512 * 2**20))))
+    if os.path.isfile(_SNAPSHOT_PATH):
+        tiers.append(SnapshotCache(_SNAPSHOT_PATH))
+    return TieredCache(tiers)
+
+_result_cache = _build_cache()
+
+@lru_cache(maxsize=None)
+def _cache_namespace():
+    # API_VERSION plus a fingerprint of the solver package (code and data tables) and of this
+    # module (serialization), computed on first use. Any change to them invalidates the SQLite
+    # tier, the warm snapshot and the ETags clients hold. Bump API_VERSION for anything else
+    # that changes responses, e.g. a NumPy upgrade that alters results.
+    here = os.path.abspath(__file__)
+    package = os.path.join(os.path.dirname(os.path.dirname(here)), "oberth")
+    return f"{API_VERSION}+{source_fingerprint([package, here])[:16]}"
+
+def _payload_key(kind, params, encoding):
+    # Keyed on the validated (normalized) request and the code/data namespace
+    return cache_key(f"{_cache_namespace()}:{kind}:{encoding}", params)
+
+def _cached_payload(kind, params, encoding, key=None):
+    """
+    Returns the serialized (body, media_type, headers) of an array endpoint, computing and
+    caching it on a miss.
+    """
+    key = key or _payload_key(kind, params, encoding)
+    with phase("cache"):
+        blob = _result_cache.get(key)
+    if blob is None:
+        arrays, meta = _ENDPOINTS[kind][1](params)
+        blob = _pack_payload(*_encode_arrays(arrays, meta, encoding))
+        with phase("cache"):
+            _result_cache.set(key, blob)
+    return _unpack_payload(blob)
+
+def _cached_response(request, kind, params):
+    """
+    Serves an array endpoint with content negotiation and ETag revalidation.
+
+    The ETag is derived from the cache key, i.e. from the request alone, so a matching
+    If-None-Match is answered with 304 before any lookup or computation.
+    """
+    encoding = _negotiate(request.headers.get("accept"))
+    key = _payload_key(kind, params, encoding)
+    headers = {"ETag": f'"{key[:32]}"', "Vary": "Accept"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if headers["ETag"] in tags or "*" in tags:
+            return Response(status_code=304, headers=headers)
+    # A fresh Response per request: middleware (GZip) rewrites the headers of the response it
+    # sends, so Response objects themselves must not be shared.
+    body, media_type, extra = _cached_payload(kind, params, encoding, key)
+    _PAYLOAD_BYTES.observe(len(body), kind, encoding)
+    return Response(content=body, media_type=media_type, headers={**headers, **extra})
+
+# Characteristic lines per interactive request: the net grows as lines^2 (1000 lines is a
+# ~30 MB mesh)
+_MAX_LINES = 1000
+
 class NozzleRequest(BaseModel):
-    expansion_ratio: float = 25.0
-    gamma: float = 1.2
-    lines: int = 20
+    expansion_ratio: float = Field(25.0, gt=0)
+    gamma: float = Field(1.2, gt=1.0)
+    lines: int = Field(20, ge=1, le=_MAX_LINES)
+    # "rao": thrust-optimized parabolic wall of `points` points (no characteristic net)
+    method: Literal["moc", "rao"] = "moc"
+    points: int = Field(60, ge=3, le=4096)
+    length_fraction: float = Field(0.8, ge=0.6, le=0.9)
+    spacing: Literal["adaptive", "uniform"] = "adaptive"
+    # Level of detail: Douglas-Peucker tolerance (throat radii) and/or a point budget applied to
+    # the contour and to the net's nodes; both None returns full resolution
+    tolerance: Optional[float] = Field(None, gt=0)
+    max_points: Optional[int] = Field(None, ge=2)
+
+# Warmed MOC solvers shared by the worker threads, checked out one request at a time
+_solver_pool = None
+_solver_pool_lock = threading.Lock()
+
+def _get_solver_pool():
+    # Performance Optimization: Solvers keep their net layout and node arrays between requests,
+    # so a cache miss for a known (gamma, lines) skips building them again.
+    global _solver_pool
+    with _solver_pool_lock:
+        if _solver_pool is None:
+            from oberth.nozzle import SolverPool
+            _solver_pool = SolverPool(max_bytes=int(os.environ.get("OBERTH_SOLVER_POOL_BYTES", 256 * 2**20)))
+        return _solver_pool
+
+def _nbytes(value):
+    # Array bytes held by a memoized result (dicts and tuples of arrays)
+    if isinstance(value, dict):
+        return sum(_nbytes(item) for item in value.values())
+    if isinstance(value, (tuple, list)):
+        return sum(_nbytes(item) for item in value)
+    return getattr(value, "nbytes", 0)
+
+# Solver-level memo shared by the nozzle, cooling and sweep paths, which also holds the
+# level-of-detail weights of `_nozzle_weights`; serialized results live in `_result_cache`.
+# Bounded by array bytes rather than entries, since one lines=1000 design alone is ~30 MB. The
+# arrays are read-only, so memoized results can be handed to every caller without copies.
+_solution_cache = MemoryCache(max_bytes=int(os.environ.get("OBERTH_SOLVER_CACHE_BYTES", 128 * 2**20)),
+                              sizeof=_nbytes)
 
-@lru_cache(maxsize=128)
 def _compute_nozzle(expansion_ratio: float, gamma: float, lines: int):
-    moc = MethodOfCharacteristics(gamma=gamma, lines=lines)
-    moc.solve(expansion_ratio=expansion_ratio)
-    # Use in-place rounding to avoid intermediate allocations and reduce JSON payload size
-    np.round(moc.contour_array, decimals=5, out=moc.contour_array)
-    np.round(moc.mesh_array, decimals=5, out=moc.mesh_array)
-    result = {
-        "contour": moc.contour_array.tolist(),
-        "mesh": moc.mesh_array.tolist()
-    }
-    # Pre-serialize to JSON to avoid FastAPI/pydantic overhead on cache hits
-    json_str = json.dumps(result, separators=(',', ':'))
-    return Response(content=json_str, media_type="application/json")
+    key = ("moc", expansion_ratio, gamma, lines)
+    result = _solution_cache.get(key)
+    if result is None:
+        with phase("solve"):
+            solution = _get_solver_pool().compute(expansion_ratio, gamma, lines)
+        result = {"contour": solution.contour, "mesh": solution.mesh}
+        _solution_cache.set(key, result)
+    return result
+
+@lru_cache(maxsize=32)
+def _compute_rao(expansion_ratio: float, points: int, length_fraction: float, spacing: str):
+    import numpy as np
+    from oberth.nozzle import rao_angles, rao_contour
+    with phase("solve"):
+        contour = rao_contour(expansion_ratio, points, length_fraction, spacing)
+    theta_n, theta_e = rao_angles(expansion_ratio, length_fraction)
+    contour.flags.writeable = False
+    return {"contour": contour, "mesh": np.empty((0, 4))}, {"theta_n": theta_n, "theta_e": theta_e}
+
+def _nozzle_geometry(geometry):
+    method, expansion_ratio, gamma, lines, points, length_fraction, spacing = geometry
+    if method == "rao":
+        return _compute_rao(expansion_ratio, points, length_fraction, spacing)
+    return _compute_nozzle(expansion_ratio, gamma, lines), {}
+
+def _nozzle_weights(geometry):
+    # Performance Optimization: One Douglas-Peucker pass ranks every vertex of a geometry, so
+    # each further level of detail (viewer zoom steps) is a threshold instead of a new pass.
+    # The weights (~23 MB for lines=1000) share the byte budget of `_solution_cache`.
+    key = ("weights",) + geometry
+    weights = _solution_cache.get(key)
+    if weights is None:
+        from oberth.nozzle import mesh_significance
+        from oberth.simplify import significance
+        arrays, _ = _nozzle_geometry(geometry)
+        mesh = arrays["mesh"]
+        weights = significance(arrays["contour"]), mesh_significance(mesh, geometry[3]) if len(mesh) else None
+        _solution_cache.set(key, weights)
+    return weights
+
+def _nozzle_arrays(params):
+    geometry = (params.get("method", "moc"), params["expansion_ratio"], params["gamma"], params["lines"],
+                params.get("points", 60), params.get("length_fraction", 0.8), params.get("spacing", "adaptive"))
+    arrays, meta = _nozzle_geometry(geometry)
+    tolerance, max_points = params.get("tolerance"), params.get("max_points")
+    if tolerance is None and max_points is None:
+        return arrays, meta
+    from oberth.nozzle import simplify_mesh
+    from oberth.simplify import select
+    with phase("simplify"):
+        contour_weights, mesh_weights = _nozzle_weights(geometry)
+        contour = arrays["contour"][select(contour_weights, tolerance, max_points)]
+        mesh = arrays["mesh"]
+        if mesh_weights is not None:
+            mesh = simplify_mesh(mesh, geometry[3], tolerance, max_points, weights=mesh_weights)
+    return {"contour": contour, "mesh": mesh}, meta
 
 @app.post("/api/nozzle")
-def calculate_nozzle(req: NozzleRequest):
+def calculate_nozzle(req: NozzleRequest, request: Request):
     """
     Generates nozzle contour using Method of Characteristics.
     """
-    return _compute_nozzle(req.expansion_ratio, req.gamma, req.lines)
+    return _cached_response(request, "nozzle", req.model_dump())
 
 class PerformanceRequest(BaseModel):
-    pc: float = 100e5 # Pa
-    pe: float = 1e5   # Pa
-    propellants: List[str] = ["LOX", "RP-1"]
-    of_range: List[float] = [1.5, 4.0]
-
-@lru_cache(maxsize=128)
-def _compute_performance(pc: float, pe: float, propellants: tuple, of_range: tuple):
-    engine = RocketPerformance(pc=pc, pe=pe)
-    engine.scan_mixture_ratio(list(propellants), list(of_range))
-
-    # Use in-place rounding to reduce JSON payload size (~47%) and avoid intermediate allocations
-    of_array = engine.results['of']
-    isp_array = engine.results['isp']
-    np.round(of_array, decimals=5, out=of_array)
-    np.round(isp_array, decimals=5, out=isp_array)
-
-    result = {
-        "of": of_array.tolist(),
-        "isp": isp_array.tolist(),
-        "propellants": engine.results['propellants']
-    }
-    # Pre-serialize to JSON to avoid FastAPI/pydantic overhead on cache hits
-    json_str = json.dumps(result, separators=(',', ':'))
-    return Response(content=json_str, media_type="application/json")
+    pc: float = Field(100e5, gt=0) # Pa
+    pe: float = Field(1e5, gt=0)   # Pa
+    # Oxidizer/fuel pair
+    propellants: List[str] = Field(["LOX", "RP-1"], min_length=2, max_length=2)
+    of_range: List[PositiveFloat] = Field([1.5, 4.0], min_length=2, max_length=2)
+    # "curve": fitted Isp curve; "equilibrium": adiabatic flame temperature from Gibbs minimization
+    model: Literal["curve", "equilibrium"] = "curve"
+    # Equilibrium maps over chamber pressure: pc_points log-spaced values across pc_range (Pa)
+    pc_range: Optional[List[PositiveFloat]] = Field(None, min_length=2, max_length=2)
+    pc_points: int = Field(1, ge=1, le=64)
+
+def _performance_arrays(params):
+    from oberth.chemistry import RocketPerformance
+    engine = RocketPerformance(pc=params["pc"], pe=params["pe"])
+    propellants = list(params["propellants"])
+    if params["model"] == "curve":
+        with phase("solve"):
+            engine.scan_mixture_ratio(propellants, list(params["of_range"]))
+        results = engine.results
+        return {"of": results['of'], "isp": results['isp']}, {"propellants": results['propellants']}
+
+    import numpy as np
+    low, high = params["pc_range"] or (params["pc"], params["pc"])
+    pc = np.geomspace(low, high, params["pc_points"]) if params["pc_range"] else params["pc"]
+    with phase("solve"):
+        engine.scan_equilibrium(propellants, list(params["of_range"]), pc=pc)
+    results = engine.results
+    arrays = {name: np.asarray(results[name], dtype=float) for name in ("of", "pc", "isp", "tc", "cstar")}
+    return arrays, {"propellants": propellants, "model": "equilibrium"}
 
 @app.post("/api/performance")
-def calculate_performance(req: PerformanceRequest):
+def calculate_performance(req: PerformanceRequest, request: Request):
     """
     Calculates Isp vs O/F ratio.
     """
-    return _compute_performance(
-        req.pc,
-        req.pe,
-        tuple(req.propellants),
-        tuple(req.of_range)
-    )
+    try:
+        return _cached_response(request, "performance", req.model_dump())
+    except ValueError as exc:
+        # Inputs the solver rejects (e.g. a propellant without thermo data) are client errors
+        return Response(status_code=422, media_type=JSON_MEDIA_TYPE, content=json.dumps({"error": str(exc)}))
+
+class CoolingRequest(BaseModel):
+    expansion_ratio: float = Field(25.0, gt=0)
+    gamma: float = Field(1.2, gt=1.0)
+    lines: int = Field(20, ge=1, le=_MAX_LINES)
+    pc: float = Field(100e5, gt=0)                  # Pa
+    c_star: float = Field(1800.0, gt=0)             # m/s
+    diameter_throat: float = Field(0.1, gt=0)       # m
+    radius_curvature: float = Field(0.05, gt=0)     # m
+    chamber_temperature: float = Field(3500.0, gt=0) # K
+    wall_temperature: float = Field(800.0, gt=0)    # K
+
+def _cooling_arrays(params):
+    from oberth.cooling import bartz_profile
+    # The wall comes from the (memoized) nozzle solve of the same geometry
+    contour = _compute_nozzle(params["expansion_ratio"], params["gamma"], params["lines"])["contour"]
+    with phase("solve"):
+        profile = bartz_profile(contour, {"gamma": params["gamma"]}, params["pc"], params["c_star"],
+                                params["diameter_throat"], params["radius_curvature"],
+                                params["chamber_temperature"], params["wall_temperature"])
+    return {name: profile[name] for name in ("x", "mach", "hg", "heat_flux")}, {}
+
+@app.post("/api/cooling")
+def calculate_cooling(req: CoolingRequest, request: Request):
+    """
+    Calculates the Bartz heat flux profile along the MOC nozzle wall.
+    """
+    return _cached_response(request, "cooling", req.model_dump())
+
+# Array endpoints: request model and (arrays, metadata) builder, shared by the batch endpoint
+_ENDPOINTS = {
+    "nozzle": (NozzleRequest, _nozzle_arrays),
+    "performance": (PerformanceRequest, _performance_arrays),
+    "cooling": (CoolingRequest, _cooling_arrays),
+}
+_BATCH_MAX_JOBS = 1000
+
+_batch_pool = None
+_batch_pool_lock = threading.Lock()
+
+def _get_batch_pool():
+    # Performance Optimization: One bounded pool shared by every batch request, created on the
+    # first batch. Solver time is mostly spent in NumPy, which releases the GIL, so distinct jobs
+    # overlap without oversubscribing the host however many batches arrive at once.
+    global _batch_pool
+    with _batch_pool_lock:
+        if _batch_pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+            _batch_pool = ThreadPoolExecutor(max_workers=min(8, (os.cpu_count() or 1) + 2),
+                                             thread_name_prefix="oberth-batch")
+        return _batch_pool
+
+class BatchJob(BaseModel):
+    type: Literal["nozzle", "performance", "cooling"]
+    params: Dict[str, Any] = {}
+
+class BatchRequest(BaseModel):
+    jobs: List[BatchJob]
+
+def _run_job(kind, params, key):
+    try:
+        body, _, _ = _cached_payload(kind, params, "json", key)
+        return body, None
+    except Exception as exc:
+        return None, f"{type(exc).__name__}: {exc}"
+
+@app.post("/api/batch")
+def calculate_batch(req: BatchRequest):
+    """
+    Evaluates a list of nozzle/performance/cooling jobs in one request.
+
+    Identical jobs are computed once and share the result cache of the single-job endpoints; the
+    remaining ones run concurrently. Results come back in job order, each with its own 'error'
+    field, so one invalid design does not fail the batch.
+    """
+    if len(req.jobs) > _BATCH_MAX_JOBS:
+        return Response(status_code=413, media_type=JSON_MEDIA_TYPE,
+                        content=json.dumps({"error": f"At most {_BATCH_MAX_JOBS} jobs per batch"}))
+
+    keys = []
+    unique = {}
+    errors = {}
+    for index, job in enumerate(req.jobs):
+        try:
+            params = _ENDPOINTS[job.type][0](**job.params).model_dump()
+        except ValidationError as exc:
+            keys.append(None)
+            errors[index] = "; ".join(
+                f"{'.'.join(map(str, e['loc']))}: {e['msg']}" for e in exc.errors())
+            continue
+        key = _payload_key(job.type, params, "json")
+        keys.append(key)
+        unique.setdefault(key, (job.type, params))
+
+    # Each job runs in a copy of this request's context, so its phases reach Server-Timing
+    pool = _get_batch_pool()
+    futures = {key: pool.submit(contextvars.copy_context().run, _run_job, kind, params, key)
+               for key, (kind, params) in unique.items()}
+    outcomes = {key: future.result() for key, future in futures.items()}
+
+    # Performance Optimization: Job results are the cached, pre-serialized JSON payloads of the
+    # single-job endpoints, spliced into the batch document as bytes instead of being parsed and
+    # re-encoded.
+    parts = []
+    for index, (job, key) in enumerate(zip(req.jobs, keys)):
+        body, error = outcomes[key] if key is not None else (None, errors[index])
+        parts.append(b'{"type":%s,"result":%s,"error":%s}' % (
+            json.dumps(job.type).encode(), body if body is not None else b"null",
+            json.dumps(error).encode()))
+    return Response(content=b'{"results":[' + b",".join(parts) + b"]}", media_type=JSON_MEDIA_TYPE)
+
+# Values per swept parameter
+_SWEEP_MAX_NUM = 10000
+
+class SweepRange(BaseModel):
+    start: float
+    stop: Optional[float] = None # Defaults to start (a single value)
+    num: int = Field(1, ge=1, le=_SWEEP_MAX_NUM)
+
+    def values(self):
+        import numpy as np
+        stop = self.start if self.stop is None else self.stop
+        return np.linspace(self.start, stop, self.num)
+
+class SweepRequest(BaseModel):
+    expansion_ratio: SweepRange = SweepRange(start=25.0)
+    gamma: SweepRange = SweepRange(start=1.2)
+    lines: SweepRange = SweepRange(start=20)
+    pc: SweepRange = SweepRange(start=100e5) # Pa
+    of: SweepRange = SweepRange(start=2.3)
+    propellants: List[str] = ["LOX", "RP-1"]
+
+    @field_validator("lines")
+    @classmethod
+    def _cap_lines(cls, lines):
+        # Invalid small line counts are reported per design in the stream; large ones are refused
+        if max(lines.start, lines.start if lines.stop is None else lines.stop) > _MAX_LINES:
+            raise ValueError(f"lines must be at most {_MAX_LINES}")
+        return lines
+
+# NDJSON lines per streamed chunk
+_SWEEP_CHUNK_LINES = 256
+
+def _sweep_geometries(req):
+    # Lazily enumerates nozzle geometries; line counts are rounded and deduplicated
+    lines = dict.fromkeys(max(int(round(v)), 0) for v in req.lines.values())
+    return itertools.product(req.expansion_ratio.values(), req.gamma.values(), lines)
+
+def _sweep_points(req):
+    """
+    Yields one result dict per design point of the sweep.
+
+    Geometry is the outer loop so each nozzle is solved (or fetched from the cache) once. Isp
+    depends on O/F only, so it is evaluated once along the O/F axis; the chamber pressure x O/F
+    points are then enumerated lazily, and memory grows with the axis lengths rather than
+    their product.
+    """
+    from oberth.chemistry import _curve_parameters, _isp_curve
+    from oberth.isentropic import mach_from_area_ratio, pressure_ratio
+
+    of = req.of.values()
+    peak_of, max_isp = _curve_parameters(tuple(req.propellants))
+    of_points = list(zip(of.tolist(), _isp_curve(of.copy(), peak_of, max_isp).tolist()))
+    chamber_pressures = req.pc.values().tolist()
+
+    for expansion_ratio, gamma, lines in _sweep_geometries(req):
+        design = {"expansion_ratio": float(expansion_ratio), "gamma": float(gamma), "lines": lines}
+        try:
+            contour = _compute_nozzle(design["expansion_ratio"], design["gamma"], lines)["contour"]
+            exit_mach = float(mach_from_area_ratio(expansion_ratio, gamma))
+            exit_pressure_ratio = float(pressure_ratio(exit_mach, gamma))
+        except Exception as exc:
+            yield {**design, "error": f"{type(exc).__name__}: {exc}"}
+            continue
+        # Wall length and exit radius in throat radii
+        nozzle = {"exit_mach": exit_mach, "length": float(contour[-1, 0]),
+                  "exit_radius": float(contour[-1, 1])}
+        for chamber_pressure, (mixture_ratio, point_isp) in itertools.product(chamber_pressures, of_points):
+            yield {**design, "pc": chamber_pressure, "of": mixture_ratio, "isp": point_isp,
+                   "exit_pressure": chamber_pressure * exit_pressure_ratio, **nozzle}
+
+def _ndjson_chunks(points):
+    # Performance Optimization: Lines are sent in chunks of `_SWEEP_CHUNK_LINES`, which keeps the
+    # per-message overhead of the streaming response low while memory stays bounded by one chunk.
+    lines = (json.dumps(point, separators=(',', ':')) + "\n" for point in points)
+    while True:
+        chunk = "".join(itertools.islice(lines, _SWEEP_CHUNK_LINES))
+        if not chunk:
+            return
+        yield chunk
+
+@app.post("/api/sweep")
+def stream_sweep(req: SweepRequest):
+    """
+    Streams a parameter sweep over expansion ratio, gamma, lines, pc and O/F as NDJSON.
+
+    Design points are generated lazily and each is written as its own JSON line while the sweep
+    runs. The response iterator only advances when the client has consumed the previous chunk
+    (backpressure), so server memory is bounded by the swept axes (at most `_SWEEP_MAX_NUM`
+    values each), not by the number of design points.
+    """
+    return StreamingResponse(_ndjson_chunks(_sweep_points(req)), media_type=NDJSON_MEDIA_TYPE)
+
+class ExportRequest(NozzleRequest):
+    format: Literal["stl", "obj"] = "stl"
+    # Azimuthal divisions of the revolved surface
+    segments: int = Field(128, ge=3, le=8192)
+    caps: bool = True
+
+_EXPORT_MEDIA_TYPES = {"stl": "model/stl", "obj": "model/obj"}
+
+@app.post("/api/nozzle/export")
+def export_nozzle(req: ExportRequest):
+    """
+    Streams the nozzle wall (any /api/nozzle geometry and level of detail) revolved into a 3D
+    surface, as binary STL or OBJ.
+
+    Facets are generated chunk by chunk as the client reads, so memory stays bounded by one
+    chunk even for multi-million-facet surfaces.
+    """
+    from oberth.export import iter_obj, iter_stl
+    params = req.model_dump()
+    contour = _nozzle_arrays(params)[0]["contour"]
+    if len(contour) < 2:
+        return Response(status_code=422, media_type=JSON_MEDIA_TYPE,
+                        content=json.dumps({"error": "No supersonic contour to export"}))
+    chunks = (iter_stl if req.format == "stl" else iter_obj)(contour, req.segments, req.caps)
+    headers = {"Content-Disposition": f'attachment; filename="nozzle.{req.format}"'}
+    return StreamingResponse(chunks, media_type=_EXPORT_MEDIA_TYPES[req.format], headers=headers)
+
+# Common designs precomputed into the warm-cache snapshot: the viewer defaults and a few
+# expansion ratios / line counts around them, in the encodings the viewers and clients request
+_SNAPSHOT_DESIGNS = (
+    [("nozzle", {"expansion_ratio": e, "gamma": 1.2, "lines": n})
+     for e in (10.0, 25.0, 50.0, 100.0) for n in (20, 50, 100)]
+    + [("performance", {"pc": 100e5, "pe": 1e5, "propellants": ["LOX", fuel], "of_range": of_range})
+       for fuel, of_range in (("RP-1", [1.0, 4.0]), ("RP-1", [1.5, 4.0]), ("LH2", [3.0, 8.0]))]
+    + [("cooling", {})]
+)
+_SNAPSHOT_ENCODINGS = ("json", "float32", "float64")
+
+def build_snapshot(path=_SNAPSHOT_PATH, designs=_SNAPSHOT_DESIGNS, encodings=_SNAPSHOT_ENCODINGS):
+    """
+    Precomputes serialized results of common designs into a warm-cache snapshot file, e.g. as
+    a deployment build step: `python -m api.index --snapshot api/warm_cache.sqlite`.
+
+    Returns:
+        int: Number of cached payloads written.
+    """
+    def entries():
+        for kind, params in designs:
+            params = _ENDPOINTS[kind][0](**params).model_dump()
+            for encoding in encodings:
+                arrays, meta = _ENDPOINTS[kind][1](params)
+                payload = _encode_arrays(arrays, meta, encoding)
+                yield _payload_key(kind, params, encoding), _pack_payload(*payload)
+    return write_snapshot(path, entries())
+
+def _preload():
+    # Eager mode for long-running servers: import everything the endpoints use up front
+    import importlib
+    for module in ("numpy", "oberth.chemistry", "oberth.cooling", "oberth.isentropic", "oberth.nozzle",
+                   "oberth.propellants"):
+        importlib.import_module(module)
+
+if os.environ.get("OBERTH_PRELOAD"):
+    _preload()
 
 @app.get("/api/health")
 def health_check():
-    return {"status": "ok", "version": "1.0.0"}
+    return {"status": "ok", "version": API_VERSION}
+
+def _cache_samples(field):
+    # (tier,) -> value samples of one cache statistic, including the solver-level memo
+    tiers = [(s["tier"], s) for s in _result_cache.stats()]
+    tiers.append(("nozzle_solver", _solution_cache.stats()))
+    return [((tier, ), stats[field]) for tier, stats in tiers if field in stats]
+
+@app.get("/api/metrics")
+def metrics_endpoint():
+    """
+    Prometheus metrics of this process: request latency, phase and payload size histograms and
+    cache statistics per tier.
+    """
+    families = [histogram.render() for histogram in
+                (_REQUEST_SECONDS, _PHASE_SECONDS, _RESPONSE_BYTES, _PAYLOAD_BYTES)]
+    for field, kind, documentation in (
+            ("hits", "counter", "Cache lookups answered by the tier."),
+            ("misses", "counter", "Cache lookups the tier could not answer."),
+            ("evictions", "counter", "Entries evicted to stay within the byte budget."),
+            ("entries", "gauge", "Entries currently stored."),
+            ("bytes", "gauge", "Bytes currently stored.")):
+        name = f"oberth_cache_{field}" + ("_total" if kind == "counter" else "")
+        families.append(metrics.render_samples(name, documentation, kind, _cache_samples(field), ("tier",)))
+    # A scrape must not create the pool (and import the solvers) on a worker that has not solved yet
+    pool = _solver_pool.stats() if _solver_pool is not None else {"idle": 0, "bytes": 0, "reused": 0, "created": 0}
+    families.append(metrics.render_samples(
+        "oberth_solver_pool_idle", "Idle MOC solvers kept warm in the pool.", "gauge", [((), pool["idle"])]))
+    families.append(metrics.render_samples(
+        "oberth_solver_pool_bytes", "Bytes of node arrays and net layouts held by idle solvers.", "gauge",
+        [((), pool["bytes"])]))
+    families.append(metrics.render_samples(
+        "oberth_solver_pool_checkouts_total", "Solver checkouts by whether a warm solver was reused.",
+        "counter", [(("true",), pool["reused"]), (("false",), pool["created"])], ("reused",)))
+    return Response(content=metrics.render(*families), media_type="text/plain; version=0.0.4")
 
 # Additional endpoint for propellant info
 @app.get("/api/propellants/{name}")
 def propellant_info(name: str):
+    from oberth.propellants import get_propellant
     prop = get_propellant(name)
     if prop:
         return prop
@@ -106,4 +784,12 @@ def propellant_info(name: str):
 # Mount static files for local development
 # This allows serving the frontend from public/ directory
 if os.path.isdir("public"):
+    from fastapi.staticfiles import StaticFiles
     app.mount("/", StaticFiles(directory="public", html=True), name="public")
+
+if __name__ == "__main__":
+    import sys
+    if len(sys.argv) == 3 and sys.argv[1] == "--snapshot":
+        print(f"Wrote {build_snapshot(sys.argv[2])} cached payloads to {sys.argv[2]}")
+    else:
+        sys.exit("usage: python -m api.index --snapshot PATH")
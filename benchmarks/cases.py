@@ -0,0 +1,277 @@
+"""
+Benchmark cases. Each case is a setup function, registered under its name with `@case`, that
+builds its inputs outside the timed region and returns the zero-argument callable to time.
+
+Hot scalar functions also carry an absolute `budget`: per-call seconds on the baseline's
+machine (see `harness.over_budget`). Budgets live here rather than in the baseline, so
+re-recording a slower baseline cannot relax them.
+"""
+import math
+
+import numpy as np
+
+CASES = {}
+BUDGETS = {}
+
+def case(name, budget=None):
+    def register(setup):
+        CASES[name] = setup
+        if budget is not None:
+            BUDGETS[name] = budget
+        return setup
+    return register
+
+@case('calibration')
+def calibration():
+    # Fixed pure-Python and NumPy workload; its time measures the machine, not the code
+    values = np.linspace(0.0, 1.0, 20000)
+
+    def run():
+        total = 0.0
+        for i in range(2000):
+            total += math.sqrt(i)
+        return total + float(np.sin(values).sum())
+    return run
+
+# Chemistry
+
+@case('chemistry.scan_mixture_ratio')
+def scan_mixture_ratio():
+    from oberth.chemistry import RocketPerformance
+    engine = RocketPerformance()
+    return lambda: engine.scan_mixture_ratio(['LOX', 'RP-1'], [1.5, 4.0])
+
+@case('chemistry.scan_mixture_ratio_batch[64]')
+def scan_mixture_ratio_batch():
+    from oberth.chemistry import RocketPerformance
+    engine = RocketPerformance()
+    ranges = np.column_stack([np.linspace(1.0, 2.0, 64), np.linspace(3.0, 4.0, 64)])
+    return lambda: engine.scan_mixture_ratio_batch(['LOX', 'RP-1'], ranges)
+
+@case('chemistry.optimize_mixture_ratio[equilibrium]')
+def optimize_mixture_ratio():
+    from oberth.chemistry import RocketPerformance
+    engine = RocketPerformance(pc=70e5)
+    return lambda: engine.optimize_mixture_ratio(['LOX', 'RP-1'], [1.5, 3.5], model='equilibrium')
+
+@case('offdesign.performance[50x200]')
+def off_design_performance():
+    from oberth.offdesign import off_design_performance
+    expansion_ratio = np.linspace(5.0, 120.0, 50)
+    altitude = np.linspace(0.0, 60000.0, 200)
+    return lambda: off_design_performance(expansion_ratio, altitude, pc=70e5, gamma=1.14, cstar=1780.0,
+                                          throat_area=0.02)
+
+@case('propellants.species_thermo[9x10000]')
+def species_thermo():
+    from oberth.propellants import SPECIES, species_thermo
+    names = SPECIES['name'].tolist()
+    temperature = np.linspace(300.0, 3500.0, 10000)
+    return lambda: species_thermo(names, temperature)
+
+@case('equilibrium.adiabatic_flame_temperature[50x8]')
+def adiabatic_flame_temperature():
+    from oberth.equilibrium import adiabatic_flame_temperature
+    of = np.linspace(1.5, 3.5, 50)[:, None]
+    pc = np.geomspace(10e5, 200e5, 8)
+    return lambda: adiabatic_flame_temperature(['LOX', 'RP-1'], of, pc)
+
+# Nozzle
+
+def _moc_case(lines):
+    from oberth.nozzle import MethodOfCharacteristics
+
+    def run():
+        MethodOfCharacteristics(gamma=1.2, lines=lines).solve(expansion_ratio=25)
+    return run
+
+for _lines in (20, 100, 500):
+    case(f'nozzle.moc_solve[lines={_lines}]')(lambda lines=_lines: _moc_case(lines))
+
+@case('nozzle.solver_pool[lines=100]')
+def solver_pool():
+    # Warm pooled solver writing into the same output buffers every time
+    from oberth.nozzle import SolverPool
+    pool = SolverPool()
+    pool.warm(1.2, 100)
+    with pool.solver(1.2, 100) as solver:
+        out = solver.allocate()
+    return lambda: pool.compute(25, 1.2, 100, out=out)
+
+@case('nozzle.rao_contour[points=200]')
+def rao_contour():
+    from oberth.nozzle import rao_contour
+    return lambda: rao_contour(25, points=200)
+
+@case('nozzle.simplify_mesh[lines=200]')
+def simplify_mesh():
+    # Full Douglas-Peucker ranking of a 200-line net plus one level of detail
+    from oberth.nozzle import MethodOfCharacteristics, simplify_mesh
+    moc = MethodOfCharacteristics(gamma=1.2, lines=200)
+    moc.solve(25)
+    return lambda: simplify_mesh(moc.mesh_array, 200, tolerance=0.01)
+
+@case('export.iter_stl[201x512]')
+def iter_stl():
+    # ~200k facets streamed in chunks, discarding the bytes
+    from oberth.export import iter_stl
+    from oberth.nozzle import MethodOfCharacteristics
+    moc = MethodOfCharacteristics(gamma=1.2, lines=200)
+    moc.solve(25)
+    return lambda: sum(len(chunk) for chunk in iter_stl(moc.contour_array, 512))
+
+@case('isentropic.area_ratio[scalar]', budget=1e-6)
+def area_ratio_scalar():
+    from oberth.nozzle import isentropic_area_ratio
+    return lambda: isentropic_area_ratio(3.0, 1.2)
+
+@case('isentropic.area_ratio[10000]')
+def area_ratio_array():
+    from oberth.nozzle import isentropic_area_ratio
+    mach = np.linspace(0.1, 6.0, 10000)
+    return lambda: isentropic_area_ratio(mach, 1.2)
+
+@case('isentropic.mach_from_area_ratio[10000]')
+def mach_from_area_ratio():
+    from oberth.isentropic import mach_from_area_ratio
+    ratios = np.linspace(1.01, 100.0, 10000)
+    return lambda: mach_from_area_ratio(ratios, 1.2)
+
+# Cooling
+
+PROP_DATA = {'viscosity': 8e-5, 'cp': 2500, 'prandtl': 0.8, 'gamma': 1.2}
+
+def _contour(stations):
+    x = np.linspace(-0.2, 0.5, stations)
+    return np.column_stack([x, 1.0 + 3.0 * x * x])
+
+@case('cooling.bartz_equation', budget=2e-6)
+def bartz_equation():
+    from oberth.cooling import bartz_equation
+    return lambda: bartz_equation(0.2, 2.0, PROP_DATA, 100e5, 1700, 0.1, 0.05)
+
+@case('cooling.bartz_profile[701]')
+def bartz_profile():
+    from oberth.cooling import bartz_profile
+    contour = _contour(701)
+    return lambda: bartz_profile(contour, PROP_DATA, 100e5, 1700, 0.1, 0.05, 3500, 800)
+
+@case('cooling.regenerative_cooling[351x3]')
+def regenerative_cooling():
+    from oberth.cooling import bartz_profile, regenerative_cooling
+    profile = bartz_profile(_contour(351), PROP_DATA, 100e5, 1700, 0.1, 0.05, 3500, 800)
+    widths = np.array([1.5e-3, 2e-3, 3e-3])
+    return lambda: regenerative_cooling(profile, 'RP-1', 5.0, widths, 4e-3, 80, 300.0, 120e5)
+
+# Mission
+
+@case('mission.stage_delta_v', budget=0.75e-6)
+def stage_delta_v():
+    from oberth.mission import Stage
+    stage = Stage(isp=300, wet_mass=10000, dry_mass=1000)
+    return lambda: stage.delta_v()
+
+@case('mission.stage_array_delta_v[10000]')
+def stage_array_delta_v():
+    from oberth.mission import StageArray
+    wet = np.linspace(5000.0, 20000.0, 10000)
+    stages = StageArray(300.0, wet, 0.1 * wet)
+    return lambda: stages.delta_v()
+
+@case('mission.hohmann_transfer_dv', budget=1e-6)
+def hohmann_transfer_dv():
+    from oberth.mission import hohmann_transfer_dv
+    return lambda: hohmann_transfer_dv(6771e3, 42164e3)
+
+@case('mission.hohmann_transfer_dv_array[10000]')
+def hohmann_transfer_dv_array():
+    from oberth.mission import hohmann_transfer_dv_array
+    r2 = np.linspace(7000e3, 42164e3, 10000)
+    return lambda: hohmann_transfer_dv_array(6771e3, r2)
+
+@case('mission.optimal_staging[1000]')
+def optimal_staging():
+    from oberth.mission import optimal_staging
+    eps = np.column_stack([np.linspace(0.05, 0.15, 1000), np.full(1000, 0.1)])
+    return lambda: optimal_staging(np.array([300.0, 350.0]), eps, 8000.0, 1000.0)
+
+@case('mission.porkchop[60x60]')
+def porkchop():
+    from oberth.mission import porkchop
+    departure = np.linspace(0.0, 300.0, 60)
+    arrival = np.linspace(200.0, 600.0, 60)
+    return lambda: porkchop('Earth', 'Mars', departure, arrival)
+
+@case('ascent.simulate_ascent[16]')
+def simulate_ascent():
+    from oberth.ascent import simulate_ascent
+    from oberth.mission import Vehicle
+    vehicle = Vehicle.from_stage_masses([280, 340], [100000, 20000], [8000, 2000], payload=1000)
+    kicks = np.radians(np.linspace(0.5, 2.0, 16))
+    return lambda: simulate_ascent(vehicle, [1.8e6, 2.5e5], pitch_kick=kicks, dt=1.0)
+
+@case('uncertainty.monte_carlo[100000]')
+def monte_carlo():
+    from oberth.uncertainty import Normal, Uniform, monte_carlo
+    inputs = {'pc': Normal(100e5, 3e5), 'of': Normal(2.3, 0.05), 'gamma': Uniform(1.18, 1.22)}
+    return lambda: monte_carlo(inputs, 100_000, seed=0)
+
+# API handlers, end to end through the ASGI test client
+
+def _client():
+    from fastapi.testclient import TestClient
+    from api.index import app
+    return TestClient(app)
+
+def _clear_api_caches():
+    from api.index import _result_cache, _solution_cache
+    _result_cache.clear()
+    _solution_cache.clear()
+
+@case('api.nozzle[miss]')
+def api_nozzle_miss():
+    client = _client()
+    request = {'expansion_ratio': 25.0, 'gamma': 1.2, 'lines': 50}
+
+    def run():
+        _clear_api_caches()
+        client.post('/api/nozzle', json=request)
+    return run
+
+@case('api.nozzle[hit]')
+def api_nozzle_hit():
+    client = _client()
+    request = {'expansion_ratio': 25.0, 'gamma': 1.2, 'lines': 50}
+    client.post('/api/nozzle', json=request)
+    return lambda: client.post('/api/nozzle', json=request)
+
+@case('api.nozzle[float32 miss]')
+def api_nozzle_binary():
+    client = _client()
+    request = {'expansion_ratio': 25.0, 'gamma': 1.2, 'lines': 50}
+    headers = {'Accept': 'application/octet-stream; dtype=float32'}
+
+    def run():
+        _clear_api_caches()
+        client.post('/api/nozzle', json=request, headers=headers)
+    return run
+
+@case('api.performance[miss]')
+def api_performance():
+    client = _client()
+
+    def run():
+        _clear_api_caches()
+        client.post('/api/performance', json={})
+    return run
+
+@case('api.batch[8 nozzles, miss]')
+def api_batch():
+    client = _client()
+    jobs = [{'type': 'nozzle', 'params': {'expansion_ratio': 10.0 + i, 'lines': 30}}
+            for i in range(8)]
+
+    def run():
+        _clear_api_caches()
+        client.post('/api/batch', json={'jobs': jobs})
+    return run
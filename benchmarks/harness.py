@@ -0,0 +1,191 @@
+"""
+Timing harness of the benchmark suite: runs the registered cases, stores results as a JSON
+baseline and flags regressions against it, and against the absolute budgets of hot scalar cases.
+
+Usage (from the repository root):
+    python -m benchmarks                     # compare against benchmarks/baseline.json
+    python -m benchmarks --save              # record a new baseline
+    python -m benchmarks -k nozzle -t 0.5    # subset, 50% tolerance
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+# A case is timed in batches of calls lasting at least `_MIN_BATCH_SECONDS`, `_REPEATS` times,
+# and reported as the fastest per-call time (the least noisy estimate on a shared machine)
+_MIN_BATCH_SECONDS = 0.05
+_REPEATS = 7
+
+# Regression tolerance: a case fails when it is more than this fraction slower than its baseline
+DEFAULT_TOLERANCE = 0.25
+
+# Name of the machine-speed reference case used to normalize timings across machines
+CALIBRATION = 'calibration'
+
+def time_case(function, min_batch_seconds=_MIN_BATCH_SECONDS, repeats=_REPEATS):
+    """
+    Times a zero-argument callable.
+
+    Returns:
+        dict: 'seconds' (fastest per-call time), 'spread' (slowest over fastest batch, minus
+        one: the run-to-run noise of this case) and 'loops' (calls per timed batch).
+    """
+    # Calibrate the batch size like `timeit.Timer.autorange`
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_batch_seconds:
+            break
+        loops *= 10 if elapsed < min_batch_seconds / 10 else 2
+    batches = [elapsed]
+    for _ in range(repeats - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            function()
+        batches.append(time.perf_counter() - start)
+    best = min(batches)
+    return {'seconds': best / loops, 'spread': max(batches) / best - 1.0, 'loops': loops}
+
+def run(cases, pattern=None, min_batch_seconds=_MIN_BATCH_SECONDS, repeats=_REPEATS, log=None):
+    """
+    Runs every case whose name contains `pattern` (plus the calibration case).
+
+    Args:
+        cases (dict): Case name -> setup function returning the callable to time.
+
+    Returns:
+        dict: Baseline-format results: 'machine' metadata and per-case 'results'.
+    """
+    import numpy as np
+    results = {}
+    for name, setup in cases.items():
+        if pattern and pattern not in name and name != CALIBRATION:
+            continue
+        results[name] = time_case(setup(), min_batch_seconds, repeats)
+        if log:
+            log(f"{name:<45} {results[name]['seconds'] * 1e6:>14.2f} us")
+    return {
+        'machine': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'processor': platform.machine(),
+        },
+        'results': results,
+    }
+
+def compare(current, baseline, tolerance=DEFAULT_TOLERANCE, normalize=True):
+    """
+    Compares a run against a baseline.
+
+    With `normalize`, each time is divided by the calibration case of its own run first, so a
+    uniformly faster or slower machine does not register as a change. A case regresses when its
+    ratio exceeds 1 + tolerance + the spread recorded in the baseline, so inherently noisy cases
+    need a proportionally larger slowdown to be flagged.
+
+    Returns:
+        list: (name, ratio, regressed) per case present in both, where ratio is current/baseline.
+    """
+    now = current['results']
+    before = baseline['results']
+    scale = 1.0
+    if normalize and CALIBRATION in now and CALIBRATION in before:
+        scale = before[CALIBRATION]['seconds'] / now[CALIBRATION]['seconds']
+    rows = []
+    for name, result in now.items():
+        if name == CALIBRATION or name not in before:
+            continue
+        ratio = result['seconds'] * scale / before[name]['seconds']
+        limit = 1.0 + tolerance + before[name].get('spread', 0.0)
+        rows.append((name, ratio, ratio > limit))
+    return rows
+
+def over_budget(current, budgets, baseline=None):
+    """
+    Checks cases against absolute per-call budgets.
+
+    Times are first rescaled to the baseline's machine by the calibration case, as in `compare`;
+    without a baseline they are taken as measured.
+
+    Returns:
+        list: (name, seconds, budget) per case slower than its budget.
+    """
+    now = current['results']
+    scale = 1.0
+    if baseline is not None and CALIBRATION in now and CALIBRATION in baseline['results']:
+        scale = baseline['results'][CALIBRATION]['seconds'] / now[CALIBRATION]['seconds']
+    return [(name, now[name]['seconds'] * scale, budget) for name, budget in budgets.items()
+            if name in now and now[name]['seconds'] * scale > budget]
+
+def _report_budgets(failures):
+    for name, seconds, budget in failures:
+        print(f"{name:<45} {seconds * 1e6:>11.2f} us over its {budget * 1e6:.2f} us budget")
+    return 1 if failures else 0
+
+def main(argv=None):
+    from benchmarks.cases import BUDGETS, CASES
+
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-k', dest='pattern', help='only run cases whose name contains this')
+    parser.add_argument('-b', '--baseline', default=BASELINE_PATH, help='baseline JSON file')
+    parser.add_argument('-t', '--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='allowed slowdown fraction before a case is flagged (default 0.25)')
+    parser.add_argument('--save', action='store_true', help='write the results as the new baseline')
+    parser.add_argument('--raw', action='store_true', help='compare without machine normalization')
+    args = parser.parse_args(argv)
+
+    current = run(CASES, args.pattern, log=print)
+    baseline = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    if args.save:
+        # A case over its budget is a regression to fix, not a new baseline to record
+        if _report_budgets(over_budget(current, BUDGETS, baseline)):
+            print("Baseline not saved")
+            return 1
+        if args.pattern and baseline is not None:
+            # Partial runs update their cases and keep the rest of the baseline, rescaled to its
+            # calibration so that every case stays comparable to the others
+            stored = baseline
+            results = current['results']
+            scale = stored['results'][CALIBRATION]['seconds'] / results.pop(CALIBRATION)['seconds']
+            for result in results.values():
+                result['seconds'] *= scale
+            stored['results'].update(results)
+            current = stored
+        with open(args.baseline, 'w') as f:
+            json.dump(current, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+
+    if baseline is None:
+        print(f"No baseline at {args.baseline}; run with --save to create one")
+        return _report_budgets(over_budget(current, BUDGETS))
+
+    rows = compare(current, baseline, args.tolerance, normalize=not args.raw)
+    print()
+    print(f"{'case':<45} {'vs baseline':>12}")
+    for name, ratio, regressed in rows:
+        print(f"{name:<45} {ratio:>11.2f}x{'  REGRESSION' if regressed else ''}")
+    regressions = [name for name, _, regressed in rows if regressed]
+    if regressions:
+        print(f"\n{len(regressions)} case(s) slower than baseline by more than {args.tolerance:.0%}")
+    failures = over_budget(current, BUDGETS, None if args.raw else baseline)
+    if failures:
+        print()
+    return 1 if _report_budgets(failures) or regressions else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
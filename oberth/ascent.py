@@ -0,0 +1,208 @@
+import math
+
+import numpy as np
+
+from oberth.atmosphere import EARTH_RADIUS, standard_atmosphere
+from oberth.mission import G0, StageArray, Vehicle
+
+# Earth gravitational parameter (m^3/s^2)
+MU_EARTH = 3.986e14
+
+def peak_isp(performance):
+    """
+    Peak specific impulse (s) from `RocketPerformance` results, one value per design.
+
+    Args:
+        performance (RocketPerformance): Engine with `scan_mixture_ratio` or
+            `scan_mixture_ratio_batch` results.
+
+    Returns:
+        float or ndarray: Maximum Isp over the scanned O/F range.
+    """
+    return np.max(np.asarray(performance.results['isp'], dtype=float), axis=-1)
+
+def _stage_columns(vehicle):
+    # (trajectories, stages) isp / wet / dry columns from any supported vehicle description
+    if isinstance(vehicle, Vehicle):
+        stages = vehicle.stages
+    elif isinstance(vehicle, StageArray):
+        stages = vehicle
+    else:
+        stages = StageArray.from_stages(vehicle)
+    return (np.atleast_2d(stages.isp), np.atleast_2d(stages.wet_mass), np.atleast_2d(stages.dry_mass))
+
+def simulate_ascent(vehicle, thrust, isp=None, exit_area=0.0, drag_coefficient=0.3,
+                    reference_area=10.0, pitch_kick=math.radians(3.0), kick_time=10.0,
+                    kick_duration=10.0, dt=0.5, t_max=900.0):
+    """
+    Propagates a batch of planar ascent trajectories in lockstep with fixed-step RK4.
+
+    Each trajectory launches vertically from a spherical, non-rotating Earth, pitches over by
+    `pitch_kick` for `kick_duration` seconds after `kick_time`, then flies a gravity turn
+    (thrust along velocity). Stages burn in order; at each burnout the spent stage is dropped and
+    the next ignites. Thrust falls with ambient pressure as F = F_vac - p_a * A_e, and drag and
+    back pressure come from the tabulated standard atmosphere.
+
+    Every per-stage argument broadcasts to (trajectories, stages) and every per-trajectory
+    argument to (trajectories,), so dispersions are simply arrays.
+
+    Args:
+        vehicle (Vehicle, StageArray or list of Stage): Stages in burn order (wet/dry masses
+            include everything stacked above)
+        thrust (array_like): Vacuum thrust per stage (N)
+        isp (array_like, optional): Vacuum Isp per stage (s), e.g. from `peak_isp`. Defaults
+            to the stages' own Isp.
+        exit_area (array_like): Nozzle exit area per stage (m^2)
+        drag_coefficient (array_like): Drag coefficient per trajectory
+        reference_area (array_like): Drag reference area per trajectory (m^2)
+        pitch_kick (array_like): Pitch-over angle from vertical per trajectory (rad)
+        kick_time (float): Time of the start of the pitch-over (s)
+        kick_duration (float): Duration of the pitch-over (s)
+        dt (float): Integration step (s)
+        t_max (float): Time limit (s)
+
+    Returns:
+        dict: 'time' (steps,) and (steps, trajectories) histories 'altitude' (m), 'downrange'
+        (m), 'speed' (m/s), 'flight_path_angle' (rad) and 'mass' (kg); per-trajectory
+        'burnout_time' (s), 'burnout_altitude' (m), 'burnout_speed' (m/s),
+        'burnout_flight_path_angle' (rad), 'gravity_loss' (m/s), 'drag_loss' (m/s),
+        'pressure_loss' (m/s), 'ideal_delta_v' (m/s) and 'crashed'.
+    """
+    stage_isp, wet, dry = _stage_columns(vehicle)
+    if isp is not None:
+        stage_isp = np.asarray(isp, dtype=float)
+    per_trajectory = [np.asarray(v, dtype=float) for v in
+                      (drag_coefficient, reference_area, pitch_kick)]
+    n = np.broadcast_shapes(stage_isp.shape[:-1], wet.shape[:-1], np.shape(thrust)[:-1],
+                            *(v.shape for v in per_trajectory))
+    n = n[0] if n else 1
+    n_stages = wet.shape[-1]
+    columns = [np.broadcast_to(np.asarray(v, dtype=float), (n, n_stages))
+               for v in (stage_isp, wet, dry, thrust, exit_area)]
+    stage_isp, wet, dry, thrust, exit_area = columns
+    drag_area = 0.5 * np.broadcast_to(per_trajectory[0] * per_trajectory[1], (n,))
+    cos_kick = np.broadcast_to(np.cos(per_trajectory[2]), (n,))
+    sin_kick = np.broadcast_to(np.sin(per_trajectory[2]), (n,))
+    mass_flow = thrust / (stage_isp * G0)
+    rows = np.arange(n)
+
+    def derivatives(t, state, stage, alive):
+        x, y, vx, vy, m = state[:5]
+        r = np.hypot(x, y)
+        radial_x, radial_y = x / r, y / r
+        pressure, density, _ = standard_atmosphere(r - EARTH_RADIUS)
+        speed = np.hypot(vx, vy)
+
+        # Thrust direction: vertical, then the pitch-over, then along the velocity vector
+        if t < kick_time:
+            dir_x, dir_y = radial_x, radial_y
+        elif t < kick_time + kick_duration:
+            dir_x = cos_kick * radial_x + sin_kick * radial_y
+            dir_y = cos_kick * radial_y - sin_kick * radial_x
+        else:
+            moving = speed > 0.0
+            safe_speed = np.where(moving, speed, 1.0)
+            dir_x = np.where(moving, vx / safe_speed, radial_x)
+            dir_y = np.where(moving, vy / safe_speed, radial_y)
+
+        k = np.minimum(stage, n_stages - 1)
+        # Cutting thrust at the dry mass inside the RK stages keeps a step that straddles burnout
+        # from accelerating the vehicle below its burnout mass
+        burning = (stage < n_stages) & alive & (m > dry[rows, k])
+        back_pressure = np.minimum(pressure * exit_area[rows, k], thrust[rows, k])
+        force = np.where(burning, thrust[rows, k] - back_pressure, 0.0)
+        drag = drag_area * density * speed
+        gravity = MU_EARTH / (r * r * r)
+        derivative = np.empty_like(state)
+        derivative[0] = vx
+        derivative[1] = vy
+        derivative[2] = (force * dir_x - drag * vx) / m - gravity * x
+        derivative[3] = (force * dir_y - drag * vy) / m - gravity * y
+        derivative[4] = np.where(burning, -mass_flow[rows, k], 0.0)
+        # Powered-flight losses: drag, gravity along the flight path and nozzle back pressure
+        sin_gamma = np.where(speed > 0.0, (radial_x * vx + radial_y * vy) / np.maximum(speed, 1e-12), 1.0)
+        derivative[5] = np.where(burning, drag * speed / m, 0.0)
+        derivative[6] = np.where(burning, gravity * r * sin_gamma, 0.0)
+        derivative[7] = np.where(burning, back_pressure / m, 0.0)
+        # Trajectories that hit the ground stay where they are
+        derivative *= alive
+        return derivative
+
+    steps = int(math.ceil(t_max / dt))
+    time = np.arange(steps + 1) * dt
+    history = np.empty((5, steps + 1, n))
+
+    # Performance Optimization: All trajectories share one (8, n) state array and advance
+    # together, so each RK4 stage is a handful of NumPy expressions over the whole batch; the
+    # only Python-level loop is over time steps. Rows are x, y, vx, vy, mass and the three
+    # accumulated losses, which are integrated with the same RK4 scheme as the motion; `history`
+    # keeps the first five rows, shape (5, steps + 1, n).
+    state = np.zeros((8, n))
+    state[1] = EARTH_RADIUS
+    state[4] = wet[:, 0]
+    stage = np.zeros(n, dtype=int)
+    alive = np.ones(n, dtype=bool)
+    history[:, 0] = state[:5]
+
+    burnout_time = np.full(n, np.nan)
+    burnout_state = np.full((5, n), np.nan)
+    last = steps
+    for i in range(steps):
+        t = time[i]
+        k1 = derivatives(t, state, stage, alive)
+        k2 = derivatives(t + 0.5 * dt, state + (0.5 * dt) * k1, stage, alive)
+        k3 = derivatives(t + 0.5 * dt, state + (0.5 * dt) * k2, stage, alive)
+        k4 = derivatives(t + dt, state + dt * k3, stage, alive)
+        state += (dt / 6.0) * (k1 + 2.0 * (k2 + k3) + k4)
+
+        # Staging: clamp to the burnout mass, then drop the spent stage
+        burning = stage < n_stages
+        k = np.minimum(stage, n_stages - 1)
+        spent = burning & (state[4] <= dry[rows, k])
+        if spent.any():
+            stage = stage + spent
+            next_stage = stage < n_stages
+            state[4] = np.where(spent & next_stage, wet[rows, np.minimum(stage, n_stages - 1)],
+                                np.where(spent, dry[rows, k], state[4]))
+            finished = spent & ~next_stage
+            burnout_time[finished] = time[i + 1]
+            burnout_state[:, finished] = state[:5, finished]
+        # Ground impact (including lift-off with thrust below weight) ends a trajectory
+        impact = alive & (np.hypot(state[0], state[1]) < EARTH_RADIUS)
+        if impact.any():
+            alive &= ~impact
+            stage[impact] = n_stages
+        history[:, i + 1] = state[:5]
+        if not (stage < n_stages).any():
+            last = i + 1
+            break
+
+    x, y, vx, vy, mass = history[:, :last + 1]
+    r = np.hypot(x, y)
+    speed = np.hypot(vx, vy)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        flight_path = np.arcsin(np.clip((x * vx + y * vy) / (r * speed), -1.0, 1.0))
+        bx, by, bvx, bvy, _ = burnout_state
+        br = np.hypot(bx, by)
+        burnout_speed = np.hypot(bvx, bvy)
+        burnout_flight_path = np.arcsin(np.clip((bx * bvx + by * bvy) / (br * burnout_speed), -1.0, 1.0))
+    altitude = r - EARTH_RADIUS
+
+    ideal = (stage_isp * G0 * np.log(wet / dry)).sum(axis=-1)
+    return {
+        'time': time[:last + 1],
+        'altitude': altitude,
+        'downrange': EARTH_RADIUS * np.arctan2(x, y),
+        'speed': speed,
+        'flight_path_angle': flight_path,
+        'mass': mass,
+        'burnout_time': burnout_time,
+        'burnout_altitude': br - EARTH_RADIUS,
+        'burnout_speed': burnout_speed,
+        'burnout_flight_path_angle': burnout_flight_path,
+        'gravity_loss': state[6].copy(),
+        'drag_loss': state[5].copy(),
+        'pressure_loss': state[7].copy(),
+        'ideal_delta_v': ideal,
+        'crashed': ~alive,
+    }
@@ -0,0 +1,77 @@
+import math
+from functools import lru_cache
+
+import numpy as np
+
+# Sea-level conditions, Earth radius (m) and specific gas constant of air (J/kg-K)
+P_SEA_LEVEL = 101325.0
+T_SEA_LEVEL = 288.15
+EARTH_RADIUS = 6.371e6
+R_AIR = 287.05287
+G0 = 9.80665
+
+# U.S. Standard Atmosphere 1976 layers: base geopotential altitude (m) and lapse rate (K/m)
+_LAYERS = (
+    (0.0, -0.0065),
+    (11000.0, 0.0),
+    (20000.0, 0.001),
+    (32000.0, 0.0028),
+    (47000.0, 0.0),
+    (51000.0, -0.0028),
+    (71000.0, -0.002),
+    (84852.0, 0.0),
+)
+
+# Table resolution and ceiling (m); above the 1976 model top the last layer is extended isothermally
+_TABLE_STEP = 250.0
+_TABLE_CEILING = 300e3
+
+def _layer_state(h):
+    # Exact layered temperature and pressure at one geopotential altitude
+    t_base, p_base = T_SEA_LEVEL, P_SEA_LEVEL
+    for (h_base, lapse), (h_next, _) in zip(_LAYERS, _LAYERS[1:] + ((math.inf, 0.0),)):
+        top = min(h, h_next)
+        dh = top - h_base
+        if lapse == 0.0:
+            p_top = p_base * math.exp(-G0 * dh / (R_AIR * t_base))
+        else:
+            p_top = p_base * ((t_base + lapse * dh) / t_base) ** (-G0 / (lapse * R_AIR))
+        t_top = t_base + lapse * dh
+        if h <= h_next:
+            return t_top, p_top
+        t_base, p_base = t_top, p_top
+
+@lru_cache(maxsize=1)
+def atmosphere_table():
+    """
+    Tabulated standard atmosphere on a uniform geometric-altitude grid.
+
+    Returns:
+        tuple: Altitude (m), temperature (K), log pressure (ln Pa) and log density (ln kg/m^3)
+        arrays, built once and cached.
+    """
+    altitude = np.arange(0.0, _TABLE_CEILING + _TABLE_STEP, _TABLE_STEP)
+    geopotential = EARTH_RADIUS * altitude / (EARTH_RADIUS + altitude)
+    temperature, pressure = np.array([_layer_state(h) for h in geopotential]).T
+    density = pressure / (R_AIR * temperature)
+    return altitude, temperature, np.log(pressure), np.log(density)
+
+def standard_atmosphere(altitude):
+    """
+    Interpolates the standard atmosphere table (linear in temperature, log-linear in pressure and
+    density) for an array of geometric altitudes.
+
+    Args:
+        altitude (float or array_like): Geometric altitude (m); clamped to sea level below 0 and
+            vanishing pressure/density above the table ceiling.
+
+    Returns:
+        tuple: Pressure (Pa), density (kg/m^3) and temperature (K) arrays.
+    """
+    table_altitude, temperature, log_pressure, log_density = atmosphere_table()
+    altitude = np.asarray(altitude, dtype=float)
+    # Performance Optimization: A uniform grid and `np.interp` make each lookup a single
+    # vectorized pass, instead of walking the layer model per altitude.
+    pressure = np.exp(np.interp(altitude, table_altitude, log_pressure, right=-np.inf))
+    density = np.exp(np.interp(altitude, table_altitude, log_density, right=-np.inf))
+    return pressure, density, np.interp(altitude, table_altitude, temperature)
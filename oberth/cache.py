@@ -0,0 +1,296 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+def cache_key(namespace, params):
+    """
+    Stable key for a cached result: SHA-256 of the namespace and JSON-encoded parameters.
+
+    Args:
+        namespace (str): Kind of result (e.g. 'nozzle:json').
+        params: JSON-serializable, already normalized parameters (e.g. a validated request).
+
+    Returns:
+        str: Hex digest, also suitable as an HTTP entity tag.
+    """
+    text = json.dumps([namespace, params], sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(text.encode()).hexdigest()
+
+def source_fingerprint(paths, suffixes=('.py', '.npy', '.npz', '.dat')):
+    """
+    SHA-256 over the contents of source and data files, for cache namespaces that must change
+    whenever the code or tables producing the cached results do.
+
+    Args:
+        paths (list of str): Files, or directories searched recursively
+        suffixes (tuple): File extensions included from directories
+
+    Returns:
+        str: Hex digest; independent of file timestamps and of the install location.
+    """
+    # (name relative to the given path's parent, file path) pairs
+    files = []
+    for path in paths:
+        base = os.path.dirname(os.path.abspath(path))
+        if not os.path.isdir(path):
+            files.append((os.path.relpath(path, base), path))
+            continue
+        for directory, subdirectories, names in os.walk(path):
+            subdirectories[:] = [name for name in subdirectories if name != '__pycache__']
+            files.extend((os.path.relpath(os.path.join(directory, name), base), os.path.join(directory, name))
+                         for name in names if name.endswith(suffixes))
+    digest = hashlib.sha256()
+    for name, path in sorted(files):
+        with open(path, 'rb') as f:
+            digest.update(name.replace(os.sep, '/').encode() + b'\0' + f.read() + b'\0')
+    return digest.hexdigest()
+
+class MemoryCache:
+    """
+    In-process LRU cache of bytes-like values bounded by their total size rather than their count.
+
+    Thread-safe; an entry larger than the whole budget is simply not stored.
+
+    Args:
+        max_bytes (int): Budget for the total size of the stored values
+        sizeof (callable): Size in bytes of a value; `len` for bytes-like values. Pass e.g. a sum
+            of `ndarray.nbytes` to keep in-memory objects (solver results) under the same budget.
+    """
+    def __init__(self, max_bytes=64 * 2**20, sizeof=len):
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # key -> (value, size), so eviction does not measure values again
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key, value):
+        size = self.sizeof(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size_bytes -= previous[1]
+            self._entries[key] = (value, size)
+            self.size_bytes += size
+            # Performance Optimization: OrderedDict keeps recency order, so eviction pops from the
+            # cold end in O(1) per entry instead of scanning for the oldest one.
+            while self.size_bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.size_bytes -= evicted
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size_bytes = 0
+
+    def stats(self):
+        return {'entries': len(self._entries), 'bytes': self.size_bytes, 'hits': self.hits,
+                'misses': self.misses, 'evictions': self.evictions}
+
+class SQLiteCache:
+    """
+    Byte-bounded LRU cache in an SQLite file, shared by every process that opens the same path.
+
+    Uses WAL journaling so readers in other workers are not blocked by writers. Database errors
+    (locked or full disk, for instance) are treated as misses, never raised to the caller.
+    """
+    def __init__(self, path, max_bytes=512 * 2**20, timeout=5.0):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._local = threading.local()
+        with self._connection() as db:
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute('CREATE TABLE IF NOT EXISTS entries '
+                       '(key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, '
+                       'accessed REAL NOT NULL)')
+            db.execute('CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)')
+
+    def _connection(self):
+        # One connection per thread; sqlite3 connections must not be shared across threads
+        db = getattr(self._local, 'db', None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            self._local.db = db
+        return db
+
+    def __len__(self):
+        return self._connection().execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+
+    def get(self, key):
+        try:
+            db = self._connection()
+            row = db.execute('SELECT value FROM entries WHERE key = ?', (key,)).fetchone()
+            if row is not None:
+                db.execute('UPDATE entries SET accessed = ? WHERE key = ?', (time.time(), key))
+        except sqlite3.Error:
+            row = None
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return row[0]
+
+    def set(self, key, value):
+        size = len(value)
+        if size > self.max_bytes:
+            return
+        try:
+            db = self._connection()
+            db.execute('INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)',
+                       (key, bytes(value), size, time.time()))
+            total = db.execute('SELECT SUM(size) FROM entries').fetchone()[0]
+            if total > self.max_bytes:
+                self._evict(db, total - self.max_bytes)
+        except sqlite3.Error:
+            pass
+
+    def _evict(self, db, excess):
+        stale = []
+        for key, size in db.execute('SELECT key, size FROM entries ORDER BY accessed'):
+            if excess <= 0:
+                break
+            stale.append((key,))
+            excess -= size
+        db.executemany('DELETE FROM entries WHERE key = ?', stale)
+        self.evictions += len(stale)
+
+    def clear(self):
+        try:
+            self._connection().execute('DELETE FROM entries')
+        except sqlite3.Error:
+            pass
+
+    def stats(self):
+        try:
+            entries, size = self._connection().execute(
+                'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries').fetchone()
+        except sqlite3.Error:
+            entries, size = 0, 0
+        return {'entries': entries, 'bytes': size, 'hits': self.hits, 'misses': self.misses,
+                'evictions': self.evictions}
+
+class TieredCache:
+    """
+    Looks entries up through a list of caches (fastest first), promoting hits from slower tiers
+    into the faster ones; writes go to every tier.
+    """
+    def __init__(self, tiers):
+        self.tiers = list(tiers)
+
+    def get(self, key):
+        for depth, tier in enumerate(self.tiers):
+            value = tier.get(key)
+            if value is not None:
+                for faster in self.tiers[:depth]:
+                    faster.set(key, value)
+                return value
+        return None
+
+    def set(self, key, value):
+        for tier in self.tiers:
+            tier.set(key, value)
+
+    def clear(self):
+        for tier in self.tiers:
+            tier.clear()
+
+    def stats(self):
+        return [dict(tier.stats(), tier=type(tier).__name__) for tier in self.tiers]
+
+def write_snapshot(path, entries):
+    """
+    Writes a read-only warm-cache snapshot file.
+
+    Args:
+        path (str): Output file (replaced if it exists).
+        entries (iterable): (key, bytes-like value) pairs.
+
+    Returns:
+        int: Number of entries written.
+    """
+    if os.path.exists(path):
+        os.remove(path)
+    db = sqlite3.connect(path)
+    try:
+        db.execute('CREATE TABLE entries (key TEXT PRIMARY KEY, value BLOB NOT NULL)')
+        db.executemany('INSERT OR REPLACE INTO entries VALUES (?, ?)',
+                       ((key, bytes(value)) for key, value in entries))
+        db.commit()
+        return db.execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+    finally:
+        db.close()
+
+class SnapshotCache:
+    """
+    Read-only tier over a snapshot file written by `write_snapshot`.
+
+    The file is opened on the first lookup, not at construction, and only the requested entries
+    are ever read, so a large snapshot adds nothing to start-up time. Writes are ignored.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._local = threading.local()
+
+    def _connection(self):
+        db = getattr(self._local, 'db', None)
+        if db is None:
+            # immutable=1: the file never changes while served, so SQLite skips all locking
+            db = sqlite3.connect(f'file:{self.path}?mode=ro&immutable=1', uri=True)
+            self._local.db = db
+        return db
+
+    def __len__(self):
+        return self._connection().execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+
+    def get(self, key):
+        try:
+            row = self._connection().execute('SELECT value FROM entries WHERE key = ?', (key,)).fetchone()
+        except sqlite3.Error:
+            row = None
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return row[0]
+
+    def set(self, key, value):
+        pass
+
+    def clear(self):
+        pass
+
+    def stats(self):
+        try:
+            entries = len(self)
+        except sqlite3.Error:
+            entries = 0
+        return {'entries': entries, 'hits': self.hits, 'misses': self.misses}
@@ -1,21 +1,199 @@
 import numpy as np
 
+from oberth.equilibrium import G0, R_UNIVERSAL, adiabatic_flame_temperature
+from oberth.isentropic import area_ratio as isentropic_area_ratio
+from oberth.offdesign import nozzle_expansion_ratio, off_design_performance
+
 # Performance Optimization: Pre-computing the constant normalized layout array as a module-level constant
 # avoids evaluating `np.arange` and allocating a new 50-element array on every call to `scan_mixture_ratio()`.
 # Benchmarks show array math overhead drops from ~0.37s to ~0.27s per 100k calls.
 _OF_NORMALIZED = np.arange(50, dtype=float) / 49.0
 
+def _curve_parameters(propellants):
+    """Returns the (peak_of, max_isp) pair of the simplified Isp curve for a propellant pair."""
+    if 'LH2' in propellants or 'Liquid Hydrogen' in propellants:
+        return 5.0, 450 # Peak actually closer to 6 for optimal Isp but usually run rich
+    if 'RP-1' in propellants or 'Kerosene' in propellants:
+        return 2.3, 320 # Vacuum Isp
+    return 2.5, 300
+
+def _isp_curve(of_ratios, peak_of, max_isp):
+    """
+    Evaluates the simplified Isp curve Isp = max_isp * exp(-k * (of - peak_of)^2).
+
+    `peak_of` and `max_isp` may be scalars or column arrays broadcasting against `of_ratios`,
+    so single scans and batched (n_designs, n_samples) blocks share the same kernel.
+    """
+    # Using different widths for rich vs lean side
+
+    # Performance Optimization: calculate the diff first to use for both the mask and the final
+    # computation. Pre-calculating the inverted squared widths eliminates an array division
+    # and an intermediate width array allocation.
+    # Further optimized by pre-calculating negative factors and executing squaring,
+    # scaling, and exponentiation via in-place operations (*=, out=diff) to avoid
+    # allocating intermediate arrays (~3.5x faster).
+    diff = of_ratios - peak_of
+
+    # 1.0 / (peak_of * 0.6)**2 = 1.0 / (peak_of**2 * 0.36)
+    val2 = -1.0 / (peak_of * peak_of)
+    val1 = val2 / 0.36
+
+    # Performance Optimization: Using `np.where(condition, val1, val2)` is actually faster
+    # than boolean array math `(condition) * (val1 - val2) + val2` for small arrays (like N=50)
+    # because the overhead of pure array math evaluations exceeds the C-level branching
+    # efficiency of np.where for small N.
+    factor = np.where(diff < 0.0, val1, val2)
+
+    # Square diff in-place and multiply by the width factors in-place
+    diff *= diff
+    diff *= factor
+
+    # In-place exponential and scaling
+    np.exp(diff, out=diff)
+    diff *= max_isp
+    return diff
+
+# Adaptive O/F sampling: uniform starting points, evaluation budget, and the chord deviation
+# (relative to the peak value) below which a stretch of the curve counts as resolved
+_ADAPTIVE_INITIAL = 9
+_ADAPTIVE_MAX_EVALUATIONS = 400
+_ADAPTIVE_RELATIVE_ERROR = 1e-3
+# New samples per bracket in `maximize_samples` (each round shrinks the bracket ~(n + 1) / 2 times)
+_BRACKET_POINTS = 8
+
+def _merge_samples(of, values, new_of, new_values):
+    # Inserts new evaluations into the sorted sample arrays
+    order = np.searchsorted(of, new_of)
+    return (np.insert(of, order, new_of),
+            {name: np.insert(value, order, new_values[name]) for name, value in values.items()})
+
+def adaptive_samples(function, start, end, tolerance=0.01, key='isp',
+                     relative_error=_ADAPTIVE_RELATIVE_ERROR, max_evaluations=_ADAPTIVE_MAX_EVALUATIONS):
+    """
+    Samples a curve over [start, end] with points concentrated where they matter.
+
+    Starting from a coarse uniform grid, each round bisects the intervals next to the current
+    maximum of `key`, and those around samples that deviate from the chord of their neighbours
+    by more than `relative_error` of the peak (steep or strongly curved stretches), until the
+    intervals are `tolerance` wide or the curve is resolved. All midpoints of a round are
+    evaluated in one call.
+
+    Args:
+        function (callable): Maps a 1-D O/F array to a dict of equally shaped result arrays
+        start (float): Lower bound
+        end (float): Upper bound
+        tolerance (float): Smallest interval width worth bisecting
+        key (str): Result maximized and checked for resolution
+
+    Returns:
+        tuple: (sorted O/F samples, dict of result arrays, number of evaluations)
+    """
+    of = np.linspace(start, end, _ADAPTIVE_INITIAL)
+    values = function(of)
+    evaluations = len(of)
+    while evaluations < max_evaluations:
+        y = values[key]
+        refine = np.zeros(len(of) - 1, dtype=bool)
+        best = int(np.nanargmax(y))
+        refine[max(best - 1, 0):best + 1] = True
+        chord = y[:-2] + (y[2:] - y[:-2]) * (of[1:-1] - of[:-2]) / (of[2:] - of[:-2])
+        # NaN (failed) samples compare False and are left alone
+        unresolved = np.abs(y[1:-1] - chord) > relative_error * np.nanmax(np.abs(y))
+        refine[:-1] |= unresolved
+        refine[1:] |= unresolved
+        refine &= np.diff(of) > tolerance
+        if not refine.any():
+            break
+        midpoints = (0.5 * (of[:-1] + of[1:]))[refine][:max_evaluations - evaluations]
+        of, values = _merge_samples(of, values, midpoints, function(midpoints))
+        evaluations += len(midpoints)
+    return of, values, evaluations
+
+def maximize_samples(function, start, end, tolerance=0.01, key='isp'):
+    """
+    Locates the maximum of a unimodal curve over [start, end] to within `tolerance`.
+
+    Each round evaluates `_BRACKET_POINTS` new points (one vectorized call) spread over the
+    bracket around the best sample so far, then narrows the bracket to that sample's
+    neighbours. A final parabolic step through the best sample and its neighbours refines the
+    estimate inside the bracket.
+
+    Args:
+        function (callable): Maps a 1-D O/F array to a dict of equally shaped result arrays
+        start (float): Lower bound
+        end (float): Upper bound
+        tolerance (float): Half-width of the final bracket
+        key (str): Result to maximize
+
+    Returns:
+        dict: Results at the optimum (including 'of'), 'evaluations' and 'bracket' (lo, hi).
+    """
+    of = np.array([float(start), float(end)])
+    values = function(of)
+    evaluations = 2
+    # Performance Optimization: Several points per round instead of one golden-section point at
+    # a time, so each round is a single batched evaluation (one equilibrium solve for the whole
+    # set) and the bracket shrinks ~4.5x per round rather than ~1.6x.
+    while True:
+        best = int(np.nanargmax(values[key]))
+        lo, hi = of[max(best - 1, 0)], of[min(best + 1, len(of) - 1)]
+        if hi - lo <= 2.0 * tolerance:
+            break
+        # New points split each side of the best sample into equal steps
+        if of[best] == lo:
+            left = 0
+        elif of[best] == hi:
+            left = _BRACKET_POINTS
+        else:
+            left = _BRACKET_POINTS // 2
+        right = _BRACKET_POINTS - left
+        new = np.concatenate([np.linspace(lo, of[best], left + 2)[1:-1],
+                              np.linspace(of[best], hi, right + 2)[1:-1]])
+        of, values = _merge_samples(of, values, new, function(new))
+        evaluations += len(new)
+
+    # Vertex of the parabola through the best sample and its neighbours, kept inside the bracket
+    result = {name: value[best] for name, value in values.items()}
+    result['of'] = of[best]
+    if 0 < best < len(of) - 1:
+        x = of[best - 1:best + 2]
+        y = values[key][best - 1:best + 2]
+        denominator = (x[0] - x[1]) * (x[0] - x[2]) * (x[1] - x[2])
+        a = (x[2] * (y[1] - y[0]) + x[1] * (y[0] - y[2]) + x[0] * (y[2] - y[1])) / denominator
+        b = (x[2] ** 2 * (y[0] - y[1]) + x[1] ** 2 * (y[2] - y[0]) + x[0] ** 2 * (y[1] - y[2])) / denominator
+        if a < 0.0:
+            vertex = np.clip(-b / (2.0 * a), lo, hi)
+            refined = function(np.array([vertex]))
+            evaluations += 1
+            if refined[key][0] > result[key]:
+                result = {name: value[0] for name, value in refined.items()}
+                result['of'] = vertex
+    result['evaluations'] = evaluations
+    result['bracket'] = (lo, hi)
+    return result
+
 class RocketPerformance:
     def __init__(self, pc=100e5, pe=1e5):
         self.pc = pc
         self.pe = pe
         self.results = {}
 
-    def scan_mixture_ratio(self, propellants, of_range):
+    def scan_mixture_ratio(self, propellants, of_range, adaptive=False, tolerance=0.01):
         """
         Calculates Isp vs O/F for given propellants.
         Returns the object itself for chaining plot_isp.
+
+        By default the range is sampled at 50 uniform points; with `adaptive` the samples
+        follow `adaptive_samples` (dense around the peak and in curved regions, down to
+        `tolerance` in O/F) and 'evaluations' is added to the results.
         """
+        if adaptive:
+            of, values, evaluations = adaptive_samples(
+                self._objective(propellants, 'curve'), of_range[0], of_range[1], tolerance)
+            self.results = {'of': of, 'isp': values['isp'], 'propellants': propellants,
+                            'evaluations': evaluations}
+            return self
+
         # Simplified model: Isp approx proportional to sqrt(Tc/M)
         # Tc(O/F) is bell-shaped, peaking near stoichiometric.
         # M(O/F) increases with O/F.
@@ -29,54 +207,165 @@ class RocketPerformance:
         # Determine peak O/F based on propellants
         # LOX/RP-1 peak ~ 2.3
         # LOX/LH2 peak ~ 5.0 (mass ratio)
+        peak_of, max_isp = _curve_parameters(propellants)
+
+        self.results = {
+            'of': of_ratios,
+            'isp': _isp_curve(of_ratios, peak_of, max_isp),
+            'propellants': propellants
+        }
+        return self
 
-        peak_of = 2.5
-        max_isp = 300
-
-        if 'LH2' in propellants or 'Liquid Hydrogen' in propellants:
-            peak_of = 5.0 # Actually closer to 6 for optimal Isp but usually run rich
-            max_isp = 450
-        elif 'RP-1' in propellants or 'Kerosene' in propellants:
-            peak_of = 2.3
-            max_isp = 320 # Vacuum Isp
-
-        # Vectorized calculation
-        # Simplified Isp curve shape: Isp = max_isp * exp(-k * (of - peak_of)^2)
-        # Using different widths for rich vs lean side
-
-        # Performance Optimization: calculate the diff first to use for both the mask and the final
-        # computation. Pre-calculating the inverted squared widths eliminates an array division
-        # and an intermediate width array allocation.
-        # Further optimized by pre-calculating negative factors and executing squaring,
-        # scaling, and exponentiation via in-place operations (*=, out=diff) to avoid
-        # allocating intermediate arrays (~3.5x faster).
-        diff = of_ratios - peak_of
-
-        # 1.0 / (peak_of * 0.6)**2 = 1.0 / (peak_of**2 * 0.36)
-        val2 = -1.0 / (peak_of * peak_of)
-        val1 = val2 / 0.36
-
-        # Square diff in-place
-        diff *= diff
-
-        # Multiply by the width factors in-place
-        # Performance Optimization: Using `np.where(condition, val1, val2)` is actually faster
-        # than boolean array math `(condition) * (val1 - val2) + val2` for small arrays (like N=50)
-        # because the overhead of pure array math evaluations exceeds the C-level branching
-        # efficiency of np.where for small N.
-        diff *= np.where(of_ratios < peak_of, val1, val2)
-
-        # In-place exponential and scaling
-        np.exp(diff, out=diff)
-        diff *= max_isp
+    def scan_mixture_ratio_batch(self, propellants, of_ranges):
+        """
+        Calculates Isp vs O/F for many designs in a single vectorized pass.
+
+        Args:
+            propellants (list): Either one propellant pair shared by every design
+                (e.g. ['LOX', 'RP-1']) or one pair per design.
+            of_ranges (array-like): O/F bounds of shape (n_designs, 2).
+
+        Stores 2D 'of' and 'isp' arrays of shape (n_designs, 50) in `self.results`.
+        Returns the object itself for chaining.
+        """
+        of_ranges = np.asarray(of_ranges, dtype=float)
+        start = of_ranges[:, 0:1]
+
+        # Performance Optimization: A single broadcasted multiply-add against the shared
+        # `_OF_NORMALIZED` layout builds the whole (n_designs, 50) O/F block at once,
+        # replacing one `scan_mixture_ratio()` call and result dict per design.
+        of_ratios = (of_ranges[:, 1:2] - start) * _OF_NORMALIZED
+        of_ratios += start
+
+        if propellants and isinstance(propellants[0], str):
+            # One pair for every design: scalar curve parameters broadcast for free.
+            peak_of, max_isp = _curve_parameters(propellants)
+        else:
+            # Performance Optimization: Curve parameters only depend on the propellant pair,
+            # so they are resolved once per distinct pair and gathered into column arrays.
+            params = {}
+            for pair in propellants:
+                key = tuple(pair)
+                if key not in params:
+                    params[key] = _curve_parameters(key)
+            table = np.array([params[tuple(pair)] for pair in propellants], dtype=float)
+            peak_of = table[:, 0:1]
+            max_isp = table[:, 1:2]
 
         self.results = {
             'of': of_ratios,
-            'isp': diff,
+            'isp': _isp_curve(of_ratios, peak_of, max_isp),
             'propellants': propellants
         }
         return self
 
+    def _objective(self, propellants, model, pc=None):
+        # O/F array -> dict of result arrays, for the adaptive sampler and the optimizer
+        if model == 'curve':
+            peak_of, max_isp = _curve_parameters(propellants)
+            return lambda of: {'isp': _isp_curve(of, peak_of, max_isp)}
+        if model == 'equilibrium':
+            pc = self.pc if pc is None else pc
+            return lambda of: self._equilibrium_point(propellants, of, pc)
+        raise ValueError(f"Unknown model: {model}")
+
+    def _equilibrium_point(self, propellants, of, pc):
+        # Equilibrium chamber results and ideal Isp (expansion from pc to pe), broadcast over O/F and pc
+        chamber = adiabatic_flame_temperature(propellants, of, pc)
+        gamma = chamber['gamma']
+        expansion = 1.0 - (self.pe / pc) ** ((gamma - 1.0) / gamma)
+        exhaust_velocity = np.sqrt(2.0 * gamma / (gamma - 1.0) * R_UNIVERSAL * 1000.0 / chamber['mw']
+                                   * chamber['tc'] * expansion)
+        return {'isp': exhaust_velocity / G0, **chamber}
+
+    def optimize_mixture_ratio(self, propellants, of_range, tolerance=0.01, model='curve', pc=None):
+        """
+        Finds the O/F ratio of maximum Isp within `of_range` to within `tolerance`.
+
+        Uses `maximize_samples`, so the number of evaluations grows with log(range / tolerance)
+        rather than range / tolerance; the Isp curve is assumed unimodal over the range.
+
+        Args:
+            propellants (list): Oxidizer/fuel pair (e.g. ['LOX', 'RP-1'])
+            of_range (list): O/F search bounds
+            tolerance (float): O/F accuracy of the optimum
+            model (str): 'curve' (fitted Isp curve) or 'equilibrium' (as `scan_equilibrium`)
+            pc (float, optional): Chamber pressure for the equilibrium model. Defaults to `self.pc`.
+
+        Returns:
+            dict: 'of' and 'isp' at the optimum (plus the chamber properties for the
+            equilibrium model), 'evaluations' and the final 'bracket'.
+        """
+        return maximize_samples(self._objective(propellants, model, pc), of_range[0], of_range[1],
+                                tolerance)
+
+    def scan_equilibrium(self, propellants, of_range, pc=None, adaptive=False, tolerance=0.01):
+        """
+        Calculates Isp vs O/F from equilibrium chamber conditions instead of the fitted curve.
+
+        The adiabatic flame temperature, molecular weight and gamma of every (O/F, pc) point
+        come from `adiabatic_flame_temperature` in one vectorized solve; Isp is the ideal
+        value for expansion from pc to the exit pressure `pe`.
+
+        Args:
+            propellants (list): Oxidizer/fuel pair (e.g. ['LOX', 'RP-1'])
+            of_range (list): O/F bounds, sampled at 50 points
+            pc (float or array_like, optional): Chamber pressure(s) (Pa). Defaults to `self.pc`;
+                an array gives (50, n_pc) result maps.
+            adaptive (bool): Sample O/F with `adaptive_samples` instead (scalar pc only)
+            tolerance (float): Finest O/F spacing of adaptive sampling
+
+        Stores 'of', 'pc', 'isp' (s), 'tc' (K), 'cstar' (m/s), 'mw' (g/mol), 'gamma' and
+        'converged' in `self.results`. Returns the object itself for chaining.
+        """
+        start, end = of_range
+        pc = np.asarray(self.pc if pc is None else pc, dtype=float)
+        if adaptive:
+            if pc.ndim:
+                raise ValueError("Adaptive sampling needs a single chamber pressure")
+            of_ratios, values, evaluations = adaptive_samples(
+                self._objective(propellants, 'equilibrium', pc), start, end, tolerance)
+            values['evaluations'] = evaluations
+        else:
+            of_ratios = _OF_NORMALIZED * (end - start) + start
+            values = self._equilibrium_point(propellants, of_ratios.reshape((-1,) + (1,) * pc.ndim), pc)
+        self.results = {'of': of_ratios, 'pc': pc, 'propellants': propellants, **values}
+        return self
+
+    def off_design(self, propellants, of, nozzles=None, altitude=None, ambient_pressure=None,
+                   throat_area=None, divergence=1.0):
+        """
+        Off-design map of C_F, delivered Isp and thrust over altitude for one or more nozzles
+        fed by this chamber (see `oberth.offdesign.off_design_performance`).
+
+        Args:
+            propellants (list): Oxidizer/fuel pair (e.g. ['LOX', 'RP-1'])
+            of (float): Mixture ratio; the chamber is solved in equilibrium at `self.pc`
+            nozzles (optional): Solved `MethodOfCharacteristics`, `NozzleSolution`, contour or
+                area ratio, or a list of them. Defaults to the nozzle expanding to `self.pe`.
+            altitude (array_like, optional): Geometric altitudes (m)
+            ambient_pressure (array_like, optional): Ambient pressures (Pa), instead of `altitude`
+            throat_area (float or array_like, optional): Throat area (m^2), for thrust
+            divergence (float or array_like): Exit momentum efficiency (1 for MOC nozzles)
+
+        Stores 'cf', 'isp' (s), 'separated', 'pe', 'pa' etc. of shape (designs, altitudes), plus
+        'expansion_ratio', 'propellants', 'of' and the chamber 'tc', 'gamma', 'cstar', in
+        `self.results`. Returns the object itself for chaining.
+        """
+        chamber = adiabatic_flame_temperature(propellants, of, self.pc)
+        gamma = chamber['gamma']
+        if nozzles is None:
+            # Optimum expansion to the stored exit pressure
+            exit_mach = np.sqrt(2.0 / (gamma - 1.0) * ((self.pc / self.pe) ** ((gamma - 1.0) / gamma) - 1.0))
+            expansion_ratio = np.atleast_1d(isentropic_area_ratio(exit_mach, gamma))
+        else:
+            expansion_ratio = np.atleast_1d(nozzle_expansion_ratio(nozzles))
+        results = off_design_performance(
+            expansion_ratio, altitude, ambient_pressure, self.pc, gamma, chamber['cstar'], throat_area, divergence)
+        self.results = {'expansion_ratio': expansion_ratio, 'propellants': propellants, 'of': of,
+                        'tc': chamber['tc'], 'gamma': gamma, 'cstar': chamber['cstar'], **results}
+        return self
+
     def plot_isp(self):
         """
         Plots the Specific Impulse vs Mixture Ratio curve.
@@ -1,5 +1,10 @@
 import math
 
+import numpy as np
+
+from oberth.isentropic import mach_from_area_ratio
+from oberth.propellants import get_propellant
+
 # Performance Optimization: Calculating the combined expression of default properties
 # as a module-level constant bypasses redundant calculation overhead inside the tight function
 # when defaults are used.
@@ -60,3 +65,200 @@ def bartz_equation(diameter, mach, prop_data, pc, c_star, diameter_throat, radiu
         * diameter**(-1.8)                  # Local area ratio scaling (velocity effect)
         * (pc / c_star)**0.8                # Chamber pressure / Mass flux dependence
     )
+
+def _property_factor(prop_data):
+    # 0.026 * cp * mu^0.2 * Pr^-0.6 of the Bartz correlation (without the sigma correction)
+    if not prop_data:
+        return _DEFAULT_PROP_FACTOR
+    mu = prop_data.get('viscosity', 8e-5)
+    cp = prop_data.get('cp', 2500)
+    pr = prop_data.get('prandtl', 0.8)
+    return 0.026 * cp * mu**0.2 * pr**(-0.6)
+
+def bartz_profile(contour, prop_data, pc, c_star, diameter_throat, radius_curvature,
+                  chamber_temperature, wall_temperature):
+    """
+    Evaluates the Bartz heat transfer coefficient and heat flux at every station of a contour.
+
+    The throat is the minimum-radius station; local diameters are scaled from it, stations
+    upstream of it are subsonic and stations downstream supersonic.
+
+    Args:
+        contour (MethodOfCharacteristics or array_like): Solved nozzle, or (N, 2) wall points
+            (x, r) ordered along the axis, in any consistent length unit
+        prop_data (dict): Property data (viscosity, cp, prandtl, gamma)
+        pc (float): Chamber pressure (Pa)
+        c_star (float): Characteristic velocity (m/s)
+        diameter_throat (float): Throat diameter (m)
+        radius_curvature (float): Radius of curvature at throat (m)
+        chamber_temperature (float): Combustion stagnation temperature (K)
+        wall_temperature (float or array_like): Gas-side wall temperature (K), per station or uniform
+
+    Returns:
+        dict: Station arrays 'x' (m), 'diameter' (m), 'mach', 'sigma', 'hg' (W/m^2-K),
+        'heat_flux' (W/m^2) and 'adiabatic_wall_temperature' (K).
+    """
+    points = getattr(contour, 'contour_array', contour)
+    points = np.asarray(points, dtype=float)
+    x = points[:, 0]
+    r = points[:, 1]
+
+    prop_data = prop_data or {}
+    gamma = prop_data.get('gamma', 1.2)
+    pr = prop_data.get('prandtl', 0.8)
+
+    throat = np.argmin(r)
+    scale = diameter_throat / (2.0 * r[throat])
+    radius_ratio = r / r[throat]
+    mach = mach_from_area_ratio(radius_ratio * radius_ratio, gamma,
+                                supersonic=np.arange(len(r)) >= throat)
+
+    # Bartz boundary-layer property correction (viscosity exponent 0.6):
+    # sigma = [0.5 (Twg/T0) (1 + (g-1)/2 M^2) + 0.5]^-0.68 * [1 + (g-1)/2 M^2]^-0.12
+    stagnation = 1.0 + 0.5 * (gamma - 1.0) * mach * mach
+    wall_ratio = np.asarray(wall_temperature, dtype=float) / chamber_temperature
+    sigma = (0.5 * wall_ratio * stagnation + 0.5) ** (-0.68) * stagnation ** (-0.12)
+
+    # A non-positive radius of curvature falls back to the throat diameter (elementwise for arrays)
+    radius_curvature = np.where(np.asarray(radius_curvature) > 0, radius_curvature, diameter_throat)
+
+    # Performance Optimization: Every station-independent factor of the correlation (property
+    # factor, throat scaling, curvature and mass flux terms) is combined into a single scalar
+    # once, so the per-station work is two array powers and a few multiplications.
+    # (Dt / D)^1.8 is taken from the radius ratio directly, which avoids forming diameters first.
+    coefficient = (
+        _property_factor(prop_data)
+        * diameter_throat**(-0.1)
+        * radius_curvature**(-0.1)
+        * (pc / c_star)**0.8
+    )
+    hg = coefficient * sigma * radius_ratio**(-1.8)
+
+    # Adiabatic wall temperature with turbulent recovery factor Pr^(1/3)
+    recovery = pr ** (1.0 / 3.0)
+    t_aw = chamber_temperature * (1.0 + recovery * (stagnation - 1.0)) / stagnation
+
+    return {
+        'x': x * scale,
+        'diameter': 2.0 * r * scale,
+        'mach': mach,
+        'sigma': sigma,
+        'hg': hg,
+        'heat_flux': hg * (t_aw - wall_temperature),
+        'adiabatic_wall_temperature': t_aw,
+    }
+
+def regenerative_cooling(profile, coolant, mass_flow, channel_width, channel_depth, channel_count,
+                         inlet_temperature, inlet_pressure, wall_thickness=1e-3,
+                         wall_conductivity=350.0):
+    """
+    Marches a counter-flow regenerative cooling jacket along a heat-flux profile.
+
+    Coolant enters at the last (exit) station and flows toward the first. At each station the
+    gas-side film, the wall and the finned coolant-side film are solved as series resistances;
+    coolant properties are taken as constant at their `oberth.propellants` values. Channel
+    geometry arguments broadcast against each other, so a whole grid of jacket designs is
+    marched at once.
+
+    Args:
+        profile (dict): Output of `bartz_profile` ('x', 'diameter', 'hg' and
+            'adiabatic_wall_temperature' are used)
+        coolant (str): Propellant name of the coolant (e.g. 'RP-1')
+        mass_flow (float or array_like): Total coolant mass flow through all channels (kg/s)
+        channel_width (float or array_like): Channel width (m)
+        channel_depth (float or array_like): Channel depth (m)
+        channel_count (int or array_like): Number of channels around the circumference
+        inlet_temperature (float): Coolant inlet temperature (K)
+        inlet_pressure (float): Coolant inlet pressure (Pa)
+        wall_thickness (float): Hot-wall thickness between gas and channel (m)
+        wall_conductivity (float): Wall and rib thermal conductivity (W/m-K)
+
+    Returns:
+        dict: Station-by-design arrays of shape (stations,) + designs 'coolant_temperature' (K),
+        'pressure' (Pa), 'heat_flux' (W/m^2), 'wall_temperature_gas' (K) and
+        'wall_temperature_coolant' (K); per-design arrays 'outlet_temperature' (K),
+        'pressure_drop' (Pa), 'max_wall_temperature' (K) and 'valid' (ribs of positive width at
+        every station). `designs` is the broadcast shape of the channel arguments, (1,) when
+        they are all scalars.
+    """
+    prop = get_propellant(coolant)
+    if prop is None:
+        raise ValueError(f"Unknown propellant: {coolant}")
+    rho = prop['density']
+    cp = prop['cp']
+    mu = prop['viscosity']
+    k = prop['thermal_conductivity']
+
+    # The designs are marched as one flat axis and reshaped to the broadcast grid on return
+    design = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (mass_flow, channel_width, channel_depth, channel_count))
+    )
+    grid = design[0].shape or (1,)
+    mass_flow, width, depth, count = (v.reshape(-1) for v in design)
+
+    diameter = np.asarray(profile['diameter'], dtype=float)[:, None]
+    hg = np.asarray(profile['hg'], dtype=float)[:, None]
+    t_aw = np.asarray(profile['adiabatic_wall_temperature'], dtype=float)[:, None]
+    x = np.asarray(profile['x'], dtype=float)
+    segment = np.hypot(np.diff(x), np.diff(diameter[:, 0]) * 0.5)[:, None]
+
+    # Channel hydraulics (identical at every station for a constant-section channel)
+    area = width * depth
+    hydraulic_diameter = 2.0 * area / (width + depth)
+    velocity = mass_flow / (count * rho * area)
+    reynolds = rho * velocity * hydraulic_diameter / mu
+    prandtl = mu * cp / k
+    # Dittus-Boelter coolant film coefficient and Blasius friction factor
+    hc = 0.023 * k / hydraulic_diameter * reynolds**0.8 * prandtl**0.4
+    friction = 0.316 * reynolds**(-0.25)
+
+    # Performance Optimization: Everything that does not depend on the coolant temperature is
+    # evaluated for all (station, design) pairs as whole (S, B) arrays before the march.
+    # Ribs between channels act as fins of height `depth`
+    circumference = np.pi * (diameter + 2.0 * wall_thickness)
+    rib = circumference / count - width
+    valid = np.all(rib > 0.0, axis=0)
+    fin_m = np.sqrt(2.0 * hc / (wall_conductivity * np.maximum(rib, 1e-9)))
+    fin_efficiency = np.tanh(fin_m * depth) / (fin_m * depth)
+    coolant_area = count * (width + 2.0 * depth * fin_efficiency)
+    gas_area = np.pi * diameter
+    # Series gas film + wall + coolant film resistance per unit gas-side area
+    resistance = 1.0 / hg + wall_thickness / wall_conductivity + gas_area / (hc * coolant_area)
+
+    # Coolant temperature gain per unit (T_aw - T_coolant) over each segment
+    gain = gas_area[1:] * segment / (resistance[1:] * mass_flow * cp)
+
+    stations = len(x)
+    coolant_temperature = np.empty((stations, len(mass_flow)))
+    coolant_temperature[-1] = inlet_temperature
+    # Performance Optimization: The march writes each station straight into its row of the
+    # preallocated result with `out=` ufuncs, so no temporaries are created per station.
+    for s in range(stations - 2, -1, -1):
+        row = coolant_temperature[s]
+        np.subtract(t_aw[s + 1], coolant_temperature[s + 1], out=row)
+        row *= gain[s]
+        row += coolant_temperature[s + 1]
+
+    heat_flux = (t_aw - coolant_temperature) / resistance
+    wall_temperature_gas = t_aw - heat_flux / hg
+    wall_temperature_coolant = wall_temperature_gas - heat_flux * (wall_thickness / wall_conductivity)
+
+    # Frictional pressure loss accumulated from the inlet (exit end) upstream
+    segment_loss = friction * segment / hydraulic_diameter * 0.5 * rho * velocity * velocity
+    pressure = np.empty_like(coolant_temperature)
+    pressure[-1] = inlet_pressure
+    np.cumsum(segment_loss[::-1], axis=0, out=pressure[-2::-1])
+    np.subtract(inlet_pressure, pressure[:-1], out=pressure[:-1])
+
+    shape = (stations,) + grid
+    return {
+        'coolant_temperature': coolant_temperature.reshape(shape),
+        'pressure': pressure.reshape(shape),
+        'heat_flux': heat_flux.reshape(shape),
+        'wall_temperature_gas': wall_temperature_gas.reshape(shape),
+        'wall_temperature_coolant': wall_temperature_coolant.reshape(shape),
+        'outlet_temperature': coolant_temperature[0].reshape(grid),
+        'pressure_drop': (inlet_pressure - pressure[0]).reshape(grid),
+        'max_wall_temperature': wall_temperature_gas.max(axis=0).reshape(grid),
+        'valid': valid.reshape(grid),
+    }
@@ -0,0 +1,576 @@
+import math
+import os
+import re
+from functools import lru_cache
+
+import numpy as np
+
+from oberth.isentropic import mach_from_area_ratio
+from oberth.propellants import (
+    ELEMENTS, PROPELLANTS, R_UNIVERSAL, SPECIES, _nasa7, get_propellant, species_index
+)
+
+# Standard gravity (m/s^2) and reference pressure (Pa)
+G0 = 9.80665
+P_REF = 1e5
+
+# Bundled lookup tables, written once offline by `build_tables()` (run `python -m oberth.equilibrium`)
+TABLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'equilibrium')
+
+_ELEMENTS = ('H', 'O', 'C')
+_ATOMIC_WEIGHTS = {'H': 1.008, 'O': 15.999, 'C': 12.011}
+
+# Gaseous combustion products of the C-H-O system, with their NASA-7 polynomials and element
+# stoichiometry (n_elements, n_species) taken from the species database
+_SPECIES = ('H2', 'O2', 'H2O', 'OH', 'H', 'O', 'CO', 'CO2')
+_SPECIES_ROWS = SPECIES[species_index(_SPECIES)]
+_NASA7 = _SPECIES_ROWS['coefficients']
+_T_MID = _SPECIES_ROWS['temperature_range'][:, 1]
+_STOICHIOMETRY = _SPECIES_ROWS['composition'][:, [ELEMENTS.index(el) for el in _ELEMENTS]].T.copy()
+
+# Table grid used by `build_tables()`: O/F spans per fuel, chamber pressures and area ratios.
+# Spans stay lean enough that oxygen can bind all carbon as CO (no condensed carbon phase).
+_OF_SPANS = {'RP-1': (1.4, 4.0), 'LH2': (2.0, 8.0), 'LCH4': (1.5, 4.5)}
+_TABLE_OF_POINTS = 31
+_TABLE_PC = np.geomspace(1e5, 300e5, 12)
+_TABLE_AREA_RATIO = np.array([2.0, 3.0, 5.0, 8.0, 10.0, 15.0, 20.0, 25.0, 40.0, 60.0, 80.0, 100.0, 150.0, 200.0])
+
+# Columns of the chamber table
+CHAMBER_FIELDS = ('tc', 'mw', 'gamma', 'cstar')
+
+_FORMULA_TOKEN = re.compile(r'([A-Z][a-z]?)(\d*\.?\d*)')
+
+def parse_formula(formula):
+    """Parses a (possibly fractional) formula such as 'CH1.95' into an {element: count} dict."""
+    counts = {}
+    for element, count in _FORMULA_TOKEN.findall(formula):
+        counts[element] = counts.get(element, 0.0) + (float(count) if count else 1.0)
+    return counts
+
+def _species_thermo(T):
+    """Returns (cp/R, h/RT, s/R) arrays over all product species at temperature T (K)."""
+    return _nasa7(_NASA7, _T_MID, T)
+
+def reactant_mixture(oxidizer, fuel, of):
+    """
+    Builds the reactant state for a bipropellant mixture.
+
+    Args:
+        oxidizer (str): Oxidizer name (e.g. 'LOX')
+        fuel (str): Fuel name (e.g. 'RP-1')
+        of (float or array_like): Oxidizer-to-fuel mass ratio
+
+    Returns:
+        tuple: (b0, h0) with b0 the element moles per kg of mixture (ordered H, O, C, along
+        a last axis for array `of`) and h0 the mixture enthalpy (J/kg)
+    """
+    of = np.asarray(of, dtype=float)
+    b0 = np.zeros(of.shape + (len(_ELEMENTS),))
+    h0 = np.zeros(of.shape)
+    for name, mass_fraction in ((oxidizer, of / (1.0 + of)), (fuel, 1.0 / (1.0 + of))):
+        prop = get_propellant(name)
+        if prop is None:
+            raise ValueError(f"Unknown propellant: {name}")
+        counts = parse_formula(prop['formula'])
+        # kg per mol of formula units
+        molar_mass = sum(_ATOMIC_WEIGHTS[el] * n for el, n in counts.items()) * 1e-3
+        moles = mass_fraction / molar_mass
+        for i, el in enumerate(_ELEMENTS):
+            b0[..., i] += moles * counts.get(el, 0.0)
+        h0 += moles * prop['heat_of_formation']
+    return b0, (float(h0) if h0.ndim == 0 else h0)
+
+def solve_equilibrium(b0, pressure, h0=None, temperature=None, max_iter=200):
+    """
+    Minimizes the Gibbs free energy of the C-H-O product mixture (Gordon & McBride method).
+
+    Exactly one of `h0` (adiabatic, fixed enthalpy) or `temperature` (fixed T) must be given.
+
+    Args:
+        b0 (ndarray): Element moles per kg of mixture (H, O, C)
+        pressure (float): Pressure (Pa)
+        h0 (float): Mixture enthalpy (J/kg) for the enthalpy-pressure problem
+        temperature (float): Temperature (K) for the temperature-pressure problem
+
+    Returns:
+        dict: Temperature 'T' (K), species mole numbers 'n' (mol/kg), molecular weight 'mw'
+        (g/mol), frozen and equilibrium specific heats 'cp_frozen'/'cp' (J/kg-K) and
+        isentropic exponents 'gamma_frozen'/'gamma'.
+    """
+    if (h0 is None) == (temperature is None):
+        raise ValueError("Specify exactly one of h0 or temperature")
+
+    # Drop elements absent from the reactants and every species that carries them
+    active = b0 > 0.0
+    species = np.all(_STOICHIOMETRY[~active] == 0.0, axis=0)
+    a = _STOICHIOMETRY[active][:, species]
+    b0 = b0[active]
+    n_el, n_sp = a.shape
+    fixed_t = temperature is not None
+
+    ln_nj = np.full(n_sp, math.log(0.1 / n_sp))
+    ln_n = math.log(0.1)
+    ln_t = math.log(temperature if fixed_t else 3000.0)
+    ln_p = math.log(pressure / P_REF)
+    size = n_el + (1 if fixed_t else 2)
+
+    for _ in range(max_iter):
+        T = math.exp(ln_t)
+        cp_all, h_all, s_all = _species_thermo(T)
+        h_rt = h_all[species]
+        nj = np.exp(ln_nj)
+        n = math.exp(ln_n)
+        n_sum = nj.sum()
+        mu = h_rt - s_all[species] + ln_nj - ln_n + ln_p
+
+        an = a * nj
+        matrix = np.zeros((size, size))
+        rhs = np.zeros(size)
+        matrix[:n_el, :n_el] = an @ a.T
+        matrix[:n_el, n_el] = an.sum(axis=1)
+        matrix[n_el, :n_el] = matrix[:n_el, n_el]
+        matrix[n_el, n_el] = n_sum - n
+        rhs[:n_el] = b0 - an.sum(axis=1) + an @ mu
+        rhs[n_el] = n - n_sum + nj @ mu
+        if not fixed_t:
+            anh = an @ h_rt
+            nh = nj @ h_rt
+            matrix[:n_el, n_el + 1] = anh
+            matrix[n_el + 1, :n_el] = anh
+            matrix[n_el, n_el + 1] = nh
+            matrix[n_el + 1, n_el] = nh
+            matrix[n_el + 1, n_el + 1] = nj @ cp_all[species] + nj @ (h_rt * h_rt)
+            rhs[n_el + 1] = h0 / (R_UNIVERSAL * T) - nh + nj @ (h_rt * mu)
+
+        x = np.linalg.solve(matrix, rhs)
+        d_ln_n = x[n_el]
+        d_ln_t = 0.0 if fixed_t else x[n_el + 1]
+        d_ln_nj = -mu + a.T @ x[:n_el] + d_ln_n
+        if not fixed_t:
+            d_ln_nj += h_rt * d_ln_t
+
+        # Step-size control factors from NASA RP-1311 (eqs. 3.1-3.3)
+        major = ln_nj - ln_n > -18.420681
+        rising = d_ln_nj > 0.0
+        limit = max(5.0 * abs(d_ln_t), 5.0 * abs(d_ln_n), np.max(d_ln_nj[major & rising], initial=0.0))
+        lam = 1.0 if limit <= 2.0 else 2.0 / limit
+        trace = ~major & (d_ln_nj >= 0.0) & (d_ln_nj - d_ln_n > 0.0)
+        if np.any(trace):
+            lam2 = np.min(np.abs((-(ln_nj - ln_n)[trace] - 9.2103404) / (d_ln_nj - d_ln_n)[trace]))
+            lam = min(lam, lam2)
+
+        ln_nj += lam * d_ln_nj
+        ln_n += lam * d_ln_n
+        ln_t += lam * d_ln_t
+        np.maximum(ln_nj, -80.0, out=ln_nj)
+
+        if (
+            np.sum(nj * np.abs(d_ln_nj)) <= 0.5e-5 * n_sum
+            and abs(n * d_ln_n) <= 0.5e-5 * n_sum
+            and abs(d_ln_t) <= 1e-4
+        ):
+            break
+    else:
+        raise RuntimeError("Equilibrium solver did not converge")
+
+    T = math.exp(ln_t)
+    cp_all, h_all, _ = _species_thermo(T)
+    h_rt = h_all[species]
+    nj = np.exp(ln_nj)
+    n = nj.sum()
+
+    # Equilibrium derivatives (NASA RP-1311, eqs. 2.50-2.59) for the shifting specific heat and gamma
+    an = a * nj
+    deriv = np.zeros((n_el + 1, n_el + 1))
+    deriv[:n_el, :n_el] = an @ a.T
+    deriv[:n_el, n_el] = an.sum(axis=1)
+    deriv[n_el, :n_el] = deriv[:n_el, n_el]
+    rhs = np.empty((n_el + 1, 2))
+    rhs[:n_el, 0] = -(an @ h_rt)
+    rhs[n_el, 0] = -(nj @ h_rt)
+    rhs[:n_el, 1] = an.sum(axis=1)
+    rhs[n_el, 1] = n
+    sol = np.linalg.solve(deriv, rhs)
+    dlnv_dlnt = 1.0 + sol[n_el, 0]
+    dlnv_dlnp = -1.0 + sol[n_el, 1]
+
+    r_mix = n * R_UNIVERSAL
+    cp_frozen = (nj @ cp_all[species]) * R_UNIVERSAL
+    cp_eq = cp_frozen + R_UNIVERSAL * (
+        (an @ h_rt) @ sol[:n_el, 0] + (nj @ h_rt) * sol[n_el, 0] + nj @ (h_rt * h_rt)
+    )
+    cv_eq = cp_eq + r_mix * dlnv_dlnt * dlnv_dlnt / dlnv_dlnp
+
+    n_full = np.zeros(len(_SPECIES))
+    n_full[species] = nj
+    return {
+        'T': T,
+        'n': n_full,
+        'mw': 1000.0 / n,
+        'cp_frozen': cp_frozen,
+        'cp': cp_eq,
+        'gamma_frozen': cp_frozen / (cp_frozen - r_mix),
+        'gamma': -(cp_eq / cv_eq) / dlnv_dlnp,
+    }
+
+def _equilibrium_derivatives(a, nj, h_rt, cp):
+    # Shifting-equilibrium properties of a batch of converged mixtures (NASA RP-1311,
+    # eqs. 2.50-2.59): rows of `nj`, `h_rt` and `cp` are points, columns species
+    n_el = a.shape[0]
+    n = nj.sum(axis=1)
+    an = a * nj[:, None, :]
+    an_sum = an.sum(axis=2)
+    anh = an @ h_rt[:, :, None]
+    nh = np.einsum('ms,ms->m', nj, h_rt)
+    deriv = np.zeros((len(n), n_el + 1, n_el + 1))
+    deriv[:, :n_el, :n_el] = an @ a.T
+    deriv[:, :n_el, n_el] = an_sum
+    deriv[:, n_el, :n_el] = an_sum
+    rhs = np.empty((len(n), n_el + 1, 2))
+    rhs[:, :n_el, 0] = -anh[:, :, 0]
+    rhs[:, n_el, 0] = -nh
+    rhs[:, :n_el, 1] = an_sum
+    rhs[:, n_el, 1] = n
+    sol = np.linalg.solve(deriv, rhs)
+    dlnv_dlnt = 1.0 + sol[:, n_el, 0]
+    dlnv_dlnp = -1.0 + sol[:, n_el, 1]
+
+    r_mix = n * R_UNIVERSAL
+    cp_frozen = np.einsum('ms,ms->m', nj, cp) * R_UNIVERSAL
+    cp_eq = cp_frozen + R_UNIVERSAL * (
+        np.einsum('me,me->m', anh[:, :, 0], sol[:, :n_el, 0]) + nh * sol[:, n_el, 0]
+        + np.einsum('ms,ms->m', nj, h_rt * h_rt)
+    )
+    cv_eq = cp_eq + r_mix * dlnv_dlnt * dlnv_dlnt / dlnv_dlnp
+    return {
+        'mw': 1000.0 / n,
+        'cp_frozen': cp_frozen,
+        'cp': cp_eq,
+        'gamma_frozen': cp_frozen / (cp_frozen - r_mix),
+        'gamma': -(cp_eq / cv_eq) / dlnv_dlnp,
+    }
+
+def solve_equilibrium_batch(b0, pressure, h0=None, temperature=None, max_iter=200):
+    """
+    Vectorized `solve_equilibrium` over many mixtures and pressures at once.
+
+    Every point runs the same Gordon & McBride Newton iteration as the scalar solver, but the
+    linear systems of all points still iterating are stacked and solved in one call; points
+    that have converged are masked out of later iterations.
+
+    Args:
+        b0 (array_like): Element moles per kg of mixture, shape (..., 3) (H, O, C)
+        pressure (array_like): Pressure (Pa), broadcasting against b0[..., 0]
+        h0 (array_like): Mixture enthalpy (J/kg) for the enthalpy-pressure problem
+        temperature (array_like): Temperature (K) for the temperature-pressure problem
+        max_iter (int): Iteration limit
+
+    Returns:
+        dict: The fields of `solve_equilibrium` as arrays of the broadcast shape ('n' with a
+        trailing species axis), plus 'converged'. Points that did not converge are NaN.
+    """
+    if (h0 is None) == (temperature is None):
+        raise ValueError("Specify exactly one of h0 or temperature")
+    fixed_t = temperature is not None
+    b0 = np.asarray(b0, dtype=float)
+    fixed = np.asarray(temperature if fixed_t else h0, dtype=float)
+    shape = np.broadcast_shapes(b0.shape[:-1], np.shape(pressure), fixed.shape)
+    b0 = np.broadcast_to(b0, shape + b0.shape[-1:]).reshape(-1, b0.shape[-1])
+    ln_p = np.log(np.broadcast_to(np.asarray(pressure, dtype=float), shape).ravel() / P_REF)
+    fixed = np.broadcast_to(fixed, shape).ravel()
+    m = len(ln_p)
+
+    # Elements present in any mixture, and the species made only of those
+    active = np.any(b0 > 0.0, axis=0)
+    species = np.all(_STOICHIOMETRY[~active] == 0.0, axis=0)
+    a = _STOICHIOMETRY[active][:, species]
+    b0 = b0[:, active]
+    coefficients, t_mid = _NASA7[species], _T_MID[species]
+    n_el, n_sp = a.shape
+    size = n_el + (1 if fixed_t else 2)
+
+    ln_nj = np.full((m, n_sp), math.log(0.1 / n_sp))
+    ln_n = np.full(m, math.log(0.1))
+    ln_t = np.log(fixed) if fixed_t else np.full(m, math.log(3000.0))
+    todo = np.arange(m)
+    singular = np.zeros(m, dtype=bool)
+
+    # Performance Optimization: Each iteration gathers only the points still iterating, builds
+    # their (size x size) Newton systems as one stacked array and solves them with a single
+    # batched `np.linalg.solve`; converged points drop out, so the work shrinks as the grid
+    # converges instead of every point paying for the slowest one.
+    for _ in range(max_iter):
+        if not len(todo):
+            break
+        T = np.exp(ln_t[todo])
+        cp_all, h_all, s_all = (v.T for v in _nasa7(coefficients, t_mid, T))
+        lnj, lnn, lnp = ln_nj[todo], ln_n[todo], ln_p[todo]
+        nj = np.exp(lnj)
+        n = np.exp(lnn)
+        n_sum = nj.sum(axis=1)
+        mu = h_all - s_all + lnj - lnn[:, None] + lnp[:, None]
+
+        an = a * nj[:, None, :]
+        an_sum = an.sum(axis=2)
+        matrix = np.zeros((len(todo), size, size))
+        rhs = np.zeros((len(todo), size))
+        matrix[:, :n_el, :n_el] = an @ a.T
+        matrix[:, :n_el, n_el] = an_sum
+        matrix[:, n_el, :n_el] = an_sum
+        matrix[:, n_el, n_el] = n_sum - n
+        rhs[:, :n_el] = b0[todo] - an_sum + (an @ mu[:, :, None])[:, :, 0]
+        rhs[:, n_el] = n - n_sum + np.einsum('ms,ms->m', nj, mu)
+        if not fixed_t:
+            anh = (an @ h_all[:, :, None])[:, :, 0]
+            nh = np.einsum('ms,ms->m', nj, h_all)
+            matrix[:, :n_el, n_el + 1] = anh
+            matrix[:, n_el + 1, :n_el] = anh
+            matrix[:, n_el, n_el + 1] = nh
+            matrix[:, n_el + 1, n_el] = nh
+            matrix[:, n_el + 1, n_el + 1] = np.einsum('ms,ms->m', nj, cp_all + h_all * h_all)
+            rhs[:, n_el + 1] = (fixed[todo] / (R_UNIVERSAL * T) - nh
+                                + np.einsum('ms,ms->m', nj, h_all * mu))
+
+        failed = np.zeros(len(todo), dtype=bool)
+        try:
+            x = np.linalg.solve(matrix, rhs[:, :, None])[:, :, 0]
+        except np.linalg.LinAlgError:
+            # A singular system (e.g. a mixture too fuel-rich for gas-phase products alone) only
+            # fails its own point: solve one by one and leave those points unconverged
+            x = np.zeros_like(rhs)
+            for k in range(len(todo)):
+                try:
+                    x[k] = np.linalg.solve(matrix[k], rhs[k])
+                except np.linalg.LinAlgError:
+                    failed[k] = True
+        d_ln_n = x[:, n_el]
+        d_ln_t = np.zeros(len(todo)) if fixed_t else x[:, n_el + 1]
+        d_ln_nj = -mu + x[:, :n_el] @ a + d_ln_n[:, None]
+        if not fixed_t:
+            d_ln_nj += h_all * d_ln_t[:, None]
+
+        # Step-size control factors from NASA RP-1311 (eqs. 3.1-3.3), per point
+        relative = lnj - lnn[:, None]
+        major = relative > -18.420681
+        limit = np.maximum(5.0 * np.maximum(np.abs(d_ln_t), np.abs(d_ln_n)),
+                           np.max(np.where(major & (d_ln_nj > 0.0), d_ln_nj, 0.0), axis=1))
+        lam = np.where(limit <= 2.0, 1.0, 2.0 / np.maximum(limit, 2.0))
+        d_trace = d_ln_nj - d_ln_n[:, None]
+        trace = ~major & (d_ln_nj >= 0.0) & (d_trace > 0.0)
+        if trace.any():
+            with np.errstate(divide='ignore', invalid='ignore'):
+                lam2 = np.abs((-relative - 9.2103404) / d_trace)
+            lam = np.minimum(lam, np.min(np.where(trace, lam2, np.inf), axis=1))
+        lam[failed] = 0.0
+
+        ln_nj[todo] = np.maximum(lnj + lam[:, None] * d_ln_nj, -80.0)
+        ln_n[todo] = lnn + lam * d_ln_n
+        ln_t[todo] += lam * d_ln_t
+
+        done = (
+            (np.einsum('ms,ms->m', nj, np.abs(d_ln_nj)) <= 0.5e-5 * n_sum)
+            & (np.abs(n * d_ln_n) <= 0.5e-5 * n_sum)
+            & (np.abs(d_ln_t) <= 1e-4)
+        ) & ~failed
+        singular[todo[failed]] = True
+        todo = todo[~(done | failed)]
+
+    converged = ~singular
+    converged[todo] = False
+    T = np.exp(ln_t)
+    nj = np.exp(ln_nj)
+    # Derivatives of the converged points only; the rest stay NaN
+    cp_all, h_all, _ = (v.T for v in _nasa7(coefficients, t_mid, T[converged]))
+    properties = _equilibrium_derivatives(a, nj[converged], h_all, cp_all)
+    result = {}
+    for name, value in properties.items():
+        result[name] = np.full(m, np.nan)
+        result[name][converged] = value
+    result['T'] = T
+    result['n'] = np.zeros((m, len(_SPECIES)))
+    result['n'][:, species] = nj
+    for name, value in result.items():
+        value[~converged] = np.nan
+        result[name] = value.reshape(shape + value.shape[1:])
+    result['converged'] = converged.reshape(shape)
+    return result
+
+def _characteristic_velocity(T, mw, gamma):
+    r_spec = R_UNIVERSAL * 1000.0 / mw
+    return np.sqrt(r_spec * T / gamma) * (0.5 * (gamma + 1.0)) ** ((gamma + 1.0) / (2.0 * (gamma - 1.0)))
+
+def adiabatic_flame_temperature(propellants, of, pc):
+    """
+    Equilibrium adiabatic flame temperature and chamber properties over an (O/F, pc) grid.
+
+    Solves the enthalpy balance (products at the reactant enthalpy) with Gibbs minimization at
+    every point, all points in one vectorized Newton iteration.
+
+    Args:
+        propellants (list): Oxidizer/fuel pair in either order (e.g. ['LOX', 'RP-1'])
+        of (array_like): Oxidizer-to-fuel mass ratios
+        pc (array_like): Chamber pressures (Pa), broadcasting against `of` (e.g. a column
+            of O/F values against a row of pressures gives the full grid)
+
+    Returns:
+        dict: Arrays of the broadcast shape: chamber temperature 'tc' (K), molecular weight
+        'mw' (g/mol), equilibrium isentropic exponent 'gamma', characteristic velocity 'cstar'
+        (m/s) and 'converged'.
+    """
+    oxidizer, fuel = _split_pair(propellants)
+    b0, h0 = reactant_mixture(oxidizer, fuel, of)
+    eq = solve_equilibrium_batch(b0, pc, h0=h0)
+    return {
+        'tc': eq['T'],
+        'mw': eq['mw'],
+        'gamma': eq['gamma'],
+        'cstar': _characteristic_velocity(eq['T'], eq['mw'], eq['gamma']),
+        'converged': eq['converged'],
+    }
+
+def chamber_performance(oxidizer, fuel, of, pc):
+    """
+    Equilibrium combustion chamber properties for one design point.
+
+    Returns:
+        dict: Chamber temperature 'tc' (K), molecular weight 'mw' (g/mol), equilibrium
+        isentropic exponent 'gamma' and characteristic velocity 'cstar' (m/s).
+    """
+    b0, h0 = reactant_mixture(oxidizer, fuel, of)
+    eq = solve_equilibrium(b0, pc, h0=h0)
+    cstar = float(_characteristic_velocity(eq['T'], eq['mw'], eq['gamma']))
+    return {'tc': eq['T'], 'mw': eq['mw'], 'gamma': eq['gamma'], 'cstar': cstar}
+
+def vacuum_isp(tc, mw, gamma, cstar, area_ratio):
+    """
+    Vacuum specific impulse (s) of an ideal nozzle with constant `gamma` expansion.
+
+    Broadcasts over array arguments.
+    """
+    gamma = np.asarray(gamma, dtype=float)
+    mach = mach_from_area_ratio(area_ratio, gamma)
+    t_ratio = 1.0 / (1.0 + 0.5 * (gamma - 1.0) * mach * mach)
+    p_ratio = t_ratio ** (gamma / (gamma - 1.0))
+    r_spec = R_UNIVERSAL * 1000.0 / np.asarray(mw, dtype=float)
+    ve = mach * np.sqrt(gamma * r_spec * tc * t_ratio)
+    # Pressure thrust per unit mass flow: pe * Ae / mdot = (pe / pc) * eps * c*
+    return (ve + p_ratio * area_ratio * cstar) / G0
+
+def _table_name(oxidizer, fuel):
+    return f"{oxidizer}_{fuel}"
+
+def _canonical_name(name):
+    prop = get_propellant(name)
+    for key, value in PROPELLANTS.items():
+        if value is prop:
+            return key
+    raise ValueError(f"Unknown propellant: {name}")
+
+def _split_pair(propellants):
+    """Orders a propellant pair as (oxidizer, fuel) using canonical `PROPELLANTS` keys."""
+    names = [_canonical_name(name) for name in propellants]
+    oxidizers = [name for name in names if set(parse_formula(PROPELLANTS[name]['formula'])) == {'O'}]
+    if len(names) != 2 or len(oxidizers) != 1:
+        raise ValueError(f"Expected one oxidizer and one fuel, got {propellants}")
+    fuel = names[1] if names[0] == oxidizers[0] else names[0]
+    return oxidizers[0], fuel
+
+def build_tables(directory=TABLE_DIR):
+    """
+    Runs the equilibrium solver over the (O/F, pc, area ratio) grid for every oxidizer/fuel
+    pair in `PROPELLANTS` and writes the lookup tables to `directory`.
+
+    Each pair produces `<pair>_axes.npz` (grid axes), `<pair>_chamber.npy` of shape
+    (n_of, n_pc, len(CHAMBER_FIELDS)) and `<pair>_isp.npy` of shape (n_of, n_pc, n_area_ratio).
+    """
+    os.makedirs(directory, exist_ok=True)
+    for fuel, (of_min, of_max) in _OF_SPANS.items():
+        oxidizer = 'LOX'
+        of_axis = np.linspace(of_min, of_max, _TABLE_OF_POINTS)
+        chamber = np.empty((len(of_axis), len(_TABLE_PC), len(CHAMBER_FIELDS)))
+        for i, of in enumerate(of_axis):
+            for j, pc in enumerate(_TABLE_PC):
+                result = chamber_performance(oxidizer, fuel, of, pc)
+                chamber[i, j] = [result[field] for field in CHAMBER_FIELDS]
+        tc, mw, gamma, cstar = (chamber[..., k, None] for k in range(len(CHAMBER_FIELDS)))
+        isp = vacuum_isp(tc, mw, gamma, cstar, _TABLE_AREA_RATIO)
+
+        prefix = os.path.join(directory, _table_name(oxidizer, fuel))
+        np.savez(prefix + '_axes.npz', of=of_axis, pc=_TABLE_PC, area_ratio=_TABLE_AREA_RATIO)
+        np.save(prefix + '_chamber.npy', chamber)
+        np.save(prefix + '_isp.npy', isp)
+
+def _interp_weights(axis, values):
+    """Returns lower indices and fractional weights for linear interpolation (clamped to the axis)."""
+    idx = np.clip(np.searchsorted(axis, values, side='right') - 1, 0, len(axis) - 2)
+    lo = axis[idx]
+    frac = np.clip((values - lo) / (axis[idx + 1] - lo), 0.0, 1.0)
+    return idx, frac
+
+class EquilibriumTable:
+    """
+    Memory-mapped equilibrium performance table for one propellant pair.
+
+    Queries interpolate linearly in O/F and logarithmically in chamber pressure and area
+    ratio; inputs outside the tabulated grid are clamped to its edges.
+    """
+    def __init__(self, oxidizer, fuel, directory=TABLE_DIR):
+        prefix = os.path.join(directory, _table_name(oxidizer, fuel))
+        with np.load(prefix + '_axes.npz') as axes:
+            self.of = axes['of']
+            self.pc = axes['pc']
+            self.area_ratio = axes['area_ratio']
+        self._log_pc = np.log(self.pc)
+        self._log_area_ratio = np.log(self.area_ratio)
+        # Performance Optimization: Memory-mapping the tables means a worker only pages in the
+        # cells it actually interpolates, instead of reading every table at import time.
+        self._chamber = np.load(prefix + '_chamber.npy', mmap_mode='r')
+        self._isp = np.load(prefix + '_isp.npy', mmap_mode='r')
+        self.oxidizer = oxidizer
+        self.fuel = fuel
+
+    def chamber(self, of, pc):
+        """
+        Interpolates chamber properties.
+
+        Returns:
+            dict: Arrays of 'tc', 'mw', 'gamma' and 'cstar' broadcast over `of` and `pc`.
+        """
+        of, pc = np.broadcast_arrays(np.asarray(of, dtype=float), np.asarray(pc, dtype=float))
+        i, fi = _interp_weights(self.of, of)
+        j, fj = _interp_weights(self._log_pc, np.log(pc))
+        fi = fi[..., None]
+        fj = fj[..., None]
+        t = self._chamber
+        values = (
+            (t[i, j] * (1.0 - fj) + t[i, j + 1] * fj) * (1.0 - fi)
+            + (t[i + 1, j] * (1.0 - fj) + t[i + 1, j + 1] * fj) * fi
+        )
+        return {field: values[..., k] for k, field in enumerate(CHAMBER_FIELDS)}
+
+    def isp(self, of, pc, area_ratio):
+        """Interpolates vacuum specific impulse (s), broadcasting over all arguments."""
+        of, pc, area_ratio = np.broadcast_arrays(
+            np.asarray(of, dtype=float), np.asarray(pc, dtype=float), np.asarray(area_ratio, dtype=float)
+        )
+        i, fi = _interp_weights(self.of, of)
+        j, fj = _interp_weights(self._log_pc, np.log(pc))
+        k, fk = _interp_weights(self._log_area_ratio, np.log(area_ratio))
+        t = self._isp
+        result = np.zeros(of.shape)
+        for di, wi in ((0, 1.0 - fi), (1, fi)):
+            for dj, wj in ((0, 1.0 - fj), (1, fj)):
+                for dk, wk in ((0, 1.0 - fk), (1, fk)):
+                    result += t[i + di, j + dj, k + dk] * (wi * wj * wk)
+        return result
+
+@lru_cache(maxsize=None)
+def _load_table(oxidizer, fuel):
+    return EquilibriumTable(oxidizer, fuel)
+
+def load_table(propellants):
+    """Returns the (lazily opened, cached) `EquilibriumTable` for a propellant pair such as ['LOX', 'RP-1']."""
+    return _load_table(*_split_pair(propellants))
+
+if __name__ == '__main__':
+    build_tables()
@@ -0,0 +1,212 @@
+import math
+
+import numpy as np
+
+# Binary STL: 80-byte header, uint32 facet count, then one 50-byte record per facet
+STL_HEADER = b'Oberth nozzle surface of revolution'.ljust(80, b' ')
+STL_FACET = np.dtype([('normal', '<f4', (3,)), ('vertices', '<f4', (3, 3)), ('attribute', '<u2')])
+# Contour intervals per chunk in the streaming writers (x2 x segments facets each)
+_DEFAULT_CHUNK_ROWS = 64
+# Facets filled per block of the memory-mapped STL writer
+_MMAP_BLOCK = 2**18
+
+def _rings(contour, segments):
+    # Vertices of the revolved contour: ring i (contour point i) holds `segments` vertices at
+    # azimuth 2 pi j / segments, shape (rows, segments, 3)
+    contour = np.asarray(contour, dtype=float)
+    angle = np.arange(segments) * (2.0 * math.pi / segments)
+    rings = np.empty((len(contour), segments, 3))
+    rings[:, :, 0] = contour[:, :1]
+    rings[:, :, 1] = contour[:, 1:] * np.cos(angle)
+    rings[:, :, 2] = contour[:, 1:] * np.sin(angle)
+    return rings
+
+def facet_count(contour, segments=64, caps=True):
+    """Number of triangles `revolve` produces for a contour."""
+    rows = len(contour)
+    return 2 * segments * (rows - 1) + (2 * segments if caps else 0)
+
+def _wall_faces(first, last, segments):
+    # Vertex indices of the wall triangles between rings first..last (ring-major numbering),
+    # wound so normals point away from the axis
+    ring = np.arange(first, last)[:, None] * segments
+    j = np.arange(segments)
+    a = ring + j
+    b = ring + (j + 1) % segments
+    c = a + segments
+    d = b + segments
+    faces = np.empty((last - first, segments, 2, 3), dtype=np.int64)
+    faces[:, :, 0] = np.stack([a, b, d], axis=-1)
+    faces[:, :, 1] = np.stack([a, d, c], axis=-1)
+    return faces.reshape(-1, 3)
+
+def _cap_faces(ring, center, segments, inlet):
+    # Triangle fan closing a ring to its center vertex; normals point out of the volume
+    # (upstream at the inlet, downstream at the exit)
+    j = np.arange(segments)
+    a = ring * segments + j
+    b = ring * segments + (j + 1) % segments
+    centers = np.full(segments, center)
+    return np.stack([centers, b, a] if inlet else [centers, a, b], axis=-1)
+
+def revolve(contour, segments=64, caps=True):
+    """
+    Triangulated surface of revolution of a nozzle contour about the x axis.
+
+    Args:
+        contour (array_like): (N, 2) wall points [x, r] with r > 0, e.g. `contour_array`
+        segments (int): Azimuthal divisions of each ring
+        caps (bool): Close the inlet and exit planes with triangle fans, making the surface a
+            watertight volume (every edge shared by exactly two triangles)
+
+    Returns:
+        tuple: (vertices (V, 3) float64, faces (F, 3) int64) with outward-facing winding;
+        vertices are shared, ring by ring, followed by the two cap centers.
+    """
+    contour = np.asarray(contour, dtype=float)
+    if segments < 3:
+        raise ValueError("segments must be at least 3")
+    if len(contour) < 2:
+        raise ValueError("contour needs at least 2 points")
+    rows = len(contour)
+    vertices = _rings(contour, segments).reshape(-1, 3)
+    faces = [_wall_faces(0, rows - 1, segments)]
+    if caps:
+        centers = np.zeros((2, 3))
+        centers[:, 0] = contour[[0, -1], 0]
+        vertices = np.concatenate([vertices, centers])
+        faces.append(_cap_faces(0, rows * segments, segments, inlet=True))
+        faces.append(_cap_faces(rows - 1, rows * segments + 1, segments, inlet=False))
+    return vertices, np.concatenate(faces)
+
+def _stl_records(vertices, faces, out=None):
+    # Facet records of a block of triangles, written into `out` when given
+    records = np.zeros(len(faces), dtype=STL_FACET) if out is None else out
+    corners = vertices[faces]
+    normal = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    length = np.linalg.norm(normal, axis=1, keepdims=True)
+    records['normal'] = normal / np.where(length > 0.0, length, 1.0)
+    records['vertices'] = corners
+    records['attribute'] = 0
+    return records
+
+def _stl_blocks(contour, segments, caps, chunk_rows):
+    # Facet record arrays of consecutive contour chunks; cap fans go with the first and last
+    contour = np.asarray(contour, dtype=float)
+    rows = len(contour)
+    for start in range(0, rows - 1, chunk_rows):
+        stop = min(start + chunk_rows, rows - 1)
+        # Local rings start..stop, numbered from 0
+        vertices = _rings(contour[start:stop + 1], segments).reshape(-1, 3)
+        faces = [_wall_faces(0, stop - start, segments)]
+        if caps and (start == 0 or stop == rows - 1):
+            center = len(vertices)
+            extra = []
+            if start == 0:
+                extra.append((contour[0, 0], _cap_faces(0, center + len(extra), segments, inlet=True)))
+            if stop == rows - 1:
+                extra.append((contour[-1, 0], _cap_faces(stop - start, center + len(extra), segments,
+                                                         inlet=False)))
+            centers = np.zeros((len(extra), 3))
+            centers[:, 0] = [x for x, _ in extra]
+            vertices = np.concatenate([vertices, centers])
+            faces.extend(cap for _, cap in extra)
+        yield _stl_records(vertices, np.concatenate(faces))
+
+def iter_stl(contour, segments=64, caps=True, chunk_rows=_DEFAULT_CHUNK_ROWS):
+    """
+    Binary STL of the revolved contour as a stream of byte chunks (header first).
+
+    Memory use is bounded by one chunk of `chunk_rows` contour intervals, whatever the total
+    facet count, so it suits low-memory workers and streaming HTTP responses.
+    """
+    yield STL_HEADER + np.uint32(facet_count(contour, segments, caps)).tobytes()
+    for records in _stl_blocks(contour, segments, caps, chunk_rows):
+        # Performance Optimization: Each chunk goes out as the raw buffer of its record array,
+        # with no per-triangle packing.
+        yield memoryview(records).cast('B')
+
+def write_stl(path, contour, segments=64, caps=True, chunk_rows=None):
+    """
+    Writes the revolved contour as a binary STL file.
+
+    Args:
+        path (str): Output file (replaced if it exists)
+        contour (array_like): (N, 2) wall points [x, r]
+        segments (int): Azimuthal divisions
+        caps (bool): Close the inlet and exit planes (watertight surface)
+        chunk_rows (int, optional): Build and write facets `chunk_rows` contour intervals at a
+            time (bounded memory). By default all facets are built at once.
+
+    Returns:
+        int: Number of facets written.
+    """
+    count = facet_count(contour, segments, caps)
+    if chunk_rows is not None:
+        with open(path, 'wb') as f:
+            for chunk in iter_stl(contour, segments, caps, chunk_rows):
+                f.write(chunk)
+        return count
+    vertices, faces = revolve(contour, segments, caps)
+    with open(path, 'wb') as f:
+        f.write(STL_HEADER + np.uint32(count).tobytes())
+        f.truncate(84 + count * STL_FACET.itemsize)
+    # Performance Optimization: Facet records are written block by block into a memory-mapped
+    # view of the file, so neither a full record array nor a bytes copy of it is ever built.
+    records = np.memmap(path, dtype=STL_FACET, mode='r+', offset=84, shape=(count,))
+    for start in range(0, count, _MMAP_BLOCK):
+        _stl_records(vertices, faces[start:start + _MMAP_BLOCK], out=records[start:start + _MMAP_BLOCK])
+    records.flush()
+    del records
+    return count
+
+def _format_rows(prefix, values, fmt):
+    # One text line per row, formatted with a single %-operation over the whole block
+    line = prefix + ' '.join([fmt] * values.shape[1]) + '\n'
+    return (line * len(values)) % tuple(values.ravel().tolist())
+
+def iter_obj(contour, segments=64, caps=True, chunk_rows=_DEFAULT_CHUNK_ROWS):
+    """
+    Wavefront OBJ of the revolved contour (shared vertices, 1-based faces) as a stream of
+    text chunks, `chunk_rows` contour rows at a time.
+    """
+    contour = np.asarray(contour, dtype=float)
+    rows = len(contour)
+    yield f'# Oberth nozzle surface of revolution: {rows} rings x {segments} segments\n'
+    for start in range(0, rows, chunk_rows):
+        stop = min(start + chunk_rows, rows)
+        yield _format_rows('v ', _rings(contour[start:stop], segments).reshape(-1, 3), '%.9g')
+    if caps:
+        centers = np.zeros((2, 3))
+        centers[:, 0] = contour[[0, -1], 0]
+        yield _format_rows('v ', centers, '%.9g')
+        yield _format_rows('f ', _cap_faces(0, rows * segments, segments, inlet=True) + 1, '%d')
+    for start in range(0, rows - 1, chunk_rows):
+        stop = min(start + chunk_rows, rows - 1)
+        yield _format_rows('f ', _wall_faces(start, stop, segments) + 1, '%d')
+    if caps:
+        yield _format_rows('f ', _cap_faces(rows - 1, rows * segments + 1, segments, inlet=False) + 1, '%d')
+
+def write_obj(path, contour, segments=64, caps=True, chunk_rows=_DEFAULT_CHUNK_ROWS):
+    """
+    Writes the revolved contour as a Wavefront OBJ file (see `iter_obj`).
+
+    Returns:
+        int: Number of faces written.
+    """
+    with open(path, 'w') as f:
+        for chunk in iter_obj(contour, segments, caps, chunk_rows):
+            f.write(chunk)
+    return facet_count(contour, segments, caps)
+
+def read_stl(path):
+    """
+    Reads a binary STL file written by `write_stl`.
+
+    Returns:
+        ndarray: `STL_FACET` records.
+    """
+    with open(path, 'rb') as f:
+        f.seek(80)
+        count = int(np.frombuffer(f.read(4), '<u4')[0])
+        return np.fromfile(f, dtype=STL_FACET, count=count)
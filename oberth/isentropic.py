@@ -0,0 +1,201 @@
+import math
+from functools import lru_cache
+
+import numpy as np
+
+# Halley iterations of the inverse area-Mach relation, and their relative step tolerance
+_MAX_ITERATIONS = 30
+_TOLERANCE = 1e-13
+
+def _scalar_or_array(result):
+    # Like a NumPy ufunc: 0-d results come back as NumPy scalars, everything else as arrays
+    return result[()] if result.ndim == 0 else result
+
+def temperature_ratio(mach, gamma):
+    """
+    Static-to-stagnation temperature ratio T/T0 of isentropic flow.
+
+    Args:
+        mach (float or array_like): Mach number.
+        gamma (float or array_like): Specific heat ratio, broadcast against `mach`.
+
+    Returns:
+        float or ndarray: T/T0.
+    """
+    mach = np.asarray(mach, dtype=float)
+    gamma = np.asarray(gamma, dtype=float)
+    return _scalar_or_array(2.0 / (2.0 + (gamma - 1.0) * mach * mach))
+
+def pressure_ratio(mach, gamma):
+    """
+    Static-to-stagnation pressure ratio p/p0 of isentropic flow.
+
+    Args:
+        mach (float or array_like): Mach number.
+        gamma (float or array_like): Specific heat ratio, broadcast against `mach`.
+
+    Returns:
+        float or ndarray: p/p0.
+    """
+    gamma = np.asarray(gamma, dtype=float)
+    return _scalar_or_array(np.power(temperature_ratio(mach, gamma), gamma / (gamma - 1.0)))
+
+def density_ratio(mach, gamma):
+    """
+    Static-to-stagnation density ratio rho/rho0 of isentropic flow.
+
+    Args:
+        mach (float or array_like): Mach number.
+        gamma (float or array_like): Specific heat ratio, broadcast against `mach`.
+
+    Returns:
+        float or ndarray: rho/rho0.
+    """
+    gamma = np.asarray(gamma, dtype=float)
+    return _scalar_or_array(np.power(temperature_ratio(mach, gamma), 1.0 / (gamma - 1.0)))
+
+def area_ratio(mach, gamma):
+    """
+    Area ratio A/A* of isentropic flow, infinite at Mach 0.
+
+    Args:
+        mach (float or array_like): Mach number.
+        gamma (float or array_like): Specific heat ratio, broadcast against `mach`.
+
+    Returns:
+        float or ndarray: A/A*.
+    """
+    mach = np.asarray(mach, dtype=float)
+    gamma = np.asarray(gamma, dtype=float)
+    # Performance Optimization: Same refactored form as the scalar relation,
+    # ((2 + (g-1) M^2) / (g+1))^((g+1) / (2(g-1))) / M, evaluated as whole-array operations;
+    # the M = 0 case falls out of the IEEE division instead of a Python branch.
+    g_minus_1 = gamma - 1.0
+    g_plus_1 = gamma + 1.0
+    term = (2.0 + g_minus_1 * mach * mach) / g_plus_1
+    with np.errstate(divide='ignore'):
+        return _scalar_or_array(np.power(term, g_plus_1 / (2.0 * g_minus_1)) / mach)
+
+def prandtl_meyer(mach, gamma):
+    """
+    Prandtl-Meyer angle nu (radians) of supersonic flow.
+
+    Args:
+        mach (float or array_like): Mach number (>= 1).
+        gamma (float or array_like): Specific heat ratio, broadcast against `mach`.
+
+    Returns:
+        float or ndarray: nu in radians.
+    """
+    mach = np.asarray(mach, dtype=float)
+    beta = np.sqrt(mach * mach - 1.0)
+    return _scalar_or_array(_prandtl_meyer_beta(beta, np.asarray(gamma, dtype=float)))
+
+def _prandtl_meyer_beta(beta, gamma):
+    # nu in terms of beta = sqrt(M^2 - 1), which keeps the inverse well-conditioned near M = 1
+    sk = np.sqrt((gamma + 1.0) / (gamma - 1.0))
+    return sk * np.arctan(beta / sk) - np.arctan(beta)
+
+@lru_cache(maxsize=32)
+def _prandtl_meyer_table(gamma):
+    # Monotonic (nu, beta) samples used to seed the inverse Prandtl-Meyer Newton iteration
+    beta = np.geomspace(1e-4, 1e3, 8192)
+    return _prandtl_meyer_beta(beta, gamma), beta
+
+def _inverse_prandtl_meyer_beta(nu, gamma):
+    """
+    Returns beta = sqrt(M^2 - 1) for Prandtl-Meyer angles `nu` (array) at a scalar `gamma`.
+    """
+    # Performance Optimization: Seeding Newton's method from a dense cached interpolation table
+    # (`np.interp`) means a single polishing step reaches ~1e-12, instead of iterating from a
+    # generic starting guess with a convergence check on every pass.
+    nu_grid, beta_grid = _prandtl_meyer_table(gamma)
+    beta = np.interp(nu, nu_grid, beta_grid)
+    k = (gamma + 1.0) / (gamma - 1.0)
+    sk = math.sqrt(k)
+    coef = 1.0 - 1.0 / k
+    b2 = beta * beta
+    f = sk * np.arctan(beta / sk) - np.arctan(beta) - nu
+    df = b2 * coef / ((1.0 + b2 / k) * (1.0 + b2))
+    return np.maximum(beta - f / df, 0.5 * beta)
+
+def mach_from_prandtl_meyer(nu, gamma):
+    """
+    Supersonic Mach number for a Prandtl-Meyer angle (inverse of `prandtl_meyer`).
+
+    Args:
+        nu (float or array_like): Prandtl-Meyer angle in radians.
+        gamma (float or array_like): Specific heat ratio, broadcast against `nu`.
+
+    Returns:
+        float or ndarray: Mach number.
+    """
+    nu, gamma = np.broadcast_arrays(np.asarray(nu, dtype=float), np.asarray(gamma, dtype=float))
+    beta = np.empty(nu.shape)
+    # The seed table is per gamma, so solve once per distinct gamma (usually just one)
+    for value in np.unique(gamma):
+        mask = gamma == value
+        beta[mask] = _inverse_prandtl_meyer_beta(nu[mask], float(value))
+    return _scalar_or_array(np.sqrt(1.0 + beta * beta))
+
+def mach_from_area_ratio(area_ratio, gamma, supersonic=True):
+    """
+    Mach number for an isentropic area ratio A/A* (inverse of `area_ratio`).
+
+    Solves ln(A/A*) for every element at once with Halley's method, so the cost per element is
+    a few whole-array passes.
+
+    Args:
+        area_ratio (float or array_like): A/A* (>= 1; smaller values give NaN).
+        gamma (float or array_like): Specific heat ratio.
+        supersonic (bool or array_like): Branch of the solution, broadcast with the other
+            arguments. True returns M >= 1, False returns M <= 1.
+
+    Returns:
+        float or ndarray: Mach number.
+    """
+    area_ratio, gamma, supersonic = np.broadcast_arrays(
+        np.asarray(area_ratio, dtype=float),
+        np.asarray(gamma, dtype=float),
+        np.asarray(supersonic, dtype=bool),
+    )
+    g_minus_1 = gamma - 1.0
+    g_plus_1 = gamma + 1.0
+    exponent = g_plus_1 / (2.0 * g_minus_1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        log_area = np.log(area_ratio)
+
+        # Starting guesses: ln(A/A*) ~ 2 (M - 1)^2 / (g+1) near the throat, A/A* ~ c / M on the
+        # subsonic side and A/A* ~ (M^2 (g-1)/(g+1))^exponent / M on the supersonic side
+        near_sonic = np.sqrt(0.5 * g_plus_1 * log_area)
+        subsonic_guess = np.where(
+            area_ratio > 2.0,
+            (2.0 / g_plus_1) ** exponent / area_ratio,
+            np.maximum(1.0 - near_sonic, 0.25),
+        )
+        supersonic_guess = np.where(
+            area_ratio > 2.0,
+            np.sqrt(g_plus_1 / g_minus_1) * area_ratio ** (1.0 / (2.0 * exponent - 1.0)),
+            1.0 + near_sonic,
+        )
+        mach = np.where(supersonic, supersonic_guess, subsonic_guess)
+        lower = np.where(supersonic, 1.0, 0.0)
+        upper = np.where(supersonic, np.inf, 1.0)
+
+        for _ in range(_MAX_ITERATIONS):
+            m2 = mach * mach
+            term = (2.0 + g_minus_1 * m2) / g_plus_1
+            f = exponent * np.log(term) - np.log(mach) - log_area
+            # d/dM ln(A/A*) = 2 (M^2 - 1) / (M (2 + (g-1) M^2)), and its derivative
+            df = (m2 - 1.0) / (mach * term * 0.5 * g_plus_1)
+            d2f = 1.0 / term - 2.0 * g_minus_1 * m2 / (g_plus_1 * term * term) + 1.0 / m2
+            newton = f / df
+            step = newton / (1.0 - 0.5 * newton * d2f / df)
+            # At A/A* = 1 both f and df vanish on the sonic point
+            step = np.where(df == 0.0, 0.0, step)
+            # Halving toward the branch bound keeps every iterate on the requested branch
+            mach = np.clip(mach - step, 0.5 * (mach + lower), 0.5 * (mach + upper))
+            if not np.any(np.abs(step) > _TOLERANCE * mach):
+                break
+
+    return _scalar_or_array(np.where(area_ratio < 1.0, np.nan, mach))
@@ -0,0 +1,131 @@
+import bisect
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+
+# Phase timings of the request being served: a dict {phase: seconds} installed by `collect_phases`
+_phases = contextvars.ContextVar('oberth_phases', default=None)
+# Serializes updates to those dicts from the threads of one scope (e.g. concurrent batch jobs)
+_phases_lock = threading.Lock()
+
+@contextmanager
+def collect_phases():
+    """
+    Collects the `phase` timings recorded while the block runs (e.g. one HTTP request).
+
+    The dict is shared by reference, so phases recorded in threads that inherit the context
+    (such as a sync endpoint's worker thread, or pool tasks run in `contextvars.copy_context()`)
+    land in it too. Concurrent threads add up their time, so a phase can exceed the wall time.
+
+    Yields:
+        dict: Accumulated seconds per phase name.
+    """
+    phases = {}
+    token = _phases.set(phases)
+    try:
+        yield phases
+    finally:
+        _phases.reset(token)
+
+def current_phases():
+    """Returns the phase dict of the enclosing `collect_phases` scope, or None outside one."""
+    return _phases.get()
+
+@contextmanager
+def phase(name):
+    """
+    Adds the wall time of the block to phase `name` of the current `collect_phases` scope.
+
+    Outside of one it only costs two clock reads.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        phases = _phases.get()
+        if phases is not None:
+            elapsed = time.perf_counter() - start
+            with _phases_lock:
+                phases[name] = phases.get(name, 0.0) + elapsed
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _format_labels(names, values):
+    if not names:
+        return ''
+    pairs = (f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return '{' + ','.join(pairs) + '}'
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class Histogram:
+    """
+    Prometheus-style histogram with fixed upper bucket bounds and optional labels.
+
+    Each labelled series keeps non-cumulative bucket counts, a sum and a count; `observe` is a
+    binary search plus three additions under a lock.
+    """
+    def __init__(self, name, documentation, buckets, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(sorted(buckets))
+        self.labelnames = tuple(labelnames)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, *labels):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} histogram']
+        with self._lock:
+            series = sorted((labels, ([*counts], total, count))
+                            for labels, (counts, total, count) in self._series.items())
+        for labels, (counts, total, count) in series:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                label_text = _format_labels(self.labelnames + ('le',), labels + (_format_value(bound),))
+                lines.append(f'{self.name}_bucket{label_text} {cumulative}')
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f'{self.name}_sum{label_text} {_format_value(total)}')
+            lines.append(f'{self.name}_count{label_text} {count}')
+        return lines
+
+def render_samples(name, documentation, kind, samples, labelnames=()):
+    """
+    Renders a gauge or counter read at scrape time (e.g. cache statistics).
+
+    Args:
+        kind (str): 'gauge' or 'counter'.
+        samples (iterable): (label values tuple, value) pairs.
+
+    Returns:
+        list: Prometheus text-format lines.
+    """
+    lines = [f'# HELP {name} {documentation}', f'# TYPE {name} {kind}']
+    for labels, value in samples:
+        lines.append(f'{name}{_format_labels(labelnames, labels)} {_format_value(value)}')
+    return lines
+
+def render(*families):
+    """Joins rendered metric families into a Prometheus text exposition (version 0.0.4)."""
+    return '\n'.join(line for family in families for line in family) + '\n'
+
+def server_timing(phases):
+    """
+    Formats phase timings as an HTTP `Server-Timing` header value (durations in milliseconds).
+    """
+    return ', '.join(f'{name};dur={seconds * 1e3:.3f}' for name, seconds in phases.items())
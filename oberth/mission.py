@@ -1,4 +1,52 @@
 import math
+import os
+
+import numpy as np
+
+# Standard gravity (m/s^2)
+G0 = 9.80665
+
+# Safeguarded Newton iterations of the optimal-staging multiplier: iteration cap, tolerance and
+# bracket on its log-scaled form
+_STAGING_MAX_ITER = 60
+_STAGING_TOL = 1e-9
+_STAGING_BRACKET = 40.0
+
+# Sun gravitational parameter (m^3/s^2), astronomical unit (m) and seconds per day
+MU_SUN = 1.32712440018e20
+AU = 1.495978707e11
+DAY = 86400.0
+
+# Approximate heliocentric mean orbital elements (Standish, J2000 ecliptic, valid 1800-2050).
+# Rows are [a (AU), e, I, L, longitude of perihelion, longitude of node] (deg), with their
+# rates per Julian century in the second row.
+PLANET_ELEMENTS = {
+    'MERCURY': ((0.38709927, 0.20563593, 7.00497902, 252.25032350, 77.45779628, 48.33076593),
+                (0.00000037, 0.00001906, -0.00594749, 149472.67411175, 0.16047689, -0.12534081)),
+    'VENUS': ((0.72333566, 0.00677672, 3.39467605, 181.97909950, 131.60246718, 76.67984255),
+              (0.00000390, -0.00004107, -0.00078890, 58517.81538729, 0.00268329, -0.27769418)),
+    'EARTH': ((1.00000261, 0.01671123, -0.00001531, 100.46457166, 102.93768193, 0.0),
+              (0.00000562, -0.00004392, -0.01294668, 35999.37244981, 0.32327364, 0.0)),
+    'MARS': ((1.52371034, 0.09339410, 1.84969142, -4.55343205, -23.94362959, 49.55953891),
+             (0.00001847, 0.00007882, -0.00813131, 19140.30268499, 0.44441088, -0.29257343)),
+    'JUPITER': ((5.20288700, 0.04838624, 1.30439695, 34.39644051, 14.72847983, 100.47390909),
+                (-0.00011607, -0.00013253, -0.00183714, 3034.74612775, 0.21252668, 0.20469106)),
+    'SATURN': ((9.53667594, 0.05386179, 2.48599187, 49.95424423, 92.59887831, 113.66242448),
+               (-0.00125060, -0.00050991, 0.00193609, 1222.49362201, -0.41897216, -0.28867794)),
+}
+
+# Lambert solver: universal-variable iteration cap, tolerance on z and the hyperbolic end of
+# its bracket (the elliptic end is the single-revolution limit z = (2 pi)^2)
+_LAMBERT_MAX_ITER = 60
+_LAMBERT_TOL = 1e-8
+_LAMBERT_Z_MIN = -100.0 * math.pi ** 2
+_LAMBERT_Z_MAX = 4.0 * math.pi ** 2
+# Grids above this many cells are split across worker processes when `workers` is given
+_PORKCHOP_CHUNK = 250_000
+# Stride of the coarse date grid whose Lambert solutions start the full-resolution solve, and the
+# block size (cells) from which that warm start pays for the extra coarse solve
+_PORKCHOP_COARSE = 4
+_PORKCHOP_WARM_CELLS = 40_000
 
 class Stage:
     """
@@ -13,7 +61,7 @@ class Stage:
         self._isp = isp
         self.wet_mass = wet_mass
         self.dry_mass = dry_mass
-        self.g0 = 9.80665 # Standard gravity
+        self.g0 = G0 # Standard gravity
 
         # Performance Optimization: Precompute the effective exhaust velocity (ve)
         # to avoid recalculating `isp * g0` on every call to `delta_v`. This provides
@@ -37,6 +85,192 @@ class Stage:
             return 0.0
         return self._ve * math.log(self.wet_mass / self.dry_mass)
 
+class StageArray:
+    """
+    Struct-of-arrays collection of rocket stages.
+
+    `isp`, `wet_mass` and `dry_mass` are NumPy columns broadcast to a common shape, so any number of
+    stages (or stages of many candidate vehicles) is evaluated in single vectorized operations.
+    """
+    def __init__(self, isp, wet_mass, dry_mass):
+        """
+        isp: Specific Impulse (s), array_like
+        wet_mass: Initial mass (kg), array_like
+        dry_mass: Final mass (kg), array_like
+        """
+        self.isp, self.wet_mass, self.dry_mass = (
+            np.array(v, dtype=float) for v in np.broadcast_arrays(isp, wet_mass, dry_mass)
+        )
+
+    @classmethod
+    def from_stages(cls, stages):
+        """Packs a sequence of `Stage` objects into columns."""
+        return cls(
+            [stage.isp for stage in stages],
+            [stage.wet_mass for stage in stages],
+            [stage.dry_mass for stage in stages],
+        )
+
+    def __len__(self):
+        return len(self.isp)
+
+    @property
+    def shape(self):
+        return self.isp.shape
+
+    def delta_v(self):
+        """
+        Calculates the delta-v of every stage using the Tsiolkovsky rocket equation.
+
+        Returns:
+            ndarray: Delta-v (m/s), 0 where a mass is not positive.
+        """
+        valid = (self.dry_mass > 0) & (self.wet_mass > 0)
+        # Performance Optimization: `np.log(..., where=)` writes into a zero-filled output, so
+        # invalid stages cost no separate masking pass and never produce log warnings.
+        log_ratio = np.log(
+            np.divide(self.wet_mass, self.dry_mass, out=np.ones(self.shape), where=valid),
+            out=np.zeros(self.shape), where=valid,
+        )
+        return self.isp * G0 * log_ratio
+
+class Vehicle:
+    """
+    Multi-stage vehicles stored as a `StageArray` whose last axis runs over stages (first burn
+    first), so `(vehicles, stages)` columns describe a whole batch of candidate designs.
+    """
+    def __init__(self, stages):
+        self.stages = stages
+
+    @classmethod
+    def from_stage_masses(cls, isp, propellant_mass, structural_mass, payload=0.0):
+        """
+        Stacks stages from their individual propellant and structural masses.
+
+        Args:
+            isp (array_like): Specific impulse per stage (s), shape (..., stages)
+            propellant_mass (array_like): Propellant mass per stage (kg), shape (..., stages)
+            structural_mass (array_like): Structural mass per stage (kg), shape (..., stages)
+            payload (float or array_like): Payload above the top stage (kg), shape (...)
+
+        Returns:
+            Vehicle: Stages with wet/dry masses including everything stacked above them.
+        """
+        isp, propellant_mass, structural_mass = np.broadcast_arrays(
+            np.asarray(isp, dtype=float),
+            np.asarray(propellant_mass, dtype=float),
+            np.asarray(structural_mass, dtype=float),
+        )
+        stage_mass = propellant_mass + structural_mass
+        # Mass above each stage: payload plus all later stages (reverse cumulative sum)
+        above = np.cumsum(stage_mass[..., ::-1], axis=-1)[..., ::-1] - stage_mass
+        wet_mass = above + stage_mass + np.asarray(payload, dtype=float)[..., None]
+        return cls(StageArray(isp, wet_mass, wet_mass - propellant_mass))
+
+    @property
+    def gross_mass(self):
+        """Lift-off mass (kg) of each vehicle."""
+        return self.stages.wet_mass[..., 0]
+
+    def delta_v(self):
+        """Delta-v (m/s) of each stage, shape (..., stages)."""
+        return self.stages.delta_v()
+
+    def total_delta_v(self):
+        """Total ideal delta-v (m/s) of each vehicle."""
+        return self.stages.delta_v().sum(axis=-1)
+
+def optimal_staging(isp, structural_fraction, delta_v, payload):
+    """
+    Minimum lift-off mass staging for a delta-v target (Lagrange-multiplier mass allocation).
+
+    With exhaust velocity c_i and structural fraction e_i = m_s / (m_s + m_p), the optimum stage
+    mass ratios are n_i = max((c_i L - 1) / (c_i e_i L), 1), where the multiplier L satisfies
+    sum(c_i ln n_i) = delta_v. A stage whose unconstrained ratio would fall below 1 (a low
+    delta-v target) is left unused, with n_i = 1 and no mass, and the remaining stages share the
+    delta-v. L is found by a vectorized Newton iteration, so any batch of payload /
+    structural-fraction / delta-v combinations is solved at once.
+
+    Args:
+        isp (array_like): Specific impulse per stage (s), shape (..., stages)
+        structural_fraction (array_like): Structural fraction per stage, shape (..., stages)
+        delta_v (float or array_like): Required total delta-v (m/s), shape (...)
+        payload (float or array_like): Payload mass (kg), shape (...)
+
+    Returns:
+        dict: 'vehicle' (`Vehicle` of the optimum), 'mass_ratio', 'propellant_mass' and
+        'structural_mass' per stage, 'gross_mass' per design, and 'feasible' (the delta-v is
+        below the structural limit).
+    """
+    isp = np.asarray(isp, dtype=float)
+    structural_fraction = np.asarray(structural_fraction, dtype=float)
+    delta_v = np.asarray(delta_v, dtype=float)
+    payload = np.asarray(payload, dtype=float)
+    batch = np.broadcast_shapes(isp.shape[:-1], structural_fraction.shape[:-1], delta_v.shape, payload.shape)
+    stages = np.broadcast_shapes(isp.shape[-1:], structural_fraction.shape[-1:])
+    c = np.broadcast_to(isp * G0, batch + stages)
+    eps = np.broadcast_to(structural_fraction, batch + stages)
+    delta_v = np.broadcast_to(delta_v, batch)
+
+    # Stage i burns propellant (n_i > 1) only above L_i = 1 / (c_i (1 - e_i)). Below the smallest
+    # L_i every stage is unused, so f(L) = sum(c ln n) - delta_v increases from -delta_v at
+    # L_0 = min(L_i) toward sum(c ln(1 / e)); there is no root when delta_v exceeds that limit of
+    # zero-propellant-fraction stages.
+    reachable = delta_v < (c * np.log(1.0 / eps)).sum(axis=-1)
+    activation = 1.0 / (c * (1.0 - eps))
+    l0 = activation.min(axis=-1)
+    # Performance Optimization: Newton's method runs on u = ln(L / L_0 - 1), which is close to
+    # linear at both ends of the domain (near-minimum staging and near the structural limit), and
+    # keeps a per-element bisection bracket so no element can escape, including across the kinks
+    # where a stage becomes active. Every design converges in about ten whole-batch passes
+    # regardless of how hard its delta-v target is.
+    u = np.zeros(batch)
+    lo = np.full(batch, -_STAGING_BRACKET)
+    hi = np.full(batch, _STAGING_BRACKET)
+    for _ in range(_STAGING_MAX_ITER):
+        exp_u = np.exp(u)
+        multiplier = l0 * (1.0 + exp_u)
+        active = multiplier[..., None] > activation
+        cl = c * multiplier[..., None]
+        ratio = np.where(active, (cl - 1.0) / (cl * eps), 1.0)
+        f = (c * np.log(ratio)).sum(axis=-1) - delta_v
+        df = np.where(active, c / (multiplier[..., None] * (cl - 1.0)), 0.0).sum(axis=-1) * exp_u * l0
+        below = f < 0.0
+        lo = np.where(below, u, lo)
+        hi = np.where(below, hi, u)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            step = f / df
+        u_next = u - step
+        # A non-finite step (no active stage yet) fails the bracket test and bisects instead
+        u = np.where((u_next >= lo) & (u_next <= hi), u_next, 0.5 * (lo + hi))
+        if not np.any(~(np.abs(step) <= _STAGING_TOL) & reachable):
+            break
+
+    multiplier = l0 * (1.0 + np.exp(u))
+    cl = c * multiplier[..., None]
+    mass_ratio = np.where(multiplier[..., None] > activation, (cl - 1.0) / (cl * eps), 1.0)
+    feasible = reachable & np.all(mass_ratio * eps < 1.0, axis=-1)
+
+    # Each stage multiplies the mass it carries by n (1 - e) / (1 - n e); the top stage carries
+    # the payload. Infeasible designs are left as whatever (possibly non-finite) masses result.
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        step_ratio = mass_ratio * (1.0 - eps) / (1.0 - mass_ratio * eps)
+        initial_mass = payload[..., None] * np.cumprod(step_ratio[..., ::-1], axis=-1)[..., ::-1]
+        carried = np.concatenate([initial_mass[..., 1:], np.broadcast_to(payload, batch)[..., None]], axis=-1)
+        stage_mass = initial_mass - carried
+        structural_mass = eps * stage_mass
+        propellant_mass = stage_mass - structural_mass
+
+    vehicle = Vehicle(StageArray(c / G0, initial_mass, initial_mass - propellant_mass))
+    return {
+        'vehicle': vehicle,
+        'mass_ratio': mass_ratio,
+        'propellant_mass': propellant_mass,
+        'structural_mass': structural_mass,
+        'gross_mass': vehicle.gross_mass,
+        'feasible': feasible,
+    }
+
 def hohmann_transfer_dv(r1, r2, mu=3.986e14):
     """
     Calculates the delta-v required for a Hohmann transfer between two circular orbits.
@@ -74,3 +308,305 @@ def hohmann_transfer_dv(r1, r2, mu=3.986e14):
     # We also alias `math.sqrt` locally to avoid repeated global/module attribute lookups.
     sqrt = math.sqrt
     return abs(sqrt(2.0 * (mu_r1 - mu_a)) - sqrt(mu_r1) + sqrt(mu_r2) - sqrt(2.0 * (mu_r2 - mu_a)))
+
+def hohmann_transfer_dv_array(r1, r2, mu=3.986e14):
+    """
+    Array version of `hohmann_transfer_dv`: broadcasts `r1`, `r2` and `mu` against each other,
+    so e.g. `r1[:, None]` and `r2[None, :]` give a full transfer-cost grid in one pass.
+
+    Args:
+        r1 (array_like): Radius of initial orbit (m)
+        r2 (array_like): Radius of final orbit (m)
+        mu (float or array_like): Standard gravitational parameter (m^3/s^2). Default is Earth.
+
+    Returns:
+        ndarray: Total delta-v (m/s)
+    """
+    r1 = np.asarray(r1, dtype=float)
+    r2 = np.asarray(r2, dtype=float)
+    mu = np.asarray(mu, dtype=float)
+    # Same refactored expression as the scalar version; the four square roots are the only
+    # transcendental work per grid cell.
+    mu_r1 = mu / r1
+    mu_r2 = mu / r2
+    mu_a = mu / (r1 + r2)
+    return np.abs(
+        np.sqrt(2.0 * (mu_r1 - mu_a)) - np.sqrt(mu_r1) + np.sqrt(mu_r2) - np.sqrt(2.0 * (mu_r2 - mu_a))
+    )
+
+def planet_state(body, days):
+    """
+    Heliocentric position and velocity of a planet from its mean orbital elements.
+
+    Args:
+        body (str): Planet name (see `PLANET_ELEMENTS`)
+        days (array_like): Epochs in days since J2000 (2000-01-01 12:00 TT)
+
+    Returns:
+        tuple: Position (m) and velocity (m/s) arrays of shape (..., 3) in the J2000 ecliptic frame.
+    """
+    try:
+        elements, rates = PLANET_ELEMENTS[body.upper()]
+    except KeyError:
+        raise ValueError(f"Unknown planet: {body}") from None
+    days = np.asarray(days, dtype=float)
+    centuries = days / 36525.0
+    a, e, inc, mean_longitude, long_peri, long_node = (
+        base + rate * centuries for base, rate in zip(elements, rates)
+    )
+    a = a * AU
+    inc, long_peri, long_node = np.radians(inc), np.radians(long_peri), np.radians(long_node)
+    mean_anomaly = np.radians(mean_longitude) - long_peri
+    arg_peri = long_peri - long_node
+
+    # Kepler's equation by Newton iteration (planetary eccentricities are small)
+    ecc_anomaly = mean_anomaly + e * np.sin(mean_anomaly)
+    for _ in range(6):
+        ecc_anomaly = ecc_anomaly - (ecc_anomaly - e * np.sin(ecc_anomaly) - mean_anomaly) / (1.0 - e * np.cos(ecc_anomaly))
+
+    cos_e, sin_e = np.cos(ecc_anomaly), np.sin(ecc_anomaly)
+    root = np.sqrt(1.0 - e * e)
+    # Perifocal position and velocity
+    px, py = a * (cos_e - e), a * root * sin_e
+    rate = np.sqrt(MU_SUN / a) / (1.0 - e * cos_e)
+    vx, vy = -rate * sin_e, rate * root * cos_e
+
+    cw, sw = np.cos(arg_peri), np.sin(arg_peri)
+    cn, sn = np.cos(long_node), np.sin(long_node)
+    ci, si = np.cos(inc), np.sin(inc)
+    # Rows of the perifocal-to-ecliptic rotation R3(-node) R1(-inc) R3(-arg_peri)
+    axes = (
+        (cw * cn - sw * sn * ci, -sw * cn - cw * sn * ci),
+        (cw * sn + sw * cn * ci, -sw * sn + cw * cn * ci),
+        (sw * si, cw * si),
+    )
+    position = np.stack([p * px + q * py for p, q in axes], axis=-1)
+    velocity = np.stack([p * vx + q * vy for p, q in axes], axis=-1)
+    return position, velocity
+
+def _stumpff_elliptic(z):
+    # Stumpff functions for z >= 1e-2. Half-angle forms need a single cosine: with
+    # h = sqrt(z) / 2 in (0, pi], sin(h) >= 0, 1 - cos(2h) = 2 sin^2(h) and sin(2h) = 2 sin(h) cos(h)
+    root = np.sqrt(z)
+    cos_h = np.cos(0.5 * root)
+    sin2_h = (1.0 - cos_h) * (1.0 + cos_h)
+    return 2.0 * sin2_h / z, (root - 2.0 * np.sqrt(sin2_h) * cos_h) / (root * z)
+
+def _stumpff(z):
+    # Stumpff functions C(z) and S(z), with series near z = 0 to avoid cancellation
+    # Performance Optimization: Each branch is evaluated only on its own elements (boolean
+    # indexing) instead of computing trig, hyperbolic and series forms for every element and
+    # selecting with `np.where`; heliocentric grids are almost entirely elliptic, and when every
+    # element is, the half-angle forms run on the whole array without masks or scatters.
+    if z.size and z.min() >= 1e-2:
+        return _stumpff_elliptic(z)
+    c = np.empty_like(z)
+    s = np.empty_like(z)
+    small = np.abs(z) < 1e-2
+    ell = (z > 0.0) & ~small
+    hyp = (z < 0.0) & ~small
+    if ell.any():
+        c[ell], s[ell] = _stumpff_elliptic(z[ell])
+    if hyp.any():
+        zh = -z[hyp]
+        root = np.sqrt(zh)
+        c[hyp] = (np.cosh(root) - 1.0) / zh
+        s[hyp] = (np.sinh(root) - root) / (root * zh)
+    if small.any():
+        zs = z[small]
+        c[small] = 0.5 - zs / 24.0 + zs * zs / 720.0 - zs * zs * zs / 40320.0
+        s[small] = 1.0 / 6.0 - zs / 120.0 + zs * zs / 5040.0 - zs * zs * zs / 362880.0
+    return c, s
+
+def lambert(r1, r2, tof, mu=MU_SUN):
+    """
+    Solves Lambert's problem (prograde, single revolution) for arrays of boundary conditions.
+
+    Uses the universal-variable formulation with a per-element safeguarded Newton iteration, so a
+    whole transfer grid is solved in a few dozen whole-array passes.
+
+    Args:
+        r1 (array_like): Departure position vectors (m), shape (..., 3)
+        r2 (array_like): Arrival position vectors (m), shape (..., 3)
+        tof (array_like): Times of flight (s), shape (...)
+        mu (float): Gravitational parameter of the central body (m^3/s^2)
+
+    Returns:
+        tuple: Departure and arrival velocity vectors (m/s), shape (..., 3). Elements with no
+        solution (non-positive time of flight) are NaN.
+    """
+    v1, v2, _ = _lambert(r1, r2, tof, mu)
+    return v1, v2
+
+def _lambert(r1, r2, tof, mu, guess=None):
+    # `lambert`, also returning the universal variable z (NaN where there is no solution) and
+    # starting from `guess` (same shape as tof, NaN for no guess) where one is given
+    r1 = np.asarray(r1, dtype=float)
+    r2 = np.asarray(r2, dtype=float)
+    tof = np.asarray(tof, dtype=float)
+    r1n = np.sqrt(np.einsum('...i,...i->...', r1, r1))
+    r2n = np.sqrt(np.einsum('...i,...i->...', r2, r2))
+    cos_dtheta = np.einsum('...i,...i->...', r1, r2) / (r1n * r2n)
+    cross_z = r1[..., 0] * r2[..., 1] - r1[..., 1] * r2[..., 0]
+    # Prograde transfer: the sweep angle exceeds pi when the orbit normal points south
+    sin_dtheta = np.sqrt(np.maximum(1.0 - cos_dtheta * cos_dtheta, 0.0))
+    sin_dtheta = np.where(cross_z < 0.0, -sin_dtheta, sin_dtheta)
+    a_param = sin_dtheta * np.sqrt(r1n * r2n / (1.0 - cos_dtheta))
+    shape = np.broadcast_shapes(a_param.shape, tof.shape)
+    a_param = np.broadcast_to(a_param, shape)
+    r1n = np.broadcast_to(r1n, shape)
+    r2n = np.broadcast_to(r2n, shape)
+    tof = np.broadcast_to(tof, shape)
+
+    # Performance Optimization: The iteration runs on a compacted set of still-active elements
+    # (flat indices), so converged cells and impossible ones (non-positive time of flight) stop
+    # costing anything instead of riding along in every whole-grid pass.
+    z = np.zeros(shape)
+    z_flat = z.reshape(-1)
+    active = np.flatnonzero(tof > 0.0)
+    a_act = a_param.reshape(-1)[active]
+    rsum_act = (r1n + r2n).reshape(-1)[active]
+    target_act = math.sqrt(mu) * tof.reshape(-1)[active]
+    # Starting guess: z = (change of eccentric anomaly)^2 for an ellipse, which is close to the
+    # squared sweep angle for near-circular transfers
+    sweep = np.arctan2(np.broadcast_to(sin_dtheta, shape).reshape(-1)[active],
+                       np.broadcast_to(cos_dtheta, shape).reshape(-1)[active]) % (2.0 * math.pi)
+    z_act = np.minimum(sweep * sweep, 0.9 * _LAMBERT_Z_MAX)
+    if guess is not None:
+        start = np.broadcast_to(guess, shape).reshape(-1)[active]
+        z_act = np.where(np.isnan(start), z_act, np.clip(start, _LAMBERT_Z_MIN, _LAMBERT_Z_MAX))
+    # Time of flight increases monotonically with z, so every element keeps a bisection bracket
+    lo = np.full(len(active), _LAMBERT_Z_MIN)
+    hi = np.full(len(active), _LAMBERT_Z_MAX)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        for _ in range(_LAMBERT_MAX_ITER):
+            c, s = _stumpff(z_act)
+            sqrt_c = np.sqrt(c)
+            y = rsum_act + a_act * (z_act * s - 1.0) / sqrt_c
+            sqrt_y = np.sqrt(y)
+            chi = sqrt_y / sqrt_c
+            chi3 = chi * chi * chi
+            f = chi3 * s + a_act * sqrt_y - target_act
+            # Performance Optimization: The general derivative is evaluated for every element and
+            # the series form near z = 0 is patched in only where needed, instead of computing
+            # both forms everywhere and selecting with `np.where`.
+            s_c = s / c
+            df = chi3 * ((c - 1.5 * s_c) / (2.0 * z_act) + 0.75 * s * s_c) + a_act / 8.0 * (3.0 * s_c * sqrt_y + a_act / chi)
+            small = np.flatnonzero(np.abs(z_act) < 1e-2)
+            if len(small):
+                ys, sqrt_ys, a_s = y[small], sqrt_y[small], a_act[small]
+                df[small] = math.sqrt(2.0) / 40.0 * ys * sqrt_ys + a_s / 8.0 * (sqrt_ys + a_s * np.sqrt(0.5 / ys))
+            # y < 0 means z is too small for this geometry: treat as "too short"
+            short = (f < 0.0) | (y < 0.0)
+            np.copyto(lo, z_act, where=short)
+            np.copyto(hi, z_act, where=~short)
+            z_next = z_act - f / df
+            inside = (z_next >= lo) & (z_next <= hi) & (y > 0.0)
+            z_next = np.where(inside, z_next, 0.5 * (lo + hi))
+            pending = np.abs(z_next - z_act) > _LAMBERT_TOL * (1.0 + np.abs(z_act))
+            z_flat[active] = z_next
+            if not pending.any():
+                break
+            active = active[pending]
+            a_act, rsum_act, target_act = a_act[pending], rsum_act[pending], target_act[pending]
+            z_act, lo, hi = z_next[pending], lo[pending], hi[pending]
+
+        c, s = _stumpff(z)
+        y = r1n + r2n + a_param * (z * s - 1.0) / np.sqrt(c)
+        # Lagrange coefficients
+        f_coef = 1.0 - y / r1n
+        g_coef = a_param * np.sqrt(y / mu)
+        gdot_coef = 1.0 - y / r2n
+        invalid = ~(tof > 0.0) | ~(y > 0.0)
+        g_coef = np.where(invalid, np.nan, g_coef)[..., None]
+        v1 = (r2 - f_coef[..., None] * r1) / g_coef
+        v2 = (gdot_coef[..., None] * r2 - r1) / g_coef
+    return v1, v2, np.where(invalid, np.nan, z)
+
+def _coarse_axis(n):
+    # Indices of every `_PORKCHOP_COARSE`-th point of an axis of n points (always including the
+    # last), and the left coarse interval and linear weight of every full-resolution point
+    coarse = np.unique(np.r_[np.arange(0, n, _PORKCHOP_COARSE), n - 1])
+    full = np.arange(n)
+    interval = np.clip(np.searchsorted(coarse, full, side='right') - 1, 0, len(coarse) - 2)
+    weight = (full - coarse[interval]) / (coarse[interval + 1] - coarse[interval])
+    return coarse, interval, weight
+
+def _porkchop_block(r1, vp1, r2, vp2, tof, mu):
+    # One (departures, arrivals) block of the porkchop grid from the planet states
+    guess = None
+    if tof.size >= _PORKCHOP_WARM_CELLS and min(tof.shape) > 2 * _PORKCHOP_COARSE:
+        # Performance Optimization: z varies smoothly over the date grid, so a Lambert solve on
+        # every `_PORKCHOP_COARSE`-th row and column (~1/16 of the cells), bilinearly
+        # interpolated, starts the full grid within ~1e-3 of the root: most cells then converge
+        # in two Newton passes instead of the six or more needed from the sweep-angle guess.
+        # Cells next to impossible coarse cells (NaN) fall back to that guess.
+        rows, row_interval, row_weight = _coarse_axis(tof.shape[0])
+        cols, col_interval, col_weight = _coarse_axis(tof.shape[1])
+        _, _, z = _lambert(r1[rows][:, None, :], r2[cols][None, :, :], tof[np.ix_(rows, cols)], mu)
+        row_weight, col_weight = row_weight[:, None], col_weight[None, :]
+        upper = z[row_interval]
+        lower = z[row_interval + 1]
+        guess = ((1.0 - row_weight) * ((1.0 - col_weight) * upper[:, col_interval] + col_weight * upper[:, col_interval + 1])
+                 + row_weight * ((1.0 - col_weight) * lower[:, col_interval] + col_weight * lower[:, col_interval + 1]))
+    v1, v2, _ = _lambert(r1[:, None, :], r2[None, :, :], tof, mu, guess)
+    dv1 = v1 - vp1[:, None, :]
+    dv2 = v2 - vp2[None, :, :]
+    c3 = np.einsum('...i,...i->...', dv1, dv1)
+    v_inf = np.sqrt(np.einsum('...i,...i->...', dv2, dv2))
+    return c3, v_inf
+
+def porkchop(departure_body, arrival_body, departure_days, arrival_days, mu=MU_SUN, workers=None):
+    """
+    Computes a departure/arrival-date porkchop grid of Lambert transfers between two planets.
+
+    Args:
+        departure_body (str): Departure planet name (e.g. 'Earth')
+        arrival_body (str): Arrival planet name (e.g. 'Mars')
+        departure_days (array_like): Departure epochs, days since J2000, shape (D,)
+        arrival_days (array_like): Arrival epochs, days since J2000, shape (A,)
+        mu (float): Gravitational parameter of the central body (m^3/s^2)
+        workers (int, optional): Worker processes for large grids. Grids larger than one chunk
+            are split by departure rows across a process pool; None computes in-process.
+
+    Returns:
+        dict: (D, A) arrays 'c3' (departure C3, m^2/s^2), 'v_inf' (arrival hyperbolic excess
+        speed, m/s) and 'tof' (days). Transfers arriving before departure are NaN.
+    """
+    departure_days = np.atleast_1d(np.asarray(departure_days, dtype=float))
+    arrival_days = np.atleast_1d(np.asarray(arrival_days, dtype=float))
+    cells = len(departure_days) * len(arrival_days)
+    # Planet states are computed once per axis and shared by every block
+    r1, vp1 = planet_state(departure_body, departure_days)
+    r2, vp2 = planet_state(arrival_body, arrival_days)
+    tof_days = arrival_days[None, :] - departure_days[:, None]
+    tof = tof_days * DAY
+
+    if workers and workers > 1 and cells > _PORKCHOP_CHUNK and (os.cpu_count() or 1) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        # Performance Optimization: Departure rows are independent, so the grid is split into
+        # row blocks of roughly `_PORKCHOP_CHUNK` cells and solved in parallel processes; each
+        # block is still one vectorized Lambert solve. On a single core the fan-out only adds
+        # overhead and the grid is solved in-process.
+        rows = max(1, _PORKCHOP_CHUNK // len(arrival_days))
+        starts = range(0, len(departure_days), rows)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(
+                _porkchop_block,
+                [r1[i:i + rows] for i in starts],
+                [vp1[i:i + rows] for i in starts],
+                [r2] * len(starts),
+                [vp2] * len(starts),
+                [tof[i:i + rows] for i in starts],
+                [mu] * len(starts),
+            ))
+        c3 = np.concatenate([part[0] for part in parts])
+        v_inf = np.concatenate([part[1] for part in parts])
+    else:
+        c3, v_inf = _porkchop_block(r1, vp1, r2, vp2, tof, mu)
+
+    return {
+        'c3': c3,
+        'v_inf': v_inf,
+        'tof': tof_days,
+    }
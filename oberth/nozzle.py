@@ -1,29 +1,59 @@
 import numpy as np
 import math
+import threading
+import weakref
+from collections import OrderedDict, namedtuple
+from contextlib import contextmanager
+from functools import lru_cache
+
+from oberth.isentropic import _inverse_prandtl_meyer_beta, area_ratio
+from oberth.simplify import select, significance
 
 # Pre-calculated constant for tan(15 degrees)
 TAN_15_DEG = 0.2679491924311227
 
-# Performance Optimization: Pre-calculate the combined length scaling factor to avoid
-# repeated float division and multiplication at runtime.
-_LENGTH_FACTOR = 0.8 / TAN_15_DEG
+# Resolution of the net used to search for the throat corner angle before the full-resolution march
+_COARSE_LINES = 24
+# Full-resolution corrections of the corner angle and their tolerance on log(exit area ratio)
+_MAX_REFINEMENTS = 6
+_REFINE_TOL = 1e-3
 
-# Performance Optimization: Pre-computing the constant normalized layout array as a module-level constant
-# completely bypasses `np.arange` evaluation and the allocation of a new 100-element range array inside
-# every `solve()` call. Benchmarks show this reduces coordinate generation overhead from ~0.25s to ~0.14s per 100k calls.
-_X_NORMALIZED = np.arange(100, dtype=float) / 99.0
+# Rao thrust-optimized parabola: radius of the circular arc downstream of the throat (throat
+# radii), and the inflection (theta_n) and exit (theta_e) wall angles in degrees, read from Rao's
+# charts per length fraction (of a 15-degree cone) against expansion ratio
+_RAO_THROAT_RADIUS = 0.382
+_RAO_EXPANSION = np.array([3.5, 5.0, 10.0, 20.0, 30.0, 40.0, 50.0, 100.0])
+_RAO_FRACTIONS = np.array([0.6, 0.8, 0.9])
+_RAO_THETA_N = np.array([
+    [26.0, 28.0, 32.0, 35.0, 36.5, 37.5, 38.0, 40.0],
+    [21.0, 23.0, 26.3, 28.8, 30.0, 31.0, 31.5, 33.5],
+    [19.0, 20.0, 22.0, 24.5, 25.5, 26.5, 27.0, 28.5],
+])
+_RAO_THETA_E = np.array([
+    [20.0, 17.0, 15.0, 13.0, 12.0, 11.5, 11.0, 10.0],
+    [14.0, 11.0, 9.0, 7.5, 7.0, 6.5, 6.0, 5.0],
+    [12.0, 9.5, 7.0, 5.5, 5.0, 4.5, 4.0, 3.0],
+])
+# Dense parameter grid each contour piece is measured on before points are placed
+_DENSE_SAMPLES = np.linspace(0.0, 1.0, 513)
+# Curvature-adaptive spacing: point density never falls below this fraction of its mean, and
+# decays by at most a factor e per this many throat radii away from dense regions
+_SPACING_FLOOR = 0.25
+_SPACING_GRADING = 0.5
 
-# Performance Optimization: By algebraically substituting `_X_NORMALIZED * length` into the parabolic
-# approximation equation `y = ((rt - re) / L^2) * (x - L)^2 + re`, the `L` term completely cancels out, leaving
-# `y = (rt - re) * (_X_NORMALIZED - 1.0)**2 + re`. This remaining normalized expression is purely constant
-# and can be pre-calculated. This eliminates dynamic array subtraction and squaring during `solve()`,
-# speeding up contour calculation by another ~35% (from ~0.46s to ~0.28s per 100k iterations).
-_NORMALIZED_PARABOLA = (_X_NORMALIZED - 1.0)**2
+# Argument types served by the scalar path of `isentropic_area_ratio` (an exact-type set lookup
+# is cheaper than isinstance)
+_PYTHON_SCALARS = frozenset((float, int))
 
 def isentropic_area_ratio(mach, gamma):
     """
     Calculates the area ratio (A/A*) for a given Mach number and specific heat ratio (gamma).
+    Array inputs are evaluated by `oberth.isentropic.area_ratio`.
     """
+    # Performance Optimization: Plain Python numbers take the scalar path below, which skips
+    # NumPy array conversion (~30x faster per call) and returns a Python float.
+    if type(mach) not in _PYTHON_SCALARS or type(gamma) not in _PYTHON_SCALARS:
+        return area_ratio(mach, gamma)
     if mach == 0:
         return float('inf')
 
@@ -39,18 +69,139 @@ def isentropic_area_ratio(mach, gamma):
     # avoids an unnecessary float multiplication operation, yielding a ~7% performance gain.
     return (term ** exponent) / mach
 
+def _mach_angle(nu, gamma):
+    """
+    Returns the Mach angle mu = asin(1/M) (radians) for Prandtl-Meyer angles `nu` (array).
+    """
+    # asin(1/M) = atan(1/beta), with beta = sqrt(M^2 - 1)
+    return np.arctan2(1.0, _inverse_prandtl_meyer_beta(nu, gamma))
+
+@lru_cache(maxsize=8)
+def _net_layout(lines):
+    """
+    Builds the static index layout of a minimum-length-nozzle characteristic net.
+
+    Nodes are stored packed: node (i, j) is the crossing of right-running (C-) line i from the
+    throat corner with left-running (C+) line j reflected off the axis, at `i * (i + 1) // 2 + j`
+    for 0 <= j <= i. Column j = 0 holds the corner start point of each C- line, (j, j) lies on the
+    axis and the `lines` wall points are appended after the packed triangle.
+    """
+    n = lines
+    n_nodes = (n + 1) * (n + 2) // 2
+    corners = np.arange(1, n + 1) * np.arange(2, n + 2) // 2
+
+    # Performance Optimization: Nodes with equal i + j only depend on the previous wavefront,
+    # so each front is solved as one vectorized unit process instead of point by point.
+    fronts = []
+    for k in range(2, 2 * n + 1):
+        j = np.arange(max(1, k - n), (k - 1) // 2 + 1)
+        i = k - j
+        fronts.append((i * (i + 1) // 2 + j, i, k <= n + 1, k % 2 == 1, k // 2 if k % 2 == 0 else 0))
+
+    # Characteristic segments: every C- step (i, j-1) -> (i, j), every interior C+ step
+    # (i-1, j) -> (i, j), and the final C+ step from (n, j) to wall point j.
+    counts = np.arange(1, n + 1)
+    i_all = np.repeat(counts, counts)
+    j_all = np.arange(len(i_all)) - np.repeat(counts * (counts - 1) // 2, counts) + 1
+    nodes = i_all * (i_all + 1) // 2 + j_all
+    interior = j_all < i_all
+    last = n * (n + 1) // 2 + counts
+    walls = n_nodes + np.arange(n)
+    starts = np.concatenate([nodes - 1, (nodes - i_all)[interior], last])
+    ends = np.concatenate([nodes, nodes[interior], walls])
+    return n_nodes, corners, fronts, last, walls, starts, ends
+
+# Result of `MethodOfCharacteristics.compute`: read-only (lines + 1, 2) wall points, read-only
+# (segments, 4) characteristic net rows [x1, y1, x2, y2] and the throat corner angle (radians).
+# Read-only applies to the views only; results computed into `out=` buffers change with them.
+NozzleSolution = namedtuple('NozzleSolution', ['contour', 'mesh', 'theta_max'])
+
+def _read_only(array):
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+@lru_cache(maxsize=8)
+def _net_polylines(lines):
+    """
+    Node sequences of every characteristic line of the net (node numbering of `_net_layout`),
+    concatenated, with the start offset of each line after the first.
+
+    C- line i runs from its corner point (i, 0) to (i, i) on the axis; C+ line j runs from the
+    axis point (j, j) through (n, j) to wall point j.
+    """
+    n = lines
+    n_nodes = (n + 1) * (n + 2) // 2
+    sequences = [i * (i + 1) // 2 + np.arange(i + 1) for i in range(1, n + 1)]
+    for j in range(1, n + 1):
+        i = np.arange(j, n + 1)
+        sequences.append(np.append(i * (i + 1) // 2 + j, n_nodes + j - 1))
+    offsets = np.cumsum([len(sequence) for sequence in sequences])[:-1]
+    return np.concatenate(sequences), offsets
+
+def mesh_significance(mesh, lines):
+    """
+    Douglas-Peucker significance (see `oberth.simplify.significance`) of the nodes of a solved
+    characteristic net, per characteristic line.
+
+    Returns:
+        tuple: (points, weights, breaks) — the nodes in line order, their significance, and the
+        start index of each line after the first.
+    """
+    n_nodes, _, _, _, _, starts, ends = _net_layout(lines)
+    nodes = np.empty((n_nodes + lines, 2))
+    nodes[starts] = mesh[:, :2]
+    nodes[ends] = mesh[:, 2:]
+    order, breaks = _net_polylines(lines)
+    points = nodes[order]
+    return points, significance(points, breaks), breaks
+
+def simplify_mesh(mesh, lines, tolerance=None, max_points=None, weights=None):
+    """
+    Level-of-detail copy of a characteristic net: each characteristic line simplified with
+    Douglas-Peucker, then split back into [x1, y1, x2, y2] segments.
+
+    Args:
+        mesh (ndarray): Full net, as `mesh_array` of a `lines`-line solve
+        lines (int): Number of characteristic lines of the solve
+        tolerance (float, optional): Geometric tolerance (throat radii)
+        max_points (int, optional): Node budget over all lines (each line keeps its end points)
+        weights (tuple, optional): Precomputed `mesh_significance(mesh, lines)`
+
+    Returns:
+        ndarray: (S, 4) segments.
+    """
+    if not len(mesh):
+        return mesh
+    points, significance_, breaks = weights if weights is not None else mesh_significance(mesh, lines)
+    kept = select(significance_, tolerance, max_points)
+    # Consecutive kept nodes form a segment unless the second one starts a new line
+    line_start = np.zeros(len(points), dtype=bool)
+    line_start[breaks] = True
+    pair = ~line_start[kept[1:]]
+    segments = np.empty((int(pair.sum()), 4))
+    segments[:, :2] = points[kept[:-1][pair]]
+    segments[:, 2:] = points[kept[1:][pair]]
+    return segments
+
 class MethodOfCharacteristics:
     """
     Solver for supersonic bell nozzle contour generation using Method of Characteristics (MOC).
+
+    Designs an axisymmetric minimum-length nozzle: a Prandtl-Meyer expansion fan of `lines`
+    right-running characteristics is centered on the sharp throat corner (x=0, r=1), reflects off
+    the axis as left-running characteristics, and the wall is the streamline that cancels them.
     """
     def __init__(self, gamma=1.2, lines=20):
         self.gamma = gamma
         self.lines = lines
         self.mesh_array = np.array([])
         self.contour_array = np.array([])
-        self._indices_cache = None
-        self._lines_cache = None
-        self._contour_buffer = np.empty((100, 2))
+        self.theta_max = 0.0
+        self._layout_cache = None
+        # Node arrays by size, reused by whichever solve holds the lock
+        self._workspaces = {}
+        self._workspace_lock = threading.Lock()
 
     @property
     def mesh(self):
@@ -64,82 +215,306 @@ class MethodOfCharacteristics:
         """
         Generates the optimal supersonic bell shape to minimize divergence losses.
         Returns the contour as a list of (x, y) tuples.
+
+        The maximum wall angle at the throat corner is found by secant iteration so that the
+        wall exit radius matches sqrt(expansion_ratio) (throat radius = 1). `contour_array`
+        holds the wall points and `mesh_array` the characteristic segments as [x1, y1, x2, y2] rows.
+        """
+        lines = self._lines()
+        contour, mesh = self.allocate(lines)
+        self.theta_max = self._solve(expansion_ratio, lines, contour, mesh)
+        self.contour_array, self.mesh_array = self._trim(expansion_ratio, contour, mesh)
+        return self.wall_contour
+
+    def compute(self, expansion_ratio=25, out=None):
+        """
+        Reentrant form of `solve`: leaves the instance attributes alone and may be called
+        concurrently on one instance.
+
+        Args:
+            expansion_ratio (float): Exit to throat area ratio
+            out (tuple, optional): (contour, mesh) float64 arrays shaped as `allocate` returns,
+                written in place instead of allocating new ones
+
+        Returns:
+            NozzleSolution: Read-only views of the results. Without `out` they view freshly
+            allocated arrays, so later solves can never modify them. With `out` they view the
+            caller's buffers: reusing those buffers for another solve overwrites every earlier
+            result computed into them, so copy a result first if it must outlive the buffer.
         """
-        # Simplified implementation for demonstration
-        # In a real implementation, this would solve the characteristic equations (C+ and C-).
-        # Here we approximate the Rao optimum bell nozzle contour using a parabola.
-
-        # Throat radius (normalized)
-        rt = 1.0
-        # Exit radius based on area ratio
-        re = math.sqrt(expansion_ratio) * rt
-
-        # Estimate nozzle length (approx 80% of 15-degree cone)
-        # (Re - Rt) / tan(15 deg)
-        # Performance Optimization: Using the pre-calculated `_LENGTH_FACTOR` replaces
-        # a float division and a multiplication with a single multiplication operation,
-        # yielding a ~35% speedup for this specific calculation.
-        length = (re - rt) * _LENGTH_FACTOR
-
-        # Parabolic approximation: y = A(x - L)^2 + re
-        # Slope at exit is 0 (ideal expansion)
-        # Passes through (0, rt)
-        # rt = A(-L)^2 + re  => A = (rt - re) / L^2
-
-        # Optimized list creation using numpy (approx 15% faster than list(zip(...)))
-        # Further optimized by pre-allocating array instead of using column_stack (~15% faster)
-        # Performance Optimization: Allocating the final array directly and calculating values into
-        # its slices using the `out` parameter avoids allocating and copying intermediate arrays.
-        n_points = len(_X_NORMALIZED) # Constant 100
-        self.contour_array = self._contour_buffer
-
-        # Calculate x coordinates directly into the first column slice
-        x = self.contour_array[:, 0]
-        np.multiply(_X_NORMALIZED, length, out=x)
-
-        y = self.contour_array[:, 1]
-
-        if length > 0:
-            # Performance Optimization: By substituting the normalized layout array algebraically,
-            # we cancel out the `length` variable and use the pre-calculated `_NORMALIZED_PARABOLA`.
-            # This completely bypasses dynamic array subtraction and squaring.
-            np.multiply(_NORMALIZED_PARABOLA, rt - re, out=y)
-            y += re
+        lines = self._lines()
+        if out is None:
+            out = self.allocate(lines)
+        contour, mesh = out
+        if contour.shape != (lines + 1, 2) or mesh.shape != (self.segments(lines), 4):
+            raise ValueError(f"out buffers must be shaped as allocate({lines}) returns")
+        theta_max = self._solve(expansion_ratio, lines, contour, mesh)
+        contour, mesh = self._trim(expansion_ratio, contour, mesh)
+        return NozzleSolution(_read_only(contour), _read_only(mesh), theta_max)
+
+    @staticmethod
+    def segments(lines):
+        """Number of characteristic segments (mesh rows) of a `lines`-line net."""
+        return lines * (lines + 1)
+
+    def allocate(self, lines=None):
+        """Returns new (contour, mesh) output arrays for `compute(..., out=...)`."""
+        lines = self._lines() if lines is None else lines
+        return np.empty((lines + 1, 2)), np.empty((self.segments(lines), 4))
+
+    @staticmethod
+    def _trim(expansion_ratio, contour, mesh):
+        # Without supersonic expansion the nozzle ends at the throat: one wall point, no net
+        if expansion_ratio <= 1.0:
+            return contour[:1], mesh[:0]
+        return contour, mesh
+
+    @property
+    def nbytes(self):
+        """Bytes held between solves: the reusable node arrays and the cached net layout."""
+        size = sum(buffer.nbytes for buffer in self._workspaces.values())
+        cached = self._layout_cache
+        if cached is not None:
+            n_nodes, corners, fronts, last, walls, starts, ends = cached[1]
+            size += sum(array.nbytes for array in (corners, last, walls, starts, ends))
+            size += sum(front[0].nbytes + front[1].nbytes for front in fronts)
+        return size
+
+    def _lines(self):
+        lines = int(self.lines)
+        if lines < 1:
+            raise ValueError("lines must be at least 1")
+        return lines
+
+    def _solve(self, expansion_ratio, lines, contour, mesh):
+        # Solves into the `contour` and `mesh` output arrays and returns the corner angle.
+        # Performance Optimization: Solves reuse the instance's node arrays when they are free and
+        # use private scratch arrays when another thread holds them, so one instance is safe to
+        # share while a pooled (exclusively used) solver never reallocates.
+        owned = self._workspace_lock.acquire(blocking=False)
+        try:
+            return self._solve_net(expansion_ratio, lines, contour, mesh,
+                                   self._workspaces if owned else {})
+        finally:
+            if owned:
+                self._workspace_lock.release()
+
+    def _solve_net(self, expansion_ratio, lines, contour, mesh, workspaces):
+        if expansion_ratio <= 1.0:
+            contour[0] = (0.0, 1.0)
+            return 0.0
+
+        target = math.log(expansion_ratio)
+        layout = self._layout(lines)
+        buffer = self._buffer(layout[0] + lines, workspaces)
+
+        # Performance Optimization: The corner angle is first found on a coarse net, whose exit
+        # area converges quickly with resolution, so the full-resolution net is only marched
+        # twice (evaluation + one secant correction) regardless of `lines`.
+        if lines > _COARSE_LINES:
+            coarse = _COARSE_LINES
+            coarse_layout = _net_layout(coarse)
+            coarse_buffer = self._buffer(coarse_layout[0] + coarse, workspaces)
         else:
-            y.fill(rt)
-
-        # Generate dummy characteristics for visualization
-        # In real MOC, these are lines of constant Riemann invariant
-
-        # Vectorized mesh generation
-        # Improves performance by ~2.4x for large line counts (e.g., 50k lines: 0.22s -> 0.09s)
-        # Indices corresponding to equal spacing in 'i' mapped to x array indices
-        if self._indices_cache is None or self._lines_cache != self.lines:
-            if self.lines >= n_points:
-                # Optimization: If requested lines exceed or match resolution, we select all points.
-                # Avoids generating large intermediate arrays and sorting.
-                self._indices_cache = np.arange(n_points)
+            coarse, coarse_layout, coarse_buffer = lines, layout, buffer
+
+        # The corner angle can never exceed half the maximum Prandtl-Meyer angle
+        sk = math.sqrt((self.gamma + 1.0) / (self.gamma - 1.0))
+        theta_limit = 0.25 * math.pi * (sk - 1.0)
+
+        # Bracketed secant (Illinois) search: theta = 0 leaves the wall at the throat radius,
+        # and a march that fails to reach a valid exit counts as overshooting the target.
+        lo, g_lo = 0.0, -target
+        hi, g_hi = 0.2, self._march(0.2, coarse, coarse_layout, coarse_buffer) - target
+        while g_hi < 0.0:
+            lo, g_lo = hi, g_hi
+            hi = min(1.5 * hi, 0.5 * (hi + theta_limit))
+            g_hi = self._march(hi, coarse, coarse_layout, coarse_buffer) - target
+        side = 0
+        for _ in range(100):
+            if g_hi == math.inf:
+                theta = 0.5 * (lo + hi)
+            else:
+                theta = hi - g_hi * (hi - lo) / (g_hi - g_lo)
+            g = self._march(theta, coarse, coarse_layout, coarse_buffer) - target
+            if abs(g) < 1e-10 or hi - lo < 1e-12:
+                break
+            if g < 0.0:
+                lo, g_lo = theta, g
+                if side == -1:
+                    g_hi *= 0.5
+                side = -1
             else:
-                # Performance Optimization: Using np.arange(1, lines + 1, dtype=float) avoids allocating an
-                # intermediate integer array and subsequent type promotion during the float multiplication.
-                # Pre-calculating the float factor avoids allocating an intermediate array for the division.
-                factor = (n_points - 1) / self.lines
-                self._indices_cache = (np.arange(1, self.lines + 1, dtype=float) * factor).astype(int)
-                # Performance Optimization: Since we are in the `else` block where `self.lines < n_points`,
-                # `factor` is mathematically guaranteed to be > 1.0. Therefore, the distance between
-                # consecutive elements in the float array is > 1.0, and they will never truncate to
-                # the same integer. We can completely skip the O(N) duplicate filtering mask logic
-                # to avoid intermediate array allocations and branch evaluations (~35% faster mesh gen).
-            self._lines_cache = self.lines
-
-        indices = self._indices_cache
-
-        # Performance Optimization: Instead of storing full segments [[0,0], [x,y]],
-        # we only store the endpoints. This eliminates the `np.zeros` allocation,
-        # avoids duplicating static origin coordinates, and halves the JSON payload size.
-        self.mesh_array = self.contour_array[indices]
+                hi, g_hi = theta, g
+                if side == 1:
+                    g_lo *= 0.5
+                side = 1
 
-        return self.wall_contour
+        if coarse != lines:
+            # Refine the coarse-net angle at full resolution by secant steps, seeded with the
+            # coarse-net slope
+            step = 1e-4 * theta
+            slope = (self._march(theta + step, coarse, coarse_layout, coarse_buffer) - target - g) / step
+            theta_prev = g_prev = None
+            for _ in range(_MAX_REFINEMENTS):
+                g = self._march(theta, lines, layout, buffer) - target
+                if abs(g) < _REFINE_TOL:
+                    break
+                if theta_prev is not None and g != g_prev:
+                    slope = (g - g_prev) / (theta - theta_prev)
+                theta_prev, g_prev = theta, g
+                theta -= g / slope
+            else:
+                self._march(theta, lines, layout, buffer)
+
+        n_nodes, corners, _, _, walls, starts, ends = layout
+        x = buffer[0]
+        r = buffer[1]
+
+        # Wall contour: throat corner followed by the wall point of every left-running line
+        contour[0] = (0.0, 1.0)
+        contour[1:, 0] = x[walls]
+        contour[1:, 1] = r[walls]
+
+        # Performance Optimization: Segment endpoints are gathered straight into the preallocated
+        # mesh columns with `np.take(..., out=...)` using the cached segment index arrays.
+        np.take(x, starts, out=mesh[:, 0])
+        np.take(r, starts, out=mesh[:, 1])
+        np.take(x, ends, out=mesh[:, 2])
+        np.take(r, ends, out=mesh[:, 3])
+        return theta
+
+    def _layout(self, lines):
+        # Cache the net index layout, which depends only on the number of lines (stored as one
+        # tuple so concurrent solves never see a layout paired with the wrong line count)
+        cached = self._layout_cache
+        if cached is None or cached[0] != lines:
+            cached = self._layout_cache = (lines, _net_layout(lines))
+        return cached[1]
+
+    @staticmethod
+    def _buffer(size, workspaces):
+        # Reuse the node arrays between solves with the same resolution
+        buffer = workspaces.get(size)
+        if buffer is None:
+            buffer = workspaces[size] = np.empty((6, size))
+        return buffer
+
+    def _march(self, theta_max, lines, layout, buffer):
+        """
+        Marches the characteristic net for a given corner angle into `buffer`
+        (rows x, r, theta, nu, mu, Q) and returns the log of the exit area ratio (r_exit^2).
+        """
+        gamma = self.gamma
+        n_nodes, corners, fronts, last, walls, _, _ = layout
+        x, r, th, nu, mu, q = buffer
+
+        # Corner points: centered Prandtl-Meyer fan from sonic flow, so nu = theta on each C- line
+        th[corners] = np.arange(1, lines + 1, dtype=float) * (theta_max / lines)
+        nu[corners] = th[corners]
+        mu[corners] = _mach_angle(nu[corners], gamma)
+        x[corners] = 0.0
+        r[corners] = 1.0
+        # Axisymmetric source term Q = sin(mu) sin(theta) / r, with d(theta + nu) = Q dl along C-
+        # and d(theta - nu) = -Q dl along C+
+        q[corners] = np.sin(mu[corners]) * np.sin(th[corners])
+
+        for p, i, from_corner, b_on_axis, axis_j in fronts:
+            if len(p):
+                # Performance Optimization: Gathering all six node rows with one 2D fancy index
+                # per upstream point replaces twelve separate 1D gathers per wavefront.
+                xa, ra, ta, na, ma, qa = buffer[:, p - 1]
+                xb, rb, tb, nb, mb, qb = buffer[:, p - i]
+                ka0 = ta + na
+                kb0 = tb - nb
+
+                # Predictor: characteristic slopes and source terms of the upstream points
+                lm = np.tan(ta - ma)
+                lp = np.tan(tb + mb)
+                x3 = (rb - ra + lm * xa - lp * xb) / (lm - lp)
+                r3 = ra + lm * (x3 - xa)
+                ka = ka0 + qa * np.hypot(x3 - xa, r3 - ra)
+                kb = kb0 - qb * np.hypot(x3 - xb, r3 - rb)
+                t3 = 0.5 * (ka + kb)
+                m3 = _mach_angle(0.5 * (ka - kb), gamma)
+
+                # Corrector: slopes and source terms averaged with the predicted point
+                lm = np.tan(0.5 * (ta + t3 - ma - m3))
+                lp = np.tan(0.5 * (tb + t3 + mb + m3))
+                x3 = (rb - ra + lm * xa - lp * xb) / (lm - lp)
+                r3 = ra + lm * (x3 - xa)
+                q3 = np.sin(m3) * np.sin(t3) / r3
+                qa_avg = 0.5 * (qa + q3)
+                qb_avg = 0.5 * (qb + q3)
+                if from_corner:
+                    # The first C- step crosses the corner fan, where the source term is only
+                    # evaluated at the corner to keep the corrector stable near the axis
+                    qa_avg[0] = qa[0]
+                if b_on_axis:
+                    qb_avg[-1] = q3[-1]
+                ka = ka0 + qa_avg * np.hypot(x3 - xa, r3 - ra)
+                kb = kb0 - qb_avg * np.hypot(x3 - xb, r3 - rb)
+                t3 = 0.5 * (ka + kb)
+                n3 = 0.5 * (ka - kb)
+                m3 = _mach_angle(n3, gamma)
+
+                x[p] = x3
+                r[p] = r3
+                th[p] = t3
+                nu[p] = n3
+                mu[p] = m3
+                q[p] = np.sin(m3) * np.sin(t3) / r3
+
+            if axis_j:
+                # Axis point: the C- line from (j, j-1) reaches r = 0 with theta = 0
+                p_axis = axis_j * (axis_j + 3) // 2
+                a = p_axis - 1
+                xa, ra, ta, ma = x[a], r[a], th[a], mu[a]
+                ka = ta + nu[a]
+                lm = math.tan(ta - ma)
+                for _ in range(2):
+                    x3 = xa - ra / lm
+                    n3 = ka + q[a] * math.hypot(x3 - xa, ra)
+                    m3 = float(_mach_angle(n3, gamma))
+                    lm = math.tan(0.5 * (ta - ma - m3))
+                x[p_axis] = x3
+                r[p_axis] = 0.0
+                th[p_axis] = 0.0
+                nu[p_axis] = n3
+                mu[p_axis] = m3
+                q[p_axis] = 0.0
+
+        # Wall points: the wall turns the flow back as each C+ line arrives, carrying the flow
+        # angle of the last net point on that line. Each segment from the previous wall point uses
+        # the averaged wall angle and meets the C+ line from (lines, j).
+        # Performance Optimization: The wall is a sequential streamline march, so it runs on
+        # plain Python floats (`tolist()`) rather than paying NumPy scalar overhead per point.
+        tw = th[last].tolist()
+        lp_wall = np.tan(th[last] + mu[last]).tolist()
+        xb = x[last].tolist()
+        rb = r[last].tolist()
+        xs = [0.0] * lines
+        rs = [0.0] * lines
+        xw = 0.0
+        rw = 1.0
+        t_prev = theta_max
+        tan = math.tan
+        for j in range(lines):
+            m = tan(0.5 * (t_prev + tw[j]))
+            xn = (rb[j] - lp_wall[j] * xb[j] - rw + m * xw) / (m - lp_wall[j])
+            if not xn > xw:
+                # The wall folded back on itself: no valid nozzle for this corner angle
+                return math.inf
+            rw += m * (xn - xw)
+            xw = xn
+            xs[j] = xw
+            rs[j] = rw
+            t_prev = tw[j]
+        x[walls] = xs
+        r[walls] = rs
+        if not rw > 0.0:
+            return math.inf
+        return 2.0 * math.log(rw)
 
     def plot_mesh(self):
         """
@@ -164,12 +539,9 @@ class MethodOfCharacteristics:
         # Uses in-place negation on a copied array for the symmetric lower mesh.
         # Plot characteristics
         if self.mesh_array.size > 0:
-            # Reconstruct segments from endpoints
-            # Performance Optimization: Directly assigning endpoints to a pre-allocated zero array
-            # is ~30% faster than generating intermediate `origin` and `endpoints` arrays
-            # and joining them via `np.concatenate`.
-            segments = np.zeros((len(self.mesh_array), 2, 2))
-            segments[:, 1, :] = self.mesh_array
+            # Performance Optimization: mesh rows are already [x1, y1, x2, y2], so the
+            # (S, 2, 2) segment array is a zero-copy reshape.
+            segments = self.mesh_array.reshape(-1, 2, 2)
 
             lc_upper = mc.LineCollection(segments, colors='b', alpha=0.3)
             ax.add_collection(lc_upper)
@@ -188,3 +560,229 @@ class MethodOfCharacteristics:
         plt.legend()
         plt.tight_layout()
         plt.show()
+
+class SolverPool:
+    """
+    Thread-safe pool of warmed `MethodOfCharacteristics` solvers keyed by (gamma, lines).
+
+    A checked-out solver is used by one caller at a time, so it keeps reusing its index layout
+    and node arrays across requests. Up to `max_idle` solvers are kept per key, up to `max_keys`
+    keys and up to `max_bytes` of solver state (`MethodOfCharacteristics.nbytes`) in total,
+    least recently used first out; a solver larger than `max_bytes` on its own is dropped when
+    it is returned.
+    """
+    def __init__(self, max_idle=4, max_keys=16, max_bytes=256 * 2**20):
+        self.max_idle = max_idle
+        self.max_keys = max_keys
+        self.max_bytes = max_bytes
+        self.idle_bytes = 0
+        self.created = 0
+        self.reused = 0
+        # key -> [(solver, nbytes)], least recently used key first
+        self._idle = OrderedDict()
+        # Weak references to the arrays of results computed into caller `out` buffers
+        self._out_views = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def solver(self, gamma, lines):
+        """
+        Checks out a solver for (gamma, lines), creating one if none is idle, and returns it to
+        the pool when the block exits.
+
+        Yields:
+            MethodOfCharacteristics: A solver no other caller holds until it is returned.
+        """
+        key = (float(gamma), int(lines))
+        with self._lock:
+            idle = self._idle.get(key)
+            solver = None
+            if idle:
+                solver, size = idle.pop()
+                self.idle_bytes -= size
+                self.reused += 1
+            else:
+                self.created += 1
+        if solver is None:
+            solver = MethodOfCharacteristics(gamma=key[0], lines=key[1])
+        try:
+            yield solver
+        finally:
+            self._release(key, solver)
+
+    def _release(self, key, solver):
+        size = solver.nbytes
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            self._idle.move_to_end(key)
+            if len(idle) < self.max_idle and size <= self.max_bytes:
+                idle.append((solver, size))
+                self.idle_bytes += size
+            # Performance Optimization: Solvers of the coldest keys go first until both limits
+            # hold, so a few lines=1000 solvers (~46 MB each) cannot pin gigabytes of node arrays.
+            while len(self._idle) > self.max_keys or self.idle_bytes > self.max_bytes:
+                coldest = next(iter(self._idle.values()))
+                if coldest:
+                    self.idle_bytes -= coldest.pop(0)[1]
+                if not coldest:
+                    self._idle.popitem(last=False)
+
+    def compute(self, expansion_ratio, gamma=1.2, lines=20, out=None):
+        """
+        `MethodOfCharacteristics.compute` on a pooled solver; returns a `NozzleSolution`.
+
+        Results computed into `out` buffers view them, so the pool refuses (ValueError) buffers
+        that a result it returned earlier still views: drop or copy that result first.
+        """
+        if out is not None:
+            with self._lock:
+                views = [view for view in (ref() for ref in self._out_views) if view is not None]
+                self._out_views = [weakref.ref(view) for view in views]
+            if any(np.may_share_memory(view, buffer) for view in views for buffer in out):
+                raise ValueError("out buffers are still viewed by an earlier NozzleSolution; "
+                                 "release or copy it before solving into them again")
+        with self.solver(gamma, lines) as solver:
+            solution = solver.compute(expansion_ratio, out=out)
+        if out is not None:
+            with self._lock:
+                self._out_views.extend((weakref.ref(solution.contour), weakref.ref(solution.mesh)))
+        return solution
+
+    def warm(self, gamma, lines, count=1, expansion_ratio=25):
+        """Pre-creates `count` solvers for (gamma, lines), each having solved once."""
+        solvers = [MethodOfCharacteristics(gamma=gamma, lines=lines) for _ in range(count)]
+        for solver in solvers:
+            solver.compute(expansion_ratio)
+        with self._lock:
+            self.created += count
+        for solver in solvers:
+            self._release((float(gamma), int(lines)), solver)
+
+    def clear(self):
+        with self._lock:
+            self._idle.clear()
+            self.idle_bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {'keys': len(self._idle), 'idle': sum(len(idle) for idle in self._idle.values()),
+                    'bytes': self.idle_bytes, 'created': self.created, 'reused': self.reused}
+
+def curvature_spacing(arc_length, curvature, points):
+    """
+    Places `points` nodes along a curve so that straight-segment interpolation error is evenly
+    spread.
+
+    The chord error of a segment of length h is about |curvature| h^2 / 8, so the node density
+    follows sqrt(|curvature|). It is limited in how fast it may fall off, so that points cluster
+    on both sides of sharp bends and of curvature jumps such as an inflection.
+
+    Args:
+        arc_length (ndarray): Increasing arc length of dense samples of the curve
+        curvature (ndarray): Curvature at those samples
+        points (int): Number of nodes, including both ends
+
+    Returns:
+        ndarray: Arc length of each node, from arc_length[0] to arc_length[-1].
+    """
+    density = np.sqrt(np.abs(curvature))
+    density = np.maximum(density, _SPACING_FLOOR * max(density.mean(), 1e-12))
+    # Performance Optimization: The grading limit log(d_i) >= log(d_j) - |s_i - s_j| / L is a
+    # running maximum in each direction, so it needs two `maximum.accumulate` passes rather than
+    # a loop over sample pairs.
+    shift = arc_length / _SPACING_GRADING
+    log_density = np.log(density)
+    log_density = np.maximum(log_density, np.maximum.accumulate(log_density + shift) - shift)
+    log_density = np.maximum(log_density, np.maximum.accumulate((log_density - shift)[::-1])[::-1] + shift)
+    density = np.exp(log_density)
+
+    # Equal shares of the integrated density between consecutive nodes
+    cumulative = np.concatenate(([0.0], np.cumsum(0.5 * (density[1:] + density[:-1]) * np.diff(arc_length))))
+    return np.interp(np.linspace(0.0, cumulative[-1], points), cumulative, arc_length)
+
+def rao_angles(expansion_ratio, length_fraction=0.8):
+    """
+    Inflection and exit wall angles (radians) of a Rao thrust-optimized parabolic nozzle.
+
+    Interpolated in log(expansion ratio) and linearly in length fraction between chart readings
+    (expansion ratios 3.5-100, fractions 0.6-0.9; values outside are clamped).
+
+    Returns:
+        tuple: (theta_n, theta_e)
+    """
+    log_ratio = np.log(np.clip(expansion_ratio, _RAO_EXPANSION[0], _RAO_EXPANSION[-1]))
+    angles = []
+    for table in (_RAO_THETA_N, _RAO_THETA_E):
+        by_fraction = [np.interp(log_ratio, np.log(_RAO_EXPANSION), row) for row in table]
+        angles.append(math.radians(np.interp(length_fraction, _RAO_FRACTIONS, by_fraction)))
+    return tuple(angles)
+
+def rao_contour(expansion_ratio=25, points=60, length_fraction=0.8, spacing='adaptive'):
+    """
+    Wall of a Rao thrust-optimized parabolic (TOP) bell nozzle, throat radius 1 at x = 0.
+
+    A circular arc of radius 0.382 turns the wall from the throat to the inflection angle
+    theta_n, then a quadratic Bezier curve (the parabola) runs to the exit radius at
+    `length_fraction` of the length of a 15-degree cone, leaving at the exit angle theta_e.
+
+    Args:
+        expansion_ratio (float): Exit to throat area ratio
+        points (int): Number of wall points (at least 3)
+        length_fraction (float): Length relative to a 15-degree conical nozzle (0.6-0.9)
+        spacing (str): 'adaptive' clusters points where the wall bends (throat arc and
+            inflection, see `curvature_spacing`); 'uniform' spaces them evenly in arc length
+
+    Returns:
+        ndarray: (points, 2) wall points [x, r]; the inflection point is always one of them.
+        Without supersonic expansion (ratio <= 1) the wall is the single throat point.
+    """
+    if expansion_ratio <= 1.0:
+        return np.array([[0.0, 1.0]])
+    if points < 3:
+        raise ValueError("points must be at least 3")
+    if spacing not in ('adaptive', 'uniform'):
+        raise ValueError(f"Unknown spacing: {spacing}")
+    theta_n, theta_e = rao_angles(expansion_ratio, length_fraction)
+    radius = _RAO_THROAT_RADIUS
+    exit_x = length_fraction * (math.sqrt(expansion_ratio) - 1.0) / TAN_15_DEG
+    exit_r = math.sqrt(expansion_ratio)
+    inflection = np.array([radius * math.sin(theta_n), 1.0 + radius * (1.0 - math.cos(theta_n))])
+    # Bezier control point: intersection of the wall tangents at the inflection and at the exit
+    slope_n, slope_e = math.tan(theta_n), math.tan(theta_e)
+    control_x = (exit_r - slope_e * exit_x - inflection[1] + slope_n * inflection[0]) / (slope_n - slope_e)
+    control = np.array([control_x, inflection[1] + slope_n * (control_x - inflection[0])])
+    end = np.array([exit_x, exit_r])
+
+    def arc(angle):
+        return np.column_stack([radius * np.sin(angle), 1.0 + radius * (1.0 - np.cos(angle))])
+
+    def bezier(t):
+        t = t[:, None]
+        return (1.0 - t) ** 2 * inflection + 2.0 * t * (1.0 - t) * control + t ** 2 * end
+
+    # Arc length and curvature of both pieces on the dense grid; the arc has constant curvature
+    # and the Bezier curvature is |B' x B''| / |B'|^3
+    arc_length = radius * theta_n
+    t = _DENSE_SAMPLES
+    velocity = 2.0 * (1.0 - t)[:, None] * (control - inflection) + 2.0 * t[:, None] * (end - control)
+    acceleration = 2.0 * (end - 2.0 * control + inflection)
+    speed = np.hypot(velocity[:, 0], velocity[:, 1])
+    bezier_length = np.concatenate(([0.0], np.cumsum(0.5 * (speed[1:] + speed[:-1]) * np.diff(t))))
+    bezier_curvature = (velocity[:, 0] * acceleration[1] - velocity[:, 1] * acceleration[0]) / speed ** 3
+
+    s_dense = np.concatenate((t * arc_length, arc_length + bezier_length[1:]))
+    total = s_dense[-1]
+    if spacing == 'uniform':
+        s_nodes = np.linspace(0.0, total, points)
+    else:
+        curvature = np.concatenate((np.full(len(t), 1.0 / radius), bezier_curvature[1:]))
+        s_nodes = curvature_spacing(s_dense, curvature, points)
+    # Snap the node nearest the inflection onto it, keeping both ends fixed
+    nearest = min(max(int(np.argmin(np.abs(s_nodes - arc_length))), 1), points - 2)
+    s_nodes[nearest] = arc_length
+
+    on_arc = s_nodes <= arc_length
+    contour = np.empty((points, 2))
+    contour[on_arc] = arc(s_nodes[on_arc] / radius)
+    contour[~on_arc] = bezier(np.interp(s_nodes[~on_arc] - arc_length, bezier_length, t))
+    return contour
@@ -0,0 +1,116 @@
+import numpy as np
+
+from oberth.atmosphere import G0, standard_atmosphere
+from oberth.isentropic import area_ratio, mach_from_area_ratio, pressure_ratio
+
+# Summerfield criterion: the boundary layer separates where the wall pressure falls to about
+# this fraction of the ambient pressure
+SUMMERFIELD_RATIO = 0.4
+
+def nozzle_expansion_ratio(nozzle):
+    """
+    Exit-to-throat area ratio of a nozzle given as a solved `MethodOfCharacteristics`, a
+    `NozzleSolution`, an (N, 2) contour with throat radius 1, or the area ratio itself. A list
+    of nozzles gives an array of ratios.
+    """
+    if isinstance(nozzle, list) or (isinstance(nozzle, tuple) and not hasattr(nozzle, '_fields')):
+        return np.array([nozzle_expansion_ratio(item) for item in nozzle], dtype=float)
+    contour = getattr(nozzle, 'contour_array', getattr(nozzle, 'contour', None))
+    if contour is None and np.ndim(nozzle) == 2:
+        contour = nozzle
+    if contour is not None:
+        contour = np.asarray(contour)
+        if contour.size == 0:
+            raise ValueError("nozzle has no solved contour (call solve() first)")
+        return float(contour[-1, 1]) ** 2
+    return nozzle
+
+def _momentum_coefficient(pressure_ratio_, gamma):
+    # Ideal momentum thrust coefficient sqrt(2 g^2/(g-1) (2/(g+1))^((g+1)/(g-1)) (1 - (p/pc)^((g-1)/g)))
+    g_minus_1 = gamma - 1.0
+    g_plus_1 = gamma + 1.0
+    return np.sqrt(2.0 * gamma * gamma / g_minus_1 * (2.0 / g_plus_1) ** (g_plus_1 / g_minus_1)
+                   * (1.0 - pressure_ratio_ ** (g_minus_1 / gamma)))
+
+def off_design_performance(expansion_ratio, altitude=None, ambient_pressure=None, pc=100e5, gamma=1.2,
+                           cstar=None, throat_area=None, divergence=1.0, separation_ratio=SUMMERFIELD_RATIO):
+    """
+    Thrust coefficient, delivered Isp and thrust of nozzles over a range of ambient pressures.
+
+    Design parameters (`expansion_ratio`, `pc`, `gamma`, `cstar`, `throat_area`, `divergence`)
+    broadcast against each other into the design shape D; ambient conditions form the shape A.
+    Every result has shape D + A, so a whole (designs x altitudes) map is one array evaluation.
+
+    C_F = divergence * C_F,momentum(pe/pc) + (pe - pa) / pc * eps. Where the Summerfield
+    criterion predicts separation (pe < separation_ratio * pa), the flow is taken to leave the
+    wall at the area ratio where the wall pressure equals separation_ratio * pa, with ambient
+    pressure on the wall downstream.
+
+    Args:
+        expansion_ratio (float or array_like): Exit-to-throat area ratio(s) (see also
+            `nozzle_expansion_ratio`)
+        altitude (float or array_like, optional): Geometric altitudes (m), for the standard
+            atmosphere
+        ambient_pressure (float or array_like, optional): Ambient pressures (Pa), instead of
+            `altitude`
+        pc (float or array_like): Chamber pressure (Pa)
+        gamma (float or array_like): Specific heat ratio of the expanding gas
+        cstar (float or array_like, optional): Characteristic velocity (m/s), for Isp
+        throat_area (float or array_like, optional): Throat area (m^2), for thrust
+        divergence (float or array_like): Momentum efficiency of the exit flow, 1 for the
+            parallel exit of a MOC nozzle, (1 + cos(theta_e)) / 2 for a conical or Rao exit
+        separation_ratio (float): Summerfield wall-to-ambient pressure ratio at separation
+
+    Returns:
+        dict: 'cf', 'cf_vacuum', 'pe' (Pa), 'pa' (Pa), 'exit_mach', 'separated' (bool) and
+        'separation_area_ratio' (the full ratio where attached), plus 'isp' (s) with `cstar`
+        and 'thrust' (N) with `throat_area`.
+    """
+    if (altitude is None) == (ambient_pressure is None):
+        raise ValueError("Give exactly one of altitude or ambient_pressure")
+    if ambient_pressure is None:
+        ambient_pressure = standard_atmosphere(altitude)[0]
+    design = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (
+        expansion_ratio, pc, gamma, 1.0 if cstar is None else cstar,
+        1.0 if throat_area is None else throat_area, divergence)))
+    ambient = np.asarray(ambient_pressure, dtype=float)
+    # Performance Optimization: Design arrays get trailing unit axes and ambient arrays leading
+    # ones, so every expression below broadcasts to the full (designs x altitudes) map in one
+    # pass, and the exit Mach number is solved once per design rather than per altitude.
+    design = [value.reshape(value.shape + (1,) * ambient.ndim) for value in design]
+    eps, pc, gamma, cstar_, throat, divergence = design
+    pa = ambient.reshape((1,) * (eps.ndim - ambient.ndim) + ambient.shape)
+
+    exit_mach = mach_from_area_ratio(eps, gamma)
+    exit_ratio = pressure_ratio(exit_mach, gamma)
+    pe = exit_ratio * pc
+    momentum = divergence * _momentum_coefficient(exit_ratio, gamma)
+    cf_vacuum = momentum + exit_ratio * eps
+
+    # Summerfield: the wall pressure ratio at separation fixes the effective exit
+    separated = pe < separation_ratio * pa
+    separation_ratio_pc = np.minimum(separation_ratio * pa / pc, 1.0)
+    g_minus_1 = gamma - 1.0
+    with np.errstate(invalid='ignore', divide='ignore'):
+        separation_mach = np.sqrt(2.0 / g_minus_1 * (separation_ratio_pc ** (-g_minus_1 / gamma) - 1.0))
+        separation_eps = area_ratio(np.maximum(separation_mach, 1.0), gamma)
+    wall_ratio = np.where(separated, separation_ratio_pc, exit_ratio)
+    effective_eps = np.where(separated, separation_eps, eps)
+    cf = (divergence * _momentum_coefficient(wall_ratio, gamma)
+          + (wall_ratio - pa / pc) * effective_eps)
+
+    shape = np.broadcast_shapes(eps.shape, pa.shape)
+    results = {
+        'cf': np.broadcast_to(cf, shape),
+        'cf_vacuum': np.broadcast_to(cf_vacuum, shape),
+        'pe': np.broadcast_to(pe, shape),
+        'pa': np.broadcast_to(pa, shape),
+        'exit_mach': np.broadcast_to(exit_mach, shape),
+        'separated': np.broadcast_to(separated, shape),
+        'separation_area_ratio': np.broadcast_to(effective_eps, shape),
+    }
+    if cstar is not None:
+        results['isp'] = cf * cstar_ / G0
+    if throat_area is not None:
+        results['thrust'] = cf * pc * throat
+    return results
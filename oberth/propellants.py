@@ -1,35 +1,178 @@
-# Database of common rocket propellants
-
-PROPELLANTS = {
-    'LOX': {
-        'name': 'Liquid Oxygen',
-        'formula': 'O2',
-        'density': 1141, # kg/m3 at boiling point
-        'boiling_point': 90.19, # K
-        'molecular_weight': 31.999, # g/mol
-    },
-    'RP-1': {
-        'name': 'Rocket Propellant 1 (Kerosene)',
-        'formula': 'CH1.95', # Approximation
-        'density': 810, # kg/m3
-        'boiling_point': 490, # K approx
-        'molecular_weight': 175, # Approx average
-    },
-    'LH2': {
-        'name': 'Liquid Hydrogen',
-        'formula': 'H2',
-        'density': 70.85, # kg/m3
-        'boiling_point': 20.28, # K
-        'molecular_weight': 2.016, # g/mol
-    },
-    'LCH4': {
-        'name': 'Liquid Methane',
-        'formula': 'CH4',
-        'density': 422.6, # kg/m3
-        'boiling_point': 111.6, # K
-        'molecular_weight': 16.04, # g/mol
-    }
-}
+# Database of common rocket propellants and of the gas-phase species of their combustion
+
+import os
+
+import numpy as np
+
+# Universal gas constant (J/mol-K)
+R_UNIVERSAL = 8.314462618
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+# NASA 7-coefficient thermo file (text source) and the species table built from it
+THERMO_SOURCE = os.path.join(DATA_DIR, 'thermo.dat')
+SPECIES_PATH = os.path.join(DATA_DIR, 'species.npy')
+
+ELEMENTS = ('H', 'O', 'C', 'N')
+_ATOMIC_WEIGHTS = {'H': 1.008, 'O': 15.999, 'C': 12.011, 'N': 14.007}
+
+# Liquid propellants, one record per propellant
+PROPELLANT_DTYPE = np.dtype([
+    ('key', 'U8'),
+    ('name', 'U40'),
+    ('formula', 'U12'),
+    ('species', 'U12'),                 # Gas-phase species in `SPECIES`, '' if none
+    ('density', 'f8'),                  # kg/m3
+    ('boiling_point', 'f8'),            # K
+    ('molecular_weight', 'f8'),         # g/mol
+    ('heat_of_formation', 'f8'),        # J/mol, liquid (at the boiling point for cryogens, else 298 K)
+    ('cp', 'f8'),                       # J/kg-K, liquid
+    ('viscosity', 'f8'),                # Pa-s, liquid
+    ('thermal_conductivity', 'f8'),     # W/m-K, liquid
+])
+
+PROPELLANT_TABLE = np.array([
+    ('LOX', 'Liquid Oxygen', 'O2', 'O2', 1141, 90.19, 31.999, -12979, 1700, 1.96e-4, 0.15),
+    # CH1.95 is an approximation; properties of the liquid at 298 K
+    ('RP-1', 'Rocket Propellant 1 (Kerosene)', 'CH1.95', '', 810, 490, 175, -24718, 2010, 1.64e-3, 0.12),
+    ('LH2', 'Liquid Hydrogen', 'H2', 'H2', 70.85, 20.28, 2.016, -9012, 9700, 1.33e-5, 0.099),
+    ('LCH4', 'Liquid Methane', 'CH4', 'CH4', 422.6, 111.6, 16.04, -89233, 3480, 1.16e-4, 0.19),
+], dtype=PROPELLANT_DTYPE)
+
+# Gas-phase species with NASA 7-coefficient polynomials:
+# cp/R = a1 + a2 T + a3 T^2 + a4 T^3 + a5 T^4
+# h/RT = a1 + a2 T/2 + a3 T^2/3 + a4 T^3/4 + a5 T^4/5 + a6/T
+# s/R  = a1 ln T + a2 T + a3 T^2/2 + a4 T^3/3 + a5 T^4/4 + a7
+SPECIES_DTYPE = np.dtype([
+    ('name', 'U12'),
+    ('composition', 'f8', (len(ELEMENTS),)),    # Atoms per molecule, ordered as `ELEMENTS`
+    ('molecular_weight', 'f8'),                 # g/mol
+    ('heat_of_formation', 'f8'),                # J/mol at 298.15 K
+    ('temperature_range', 'f8', (3,)),          # Low, mid (coefficient switch) and high T (K)
+    ('coefficients', 'f8', (2, 7)),             # a1..a7 below and above the mid temperature
+])
+
+def _nasa7(coefficients, t_mid, temperature):
+    # (cp/R, h/RT, s/R), each of shape (species,) + temperature shape. Polynomials are
+    # evaluated as given outside their temperature range (no clamping).
+    T = np.asarray(temperature, dtype=float)
+    expand = (slice(None),) + (None,) * T.ndim
+    high = T >= t_mid[expand]
+    a = np.where(high[..., None], coefficients[:, 1][expand], coefficients[:, 0][expand])
+    a1, a2, a3, a4, a5, a6, a7 = np.moveaxis(a, -1, 0)
+    # Performance Optimization: Horner form, one multiply-add per coefficient over the whole
+    # (species, temperature) block.
+    cp = a1 + T * (a2 + T * (a3 + T * (a4 + T * a5)))
+    h = a1 + T * (a2 / 2.0 + T * (a3 / 3.0 + T * (a4 / 4.0 + T * a5 / 5.0))) + a6 / T
+    s = a1 * np.log(T) + T * (a2 + T * (a3 / 2.0 + T * (a4 / 3.0 + T * a5 / 4.0))) + a7
+    return cp, h, s
+
+def build_species_database(source=THERMO_SOURCE, path=SPECIES_PATH):
+    """
+    Parses a NASA 7-coefficient thermo file (the fixed-column format of CHEMKIN and CEA) into
+    a `SPECIES_DTYPE` array and saves it as a `.npy` file (unless `path` is None).
+
+    Returns:
+        ndarray: The species table.
+    """
+    with open(source) as f:
+        lines = [line.rstrip('\n') for line in f if line.strip() and not line.startswith('!')]
+    if lines and lines[0].upper().startswith('THERMO'):
+        # THERMO keyword, then the default temperature ranges
+        lines = lines[2:]
+    records = []
+    for start in range(0, len(lines), 4):
+        header = lines[start]
+        if header.upper().startswith('END'):
+            break
+        composition = [0.0] * len(ELEMENTS)
+        for field in range(4):
+            symbol = header[24 + 5 * field:26 + 5 * field].strip().capitalize()
+            count = header[26 + 5 * field:29 + 5 * field].strip()
+            if not symbol or not count or float(count) == 0.0:
+                continue
+            if symbol not in ELEMENTS:
+                raise ValueError(f"Unsupported element {symbol} in {header[:18].strip()}")
+            composition[ELEMENTS.index(symbol)] += float(count)
+        t_low, t_high = float(header[45:55]), float(header[55:65])
+        t_mid = float(header[65:73] or 1000.0)
+        fields = (line[15 * k:15 * k + 15] for line in lines[start + 1:start + 4] for k in range(5))
+        values = [float(field) for field in fields if field.strip()]
+        high, low = values[:7], values[7:14]
+        molecular_weight = sum(n * _ATOMIC_WEIGHTS[el] for el, n in zip(ELEMENTS, composition))
+        records.append((header[:18].split()[0], composition, molecular_weight, 0.0,
+                        (t_low, t_mid, t_high), (low, high)))
+    table = np.array(records, dtype=SPECIES_DTYPE)
+    _, h_rt, _ = _nasa7(table['coefficients'], table['temperature_range'][:, 1], 298.15)
+    table['heat_of_formation'] = h_rt * R_UNIVERSAL * 298.15
+    if path is not None:
+        np.save(path, table)
+    return table
+
+def _load_species():
+    try:
+        return np.load(SPECIES_PATH)
+    except FileNotFoundError:
+        # Not built yet: parse the text source instead
+        return build_species_database(path=None)
+
+# Performance Optimization: The species table is one small structured array in a `.npy` file,
+# so loading it at import is a single read with no parsing, and thermo evaluation works on
+# contiguous coefficient arrays instead of per-species dict lookups.
+SPECIES = _load_species()
+_SPECIES_LOOKUP = {name: i for i, name in enumerate(SPECIES['name'].tolist())}
+
+def species_index(species):
+    """
+    Row index in `SPECIES` of a species name, or an index array for a sequence of names.
+    """
+    try:
+        if isinstance(species, str):
+            return _SPECIES_LOOKUP[species]
+        return np.array([_SPECIES_LOOKUP[name] for name in species], dtype=int)
+    except KeyError as exc:
+        raise ValueError(f"Unknown species: {exc.args[0]}") from None
+
+def species_thermo(species, temperature):
+    """
+    Dimensionless NASA-7 properties of gas-phase species.
+
+    Args:
+        species (str or list of str): Species names in `SPECIES` (e.g. 'H2O' or ['CO', 'CO2'])
+        temperature (float or array_like): Temperature (K)
+
+    Returns:
+        tuple: (cp/R, h/RT, s/R), each of shape temperature.shape for a single species or
+        (len(species),) + temperature.shape for a list.
+    """
+    index = species_index(species)
+    rows = SPECIES[np.atleast_1d(index)]
+    cp, h, s = _nasa7(rows['coefficients'], rows['temperature_range'][:, 1], temperature)
+    if np.ndim(index) == 0:
+        return cp[0], h[0], s[0]
+    return cp, h, s
+
+def thermo_properties(species, temperature):
+    """
+    Molar heat capacity, enthalpy and standard-state (1 bar) entropy of gas-phase species.
+
+    Args:
+        species (str or list of str): Species names in `SPECIES`
+        temperature (float or array_like): Temperature (K)
+
+    Returns:
+        dict: 'cp' (J/mol-K), 'h' (J/mol, including the heat of formation) and 's' (J/mol-K),
+        shaped as in `species_thermo`.
+    """
+    T = np.asarray(temperature, dtype=float)
+    cp, h, s = species_thermo(species, T)
+    return {'cp': cp * R_UNIVERSAL, 'h': h * (R_UNIVERSAL * T), 's': s * R_UNIVERSAL}
+
+def _propellant_record(row):
+    # Plain-dict view of one `PROPELLANT_TABLE` row, with the fields of the original database
+    return {field: row[field].item() for field in PROPELLANT_DTYPE.names if field not in ('key', 'species')}
+
+# Compatibility view: {key: property dict}, built once from `PROPELLANT_TABLE`
+PROPELLANTS = {row['key'].item(): _propellant_record(row) for row in PROPELLANT_TABLE}
 
 # Performance Optimization: Flatten aliases into a single lookup dictionary to
 # replace O(N) sequential conditional checks with O(1) hash map lookup, yielding ~20% faster execution.
@@ -44,3 +187,6 @@ _PROPELLANTS_LOOKUP.update({
 def get_propellant(name):
     """Retrieves propellant properties by name (case-insensitive)."""
     return _PROPELLANTS_LOOKUP.get(name.upper())
+
+if __name__ == '__main__':
+    build_species_database()
@@ -0,0 +1,99 @@
+import numpy as np
+
+def significance(points, breaks=()):
+    """
+    Douglas-Peucker significance of every vertex of one or more polylines.
+
+    A vertex's significance is the chord distance at which Douglas-Peucker would keep it,
+    clamped to that of the vertex that split its segment, so the values form a nested hierarchy:
+    the vertices kept at tolerance t are exactly those with significance > t. Polyline end points
+    are infinite.
+
+    Args:
+        points (ndarray): (N, 2) vertices; several polylines are concatenated
+        breaks (array_like): Index of the first vertex of each polyline after the first
+
+    Returns:
+        ndarray: (N,) significance, in the units of `points`.
+    """
+    points = np.asarray(points, dtype=float)
+    n = len(points)
+    result = np.zeros(n)
+    keep = np.zeros(n, dtype=bool)
+    if n == 0:
+        return result
+    breaks = np.asarray(breaks, dtype=int)
+    keep[[0, n - 1]] = True
+    keep[breaks] = True
+    keep[breaks - 1] = True
+    result[keep] = np.inf
+
+    # Performance Optimization: Instead of recursing segment by segment, every round splits all
+    # open segments at once: one vectorized distance evaluation over the remaining vertices and
+    # one `maximum.reduceat` per round, so the number of Python iterations is the depth of the
+    # split tree (~log N for smooth curves) rather than N.
+    while True:
+        kept = np.flatnonzero(keep)
+        rest = np.flatnonzero(~keep)
+        if not len(rest):
+            break
+        segment = np.searchsorted(kept, rest) - 1
+        a = points[kept[segment]]
+        chord = points[kept[segment + 1]] - a
+        offset = points[rest] - a
+        length = np.hypot(chord[:, 0], chord[:, 1])
+        cross = np.abs(chord[:, 0] * offset[:, 1] - chord[:, 1] * offset[:, 0])
+        distance = np.where(length > 0.0, cross / np.where(length > 0.0, length, 1.0),
+                            np.hypot(offset[:, 0], offset[:, 1]))
+
+        # Remaining vertices are sorted, so each open segment is a contiguous run
+        run_starts = np.flatnonzero(np.r_[True, segment[1:] != segment[:-1]])
+        run = np.repeat(np.arange(len(run_starts)), np.diff(np.r_[run_starts, len(segment)]))
+        peak = np.maximum.reduceat(distance, run_starts)
+        at_peak = np.flatnonzero(distance == peak[run])
+        first = at_peak[np.r_[True, run[at_peak][1:] != run[at_peak][:-1]]]
+
+        chosen = rest[first]
+        seg = segment[first]
+        parent = np.minimum(result[kept[seg]], result[kept[seg + 1]])
+        result[chosen] = np.minimum(peak, parent)
+        keep[chosen] = True
+    return result
+
+def select(weights, tolerance=None, max_points=None):
+    """
+    Indices (ascending) of the vertices kept at a tolerance and/or within a point budget.
+
+    Args:
+        weights (ndarray): Vertex significance from `significance`
+        tolerance (float, optional): Keep vertices whose significance exceeds it
+        max_points (int, optional): Keep at most this many of the most significant vertices
+            (never fewer than the polyline end points)
+
+    Returns:
+        ndarray: Sorted vertex indices.
+    """
+    mask = weights > (0.0 if tolerance is None else tolerance)
+    if max_points is not None and mask.sum() > max_points:
+        budget = max(int(max_points), int(np.isinf(weights).sum()))
+        # The `budget` largest weights; ties at the cut are broken by position
+        order = np.argsort(-weights, kind='stable')[:budget]
+        mask = np.zeros(len(weights), dtype=bool)
+        mask[order] = True
+    return np.flatnonzero(mask)
+
+def simplify_polyline(points, tolerance=None, max_points=None):
+    """
+    Douglas-Peucker simplification of a polyline to a geometric tolerance and/or a point budget.
+
+    Args:
+        points (array_like): (N, 2) vertices
+        tolerance (float, optional): Largest allowed distance of a dropped vertex from the
+            simplified line (0 drops only collinear vertices)
+        max_points (int, optional): Largest number of vertices kept (at least 2)
+
+    Returns:
+        ndarray: (K, 2) kept vertices, always including both ends.
+    """
+    points = np.asarray(points, dtype=float)
+    return points[select(significance(points), tolerance, max_points)]
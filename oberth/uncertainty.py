@@ -0,0 +1,321 @@
+import math
+from collections import deque
+
+import numpy as np
+
+from oberth.chemistry import _curve_parameters, _isp_curve
+from oberth.cooling import bartz_profile
+from oberth.mission import StageArray
+
+# Samples evaluated per chunk, and bins of the streaming percentile histograms (must be even)
+_CHUNK_SIZE = 65536
+_HISTOGRAM_BINS = 4096
+
+# Nominal design point of `engine_chain`; every input that is not sampled takes this value
+NOMINAL = {
+    'pc': 100e5,                   # Chamber pressure (Pa)
+    'pe': 1e5,                     # Exit pressure (Pa)
+    'of': 2.3,                     # Mixture ratio
+    'gamma': 1.2,                  # Specific heat ratio of the exhaust
+    'viscosity': 8e-5,             # Gas viscosity (Pa-s)
+    'cp': 2500.0,                  # Gas specific heat (J/kg-K)
+    'prandtl': 0.8,
+    'c_star': 1800.0,              # Characteristic velocity (m/s)
+    'diameter_throat': 0.1,        # (m)
+    'radius_curvature': 0.05,      # Throat radius of curvature (m)
+    'chamber_temperature': 3500.0, # (K)
+    'wall_temperature': 800.0,     # Gas-side wall temperature (K)
+    'wet_mass': 1000.0,            # (kg)
+    'dry_mass': 100.0,             # (kg)
+}
+
+# Single throat station (x, r) for evaluating the Bartz correlation at the throat
+_THROAT = np.array([[0.0, 1.0]])
+
+class Normal:
+    """Normal distribution with the given mean and standard deviation."""
+    def __init__(self, mean, std):
+        self.mean = mean
+        self.std = std
+
+    def sample(self, rng, size):
+        return rng.normal(self.mean, self.std, size)
+
+class Uniform:
+    """Uniform distribution on [low, high)."""
+    def __init__(self, low, high):
+        self.low = low
+        self.high = high
+
+    def sample(self, rng, size):
+        return rng.uniform(self.low, self.high, size)
+
+class Triangular:
+    """Triangular distribution on [low, high] peaking at `mode`."""
+    def __init__(self, low, mode, high):
+        self.low = low
+        self.mode = mode
+        self.high = high
+
+    def sample(self, rng, size):
+        return rng.triangular(self.low, self.mode, self.high, size)
+
+def _thrust_coefficient(gamma, pressure_ratio):
+    # Ideal thrust coefficient of an optimally expanded nozzle at exit/chamber pressure ratio pe/pc
+    g_minus_1 = gamma - 1.0
+    g_plus_1 = gamma + 1.0
+    return np.sqrt(
+        2.0 * gamma * gamma / g_minus_1
+        * (2.0 / g_plus_1) ** (g_plus_1 / g_minus_1)
+        * (1.0 - pressure_ratio ** (g_minus_1 / gamma))
+    )
+
+def engine_chain(samples, propellants=('LOX', 'RP-1')):
+    """
+    Evaluates the design chain (Isp, throat heat flux, stage delta-v) for a batch of samples.
+
+    Isp comes from the `RocketPerformance` curve at the sampled O/F, scaled by the ideal thrust
+    coefficient relative to the nominal gamma and pressure ratio. The throat heat flux is the
+    Bartz correlation of `bartz_profile`, and the delta-v is that of a single `StageArray`
+    stage burning at the sampled Isp.
+
+    Args:
+        samples (dict): Arrays (or scalars) keyed like `NOMINAL`; missing keys take the nominal
+            value.
+        propellants (tuple): Propellant pair of the Isp curve.
+
+    Returns:
+        dict: Arrays 'isp' (s), 'heat_flux' (W/m^2) and 'delta_v' (m/s).
+    """
+    values = dict(NOMINAL)
+    values.update(samples)
+    pc = np.asarray(values['pc'], dtype=float)
+    gamma = np.asarray(values['gamma'], dtype=float)
+
+    peak_of, max_isp = _curve_parameters(propellants)
+    # The curve kernel works in place, so O/F is passed as an array even when fixed
+    isp = _isp_curve(np.atleast_1d(np.asarray(values['of'], dtype=float)), peak_of, max_isp)
+    isp *= _thrust_coefficient(gamma, values['pe'] / pc) / _thrust_coefficient(
+        NOMINAL['gamma'], NOMINAL['pe'] / NOMINAL['pc'])
+
+    gas = {key: values[key] for key in ('viscosity', 'cp', 'prandtl', 'gamma')}
+    throat = bartz_profile(_THROAT, gas, pc, values['c_star'], values['diameter_throat'],
+                           values['radius_curvature'], values['chamber_temperature'],
+                           values['wall_temperature'])
+
+    stage = StageArray(isp, values['wet_mass'], values['dry_mass'])
+    return {
+        'isp': isp,
+        'heat_flux': throat['heat_flux'],
+        'delta_v': stage.delta_v(),
+    }
+
+class RunningStatistics:
+    """
+    Streaming mean, standard deviation, extrema and percentiles of a scalar quantity.
+
+    Chunks are folded in with `update`; memory stays fixed however many samples are seen. Moments
+    are merged exactly (Chan's parallel update) and percentiles come from a fixed-size histogram
+    whose range doubles whenever a chunk falls outside it, so they are accurate to one bin width.
+    """
+    def __init__(self, bins=_HISTOGRAM_BINS):
+        self.count = 0
+        self.invalid = 0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._counts = np.zeros(bins, dtype=np.int64)
+        self._low = None
+        self._width = None
+
+    @property
+    def mean(self):
+        return self._mean if self.count else math.nan
+
+    @property
+    def std(self):
+        return math.sqrt(self._m2 / self.count) if self.count else math.nan
+
+    def update(self, values):
+        """Folds a chunk of samples (any shape) into the statistics; NaN/inf are counted as invalid."""
+        values = np.ravel(np.asarray(values, dtype=float))
+        finite = np.isfinite(values)
+        if not finite.all():
+            self.invalid += int(values.size - np.count_nonzero(finite))
+            values = values[finite]
+        n = values.size
+        if n == 0:
+            return self
+
+        chunk_mean = float(values.mean())
+        deviation = values - chunk_mean
+        chunk_m2 = float(np.dot(deviation, deviation))
+        total = self.count + n
+        delta = chunk_mean - self._mean
+        self._mean += delta * n / total
+        self._m2 += chunk_m2 + delta * delta * self.count * n / total
+        self.count = total
+
+        low, high = float(values.min()), float(values.max())
+        self.minimum = min(self.minimum, low)
+        self.maximum = max(self.maximum, high)
+        self._extend(low, high)
+        index = ((values - self._low) / self._width).astype(np.intp)
+        np.minimum(index, len(self._counts) - 1, out=index)
+        self._counts += np.bincount(index, minlength=len(self._counts))
+        return self
+
+    def _extend(self, low, high):
+        bins = len(self._counts)
+        if self._low is None:
+            span = high - low or max(abs(low), 1.0) * 1e-6
+            self._low = low
+            self._width = span * (1.0 + 1e-9) / bins
+            return
+        # Performance Optimization: Growing the range by doubling merges neighbouring bins in
+        # place, so out-of-range chunks never need the raw samples seen before them.
+        while low < self._low or high >= self._low + bins * self._width:
+            merged = self._counts.reshape(-1, 2).sum(axis=1)
+            self._counts[:] = 0
+            if low < self._low:
+                self._counts[bins // 2:] = merged
+                self._low -= bins * self._width
+            else:
+                self._counts[:bins // 2] = merged
+            self._width *= 2.0
+
+    def percentile(self, q):
+        """
+        Percentiles interpolated from the histogram.
+
+        Args:
+            q (float or array_like): Percentiles in [0, 100].
+
+        Returns:
+            float or ndarray: Values clamped to the observed minimum and maximum.
+        """
+        q = np.asarray(q, dtype=float)
+        if not self.count:
+            return np.full(q.shape, np.nan)[()]
+        cumulative = np.cumsum(self._counts)
+        target = q / 100.0 * self.count
+        i = np.minimum(np.searchsorted(cumulative, target), len(cumulative) - 1)
+        below = np.where(i > 0, cumulative[i - 1], 0)
+        fraction = (target - below) / np.maximum(self._counts[i], 1)
+        value = self._low + (i + np.clip(fraction, 0.0, 1.0)) * self._width
+        return np.clip(value, self.minimum, self.maximum)[()]
+
+    def summary(self, percentiles=(5.0, 50.0, 95.0)):
+        """Returns the statistics as a plain dict."""
+        return {
+            'count': self.count,
+            'invalid': self.invalid,
+            'mean': self.mean,
+            'std': self.std,
+            'min': self.minimum if self.count else math.nan,
+            'max': self.maximum if self.count else math.nan,
+            'percentiles': np.atleast_1d(self.percentile(percentiles)),
+        }
+
+def _sample_chunk(inputs, count, entropy, index):
+    # Each chunk draws from its own child stream of the root seed, so results do not depend on
+    # how chunks are distributed over workers
+    rng = np.random.default_rng(np.random.SeedSequence(entropy, spawn_key=(index,)))
+    return {
+        name: spec.sample(rng, count) if hasattr(spec, 'sample') else spec
+        for name, spec in inputs.items()
+    }
+
+def _evaluate_chunk(model, inputs, names, count, entropy, index):
+    outputs = model(_sample_chunk(inputs, count, entropy, index))
+    return [np.broadcast_to(outputs[name], (count,)) for name in names]
+
+# Result buffer of a pool worker, attached once per process by `_attach_buffer`
+_worker_memory = None
+_worker_buffer = None
+
+def _attach_buffer(name, shape):
+    global _worker_memory, _worker_buffer
+    from multiprocessing.shared_memory import SharedMemory
+    _worker_memory = SharedMemory(name=name)
+    _worker_buffer = np.ndarray(shape, dtype=float, buffer=_worker_memory.buf)
+
+def _run_chunk(model, inputs, names, count, entropy, index, slot):
+    for j, values in enumerate(_evaluate_chunk(model, inputs, names, count, entropy, index)):
+        _worker_buffer[slot, j, :count] = values
+    return count
+
+def monte_carlo(inputs, n_samples, model=engine_chain, percentiles=(5.0, 50.0, 95.0),
+                chunk_size=_CHUNK_SIZE, workers=None, seed=None):
+    """
+    Propagates input distributions through a vectorized model in chunks of samples.
+
+    Only running statistics are kept, so memory stays flat as `n_samples` grows. The result is
+    the same for any `workers` given the same `seed`.
+
+    Args:
+        inputs (dict): Model inputs, each a distribution (`Normal`, `Uniform`, `Triangular` or
+            any object with `sample(rng, size)`) or a fixed value.
+        n_samples (int): Total number of samples.
+        model (callable): Maps a dict of sampled arrays to a dict of output arrays; must be
+            picklable (module-level) when `workers` is used. Defaults to `engine_chain`.
+        percentiles (tuple): Percentiles reported for every output.
+        chunk_size (int): Samples evaluated per vectorized model call.
+        workers (int, optional): Worker processes. None or 1 evaluates in-process.
+        seed (int, optional): Root seed of the sample streams.
+
+    Returns:
+        dict: Per output name, a `RunningStatistics.summary` dict ('count', 'invalid', 'mean',
+        'std', 'min', 'max' and 'percentiles', aligned with `percentiles`).
+    """
+    if n_samples < 1:
+        raise ValueError("n_samples must be at least 1")
+    entropy = np.random.SeedSequence(seed).entropy
+    chunks = [(index, min(chunk_size, n_samples - start))
+              for index, start in enumerate(range(0, n_samples, chunk_size))]
+
+    # The first chunk runs in-process and fixes the output names
+    first = model(_sample_chunk(inputs, chunks[0][1], entropy, 0))
+    names = list(first)
+    stats = {name: RunningStatistics().update(np.broadcast_to(first[name], (chunks[0][1],)))
+             for name in names}
+    pending = deque(chunks[1:])
+
+    if workers and workers > 1 and pending:
+        from concurrent.futures import ProcessPoolExecutor
+        from multiprocessing.shared_memory import SharedMemory
+        # Performance Optimization: Workers write their outputs straight into a small ring of
+        # shared-memory slots instead of pickling arrays back, and the parent folds each slot into
+        # the running statistics before reusing it, so only `2 * workers` chunks are ever resident.
+        # Chunks are folded in submission order, which keeps the result independent of scheduling.
+        slots = 2 * workers
+        shape = (slots, len(names), chunk_size)
+        memory = SharedMemory(create=True, size=int(np.prod(shape)) * 8)
+        try:
+            buffer = np.ndarray(shape, dtype=float, buffer=memory.buf)
+            with ProcessPoolExecutor(max_workers=workers, initializer=_attach_buffer,
+                                     initargs=(memory.name, shape)) as pool:
+                free = deque(range(slots))
+                running = deque()
+                while pending or running:
+                    while pending and free:
+                        index, count = pending.popleft()
+                        slot = free.popleft()
+                        running.append((pool.submit(_run_chunk, model, inputs, names, count,
+                                                    entropy, index, slot), slot))
+                    future, slot = running.popleft()
+                    count = future.result()
+                    for j, name in enumerate(names):
+                        stats[name].update(buffer[slot, j, :count])
+                    free.append(slot)
+            del buffer
+        finally:
+            memory.close()
+            memory.unlink()
+    else:
+        for index, count in pending:
+            for name, values in zip(names, _evaluate_chunk(model, inputs, names, count, entropy, index)):
+                stats[name].update(values)
+
+    return {name: stats[name].summary(percentiles) for name in names}
@@ -0,0 +1,55 @@
+// Client for the binary array format of the Oberth API.
+//
+// Layout: 'OBTH', uint32 little-endian header length, a JSON header
+// {dtype, arrays: [{name, shape, offset}], meta}, then each array as little-endian floats at
+// an 8-byte aligned offset from the end of the header.
+
+function decodeArrays(buffer) {
+    const magic = String.fromCharCode(...new Uint8Array(buffer, 0, 4));
+    if (magic !== 'OBTH') throw new Error('Unexpected array payload');
+
+    const headerLength = new DataView(buffer).getUint32(4, true);
+    const header = JSON.parse(new TextDecoder().decode(new Uint8Array(buffer, 8, headerLength)));
+    const dataStart = 8 + headerLength;
+    const ArrayType = header.dtype === '<f4' ? Float32Array : Float64Array;
+
+    // Performance Boost: Typed arrays are views onto the response buffer itself, so decoding
+    // neither parses text nor copies the data (typed arrays use the platform byte order,
+    // little-endian on every mainstream browser).
+    const arrays = {};
+    for (const entry of header.arrays) {
+        const length = entry.shape.reduce((a, b) => a * b, 1);
+        arrays[entry.name] = new ArrayType(buffer, dataStart + entry.offset, length);
+    }
+    return {arrays, meta: header.meta};
+}
+
+// Decoded results of recent requests with their ETags; repeats (e.g. a slider moved back and
+// forth) are revalidated with If-None-Match and reuse the decoded arrays on a 304.
+const arrayCache = new Map();
+const ARRAY_CACHE_ENTRIES = 32;
+
+async function fetchArrays(url, payload, dtype = 'float32') {
+    const body = JSON.stringify(payload);
+    const cacheKey = `${url} ${dtype} ${body}`;
+    const cached = arrayCache.get(cacheKey);
+    const headers = {
+        'Content-Type': 'application/json',
+        'Accept': `application/octet-stream; dtype=${dtype}`
+    };
+    if (cached) headers['If-None-Match'] = cached.etag;
+
+    const response = await fetch(url, {method: 'POST', headers, body});
+
+    if (response.status === 304 && cached) return cached.result;
+    if (!response.ok) throw new Error('API Request failed');
+
+    const result = decodeArrays(await response.arrayBuffer());
+    const etag = response.headers.get('ETag');
+    if (etag) {
+        arrayCache.delete(cacheKey);
+        arrayCache.set(cacheKey, {etag, result});
+        if (arrayCache.size > ARRAY_CACHE_ENTRIES) arrayCache.delete(arrayCache.keys().next().value);
+    }
+    return result;
+}
@@ -0,0 +1,257 @@
+import io
+import json
+import struct
+
+import numpy as np
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+from fastapi.testclient import TestClient
+
+from api.index import app
+
+client = TestClient(app)
+
+def decode_raw(body):
+    """Decodes the raw OBTH payload into {name: array} and its metadata."""
+    magic, length = struct.unpack_from('<4sI', body)
+    assert magic == b'OBTH'
+    header = json.loads(body[8:8 + length])
+    start = 8 + length
+    arrays = {
+        entry['name']: np.frombuffer(body, header['dtype'], int(np.prod(entry['shape'])),
+                                     start + entry['offset']).reshape(entry['shape'])
+        for entry in header['arrays']
+    }
+    return arrays, header['meta']
+
+def test_nozzle_binary_formats_match_json():
+    """
+    E2E Test: The binary encodings of /api/nozzle carry the same contour and mesh as the JSON
+    response, and cached responses stay valid when gzipped repeatedly.
+    """
+    request = {'expansion_ratio': 25.0, 'gamma': 1.2, 'lines': 30}
+    for _ in range(2):
+        reference = client.post('/api/nozzle', json=request, headers={'Accept-Encoding': 'gzip'})
+        assert reference.headers['content-type'] == 'application/json'
+    reference = reference.json()
+
+    raw = client.post('/api/nozzle', json=request,
+                      headers={'Accept': 'application/octet-stream; dtype=float32'})
+    assert raw.headers['content-type'] == 'application/octet-stream'
+    arrays, _ = decode_raw(raw.content)
+    assert arrays['mesh'].dtype == np.float32 and arrays['mesh'].shape == (30 * 31, 4)
+    assert np.allclose(arrays['contour'], reference['contour'], atol=1e-4)
+    assert np.allclose(arrays['mesh'], reference['mesh'], atol=1e-4)
+
+    npy = client.post('/api/nozzle', json=request, headers={'Accept': 'application/x-npy'})
+    assert npy.headers['x-oberth-arrays'] == 'contour,mesh'
+    stream = io.BytesIO(npy.content)
+    contour, mesh = np.load(stream), np.load(stream)
+    assert mesh.dtype == np.float64
+    assert np.allclose(contour, reference['contour'], atol=1e-5)
+
+def test_nozzle_rao_contour():
+    """E2E Test: /api/nozzle serves a Rao parabolic wall of the requested resolution."""
+    body = client.post('/api/nozzle', json={'method': 'rao', 'expansion_ratio': 25.0, 'points': 40}).json()
+    contour = np.array(body['contour'])
+    assert contour.shape == (40, 2) and body['mesh'] == []
+    assert contour[-1, 1] ** 2 == pytest.approx(25.0)
+    assert body['theta_n'] > body['theta_e'] > 0
+
+def test_nozzle_level_of_detail():
+    """E2E Test: /api/nozzle decimates the contour and net to a tolerance or point budget."""
+    full = client.post('/api/nozzle', json={'lines': 120}).json()
+    coarse = client.post('/api/nozzle', json={'lines': 120, 'tolerance': 0.01}).json()
+    assert len(coarse['mesh']) < len(full['mesh']) // 5
+    assert coarse['contour'][0] == full['contour'][0] and coarse['contour'][-1] == full['contour'][-1]
+    contour = np.array(full['contour'])
+    kept = np.array(coarse['contour'])
+    assert np.max(np.abs(np.interp(contour[:, 0], kept[:, 0], kept[:, 1]) - contour[:, 1])) <= 0.01 + 1e-5
+
+    budget = client.post('/api/nozzle', json={'lines': 120, 'max_points': 12}).json()
+    assert len(budget['contour']) == 12
+
+def test_nozzle_export_streams_stl():
+    """E2E Test: /api/nozzle/export streams a binary STL of the revolved wall."""
+    response = client.post('/api/nozzle/export', json={'lines': 40, 'segments': 32})
+    assert response.headers['content-type'] == 'model/stl'
+    count = struct.unpack_from('<I', response.content, 80)[0]
+    assert count == 2 * 32 * 40 + 2 * 32
+    assert len(response.content) == 84 + 50 * count
+
+    obj = client.post('/api/nozzle/export', json={'method': 'rao', 'points': 30, 'format': 'obj', 'segments': 16})
+    assert obj.text.count('\nv ') == 30 * 16 + 2
+    assert client.post('/api/nozzle/export', json={'expansion_ratio': 1.0}).status_code == 422
+
+def test_performance_negotiation():
+    """E2E Test: /api/performance honours Accept preferences and keeps JSON as the default."""
+    json_response = client.post('/api/performance', json={})
+    assert json_response.json()['propellants'] == ['LOX', 'RP-1']
+
+    raw = client.post('/api/performance', json={},
+                      headers={'Accept': 'application/json;q=0.5, application/octet-stream'})
+    arrays, meta = decode_raw(raw.content)
+    assert meta == {'propellants': ['LOX', 'RP-1']}
+    assert arrays['isp'].dtype == np.float64
+    assert np.allclose(arrays['isp'], json_response.json()['isp'], atol=1e-5)
+
+def test_batch_deduplicates_and_isolates_errors():
+    """
+    E2E Test: /api/batch returns results in job order, computes identical jobs once and reports
+    invalid designs per job without failing the batch.
+    """
+    from api.index import _result_cache
+
+    _result_cache.clear()
+    memory = _result_cache.tiers[0]
+    hits = memory.hits
+    jobs = [
+        {'type': 'nozzle', 'params': {'expansion_ratio': 12.0, 'lines': 16}},
+        {'type': 'performance', 'params': {'propellants': ['LOX', 'LH2'], 'of_range': [3.0, 8.0]}},
+        {'type': 'nozzle', 'params': {'expansion_ratio': 12.0, 'lines': 16}},
+        {'type': 'nozzle', 'params': {'lines': 0}},
+        {'type': 'cooling', 'params': {'lines': 16, 'lines_typo': 1, 'pc': 'high'}},
+        {'type': 'cooling', 'params': {'expansion_ratio': 12.0, 'lines': 16}},
+    ]
+    results = client.post('/api/batch', json={'jobs': jobs}).json()['results']
+
+    assert [r['type'] for r in results] == [job['type'] for job in jobs]
+    assert results[0]['error'] is None and results[0]['result'] == results[2]['result']
+    assert results[0]['result'] == client.post('/api/nozzle', json=jobs[0]['params']).json()
+    assert max(results[1]['result']['isp']) == pytest.approx(450.0, rel=1e-3)
+    assert results[3]['result'] is None and 'lines' in results[3]['error']
+    assert results[4]['result'] is None and results[4]['error'].startswith('pc')
+    assert len(results[5]['result']['heat_flux']) == 17
+    # One entry per distinct valid job; the direct request was served from the batch's entry
+    assert len(memory) == 3 and memory.hits == hits + 1
+
+def test_etag_revalidation():
+    """E2E Test: Repeated requests revalidate with If-None-Match and get a bodiless 304."""
+    request = {'expansion_ratio': 30.0, 'lines': 24}
+    first = client.post('/api/nozzle', json=request)
+    etag = first.headers['etag']
+
+    repeat = client.post('/api/nozzle', json=request, headers={'If-None-Match': etag})
+    assert repeat.status_code == 304 and repeat.content == b''
+    assert repeat.headers['etag'] == etag
+
+    # The entity tag depends on the encoding and on the design
+    binary = client.post('/api/nozzle', json=request,
+                         headers={'Accept': 'application/x-npy', 'If-None-Match': etag})
+    assert binary.status_code == 200 and binary.headers['etag'] != etag
+    changed = client.post('/api/nozzle', json={**request, 'lines': 25}, headers={'If-None-Match': etag})
+    assert changed.status_code == 200
+
+def test_sweep_streams_one_line_per_design():
+    """
+    E2E Test: /api/sweep streams NDJSON, one line per design point, with invalid geometries
+    reported in-line.
+    """
+    sweep = {
+        'expansion_ratio': {'start': 10.0, 'stop': 40.0, 'num': 3},
+        'lines': {'start': 0, 'stop': 12, 'num': 2},
+        'pc': {'start': 5e6, 'stop': 2e7, 'num': 4},
+        'of': {'start': 2.0, 'stop': 2.6, 'num': 5},
+    }
+    with client.stream('POST', '/api/sweep', json=sweep) as response:
+        assert response.headers['content-type'] == 'application/x-ndjson'
+        assert 'content-encoding' not in response.headers
+        points = [json.loads(line) for line in response.iter_lines() if line]
+
+    errors = [p for p in points if 'error' in p]
+    designs = [p for p in points if 'error' not in p]
+    assert len(errors) == 3 and all(p['lines'] == 0 for p in errors)
+    assert len(designs) == 3 * 4 * 5
+    assert all(p['lines'] == 12 for p in designs)
+    best = max(designs, key=lambda p: p['isp'])
+    assert best['of'] == pytest.approx(2.3) and best['isp'] == pytest.approx(320.0, rel=1e-3)
+    for point in designs:
+        assert point['exit_radius'] ** 2 == pytest.approx(point['expansion_ratio'], rel=1e-2)
+        assert 0 < point['exit_pressure'] < point['pc']
+
+def test_warm_cache_snapshot_serves_without_solving(tmp_path, monkeypatch):
+    """E2E Test: Designs in a warm-cache snapshot are served without running the solver."""
+    import api.index as api
+    from oberth.cache import MemoryCache, SnapshotCache, TieredCache
+
+    path = str(tmp_path / 'warm.sqlite')
+    design = {'expansion_ratio': 40.0, 'gamma': 1.2, 'lines': 18}
+    assert api.build_snapshot(path, [('nozzle', design)], ('json',)) == 1
+    expected = client.post('/api/nozzle', json=design).json()
+
+    def unavailable(params):
+        raise AssertionError('solver should not run for a snapshot design')
+
+    monkeypatch.setattr(api, '_result_cache', TieredCache([MemoryCache(), SnapshotCache(path)]))
+    monkeypatch.setitem(api._ENDPOINTS, 'nozzle', (api.NozzleRequest, unavailable))
+    assert client.post('/api/nozzle', json=design).json() == expected
+
+def test_server_timing_and_metrics():
+    """
+    E2E Test: Responses report their phases in Server-Timing, and /api/metrics exposes latency
+    histograms and cache counters in Prometheus format.
+    """
+    request = {'expansion_ratio': 33.0, 'gamma': 1.2, 'lines': 17}
+    miss = client.post('/api/nozzle', json=request)
+    phases = dict(item.strip().split(';dur=') for item in miss.headers['server-timing'].split(','))
+    assert {'cache', 'solve', 'tolist', 'dumps', 'app', 'total'} <= set(phases)
+    assert float(phases['solve']) <= float(phases['app']) <= float(phases['total'])
+
+    hit = client.post('/api/nozzle', json=request)
+    assert 'solve' not in hit.headers['server-timing']
+
+    # Batch jobs run on a thread pool and still report their phases
+    batch = client.post('/api/batch', json={'jobs': [
+        {'type': 'nozzle', 'params': {'expansion_ratio': 34.0, 'gamma': 1.2, 'lines': 17}},
+        {'type': 'cooling', 'params': {'expansion_ratio': 35.0, 'gamma': 1.2, 'lines': 17}}]})
+    assert batch.status_code == 200
+    phases = dict(item.strip().split(';dur=') for item in batch.headers['server-timing'].split(','))
+    assert {'cache', 'solve', 'tolist', 'dumps', 'app', 'total'} <= set(phases)
+
+    text = client.get('/api/metrics').text
+    samples = dict(line.rsplit(' ', 1) for line in text.splitlines() if not line.startswith('#'))
+    assert float(samples['oberth_request_duration_seconds_count{endpoint="/api/nozzle",status="200"}']) >= 2
+    assert samples['oberth_request_duration_seconds_bucket{endpoint="/api/nozzle",status="200",le="+Inf"}'] == \
+        samples['oberth_request_duration_seconds_count{endpoint="/api/nozzle",status="200"}']
+    assert float(samples['oberth_cache_hits_total{tier="MemoryCache"}']) >= 1
+    assert 'oberth_payload_size_bytes_count{kind="nozzle",encoding="json"}' in samples
+    assert float(samples['oberth_solver_pool_idle']) >= 1
+    assert float(samples['oberth_solver_pool_bytes']) > 0
+
+def test_performance_equilibrium_map():
+    """E2E Test: /api/performance serves an (O/F, pc) equilibrium map in one request."""
+    request = {'model': 'equilibrium', 'pc_range': [20e5, 200e5], 'pc_points': 4}
+    response = client.post('/api/performance', json=request,
+                           headers={'Accept': 'application/octet-stream; dtype=float64'})
+    arrays, meta = decode_raw(response.content)
+    assert meta['model'] == 'equilibrium'
+    assert arrays['tc'].shape == arrays['isp'].shape == (50, 4)
+    assert np.allclose(arrays['pc'], np.geomspace(20e5, 200e5, 4))
+    assert np.all(np.isfinite(arrays['cstar'])) and 3400 < arrays['tc'].max() < 4000
+
+def test_invalid_geometry_is_rejected():
+    """E2E Test: Out-of-range nozzle parameters get a 422 instead of reaching the solver."""
+    for request in ({'lines': 0}, {'lines': -5}, {'lines': 3000}, {'gamma': 1.0}, {'gamma': 0.9},
+                    {'expansion_ratio': 0}):
+        assert client.post('/api/nozzle', json=request).status_code == 422
+        assert client.post('/api/cooling', json=request).status_code == 422
+    for name in ('pc', 'c_star', 'diameter_throat', 'radius_curvature', 'chamber_temperature', 'wall_temperature'):
+        for value in (0, -1.0):
+            assert client.post('/api/cooling', json={name: value}).status_code == 422
+    sweep = {'lines': {'start': 20, 'stop': 5000, 'num': 2}}
+    assert client.post('/api/sweep', json=sweep).status_code == 422
+
+def test_sweep_rejects_unbounded_ranges():
+    """E2E Test: Swept axes need between 1 and _SWEEP_MAX_NUM values."""
+    from api.index import _SWEEP_MAX_NUM
+    for num in (0, _SWEEP_MAX_NUM + 1):
+        assert client.post('/api/sweep', json={'pc': {'start': 5e6, 'stop': 2e7, 'num': num}}).status_code == 422
+
+def test_performance_rejects_invalid_input():
+    """E2E Test: Malformed ranges and propellants the solver rejects get a 422."""
+    for request in ({'of_range': [2.0]}, {'pc_range': [1e6]}, {'pc_range': [1e6, 2e6, 3e6]},
+                    {'pc_range': [-1e6, 1e7]}, {'propellants': ['LOX']},
+                    {'model': 'equilibrium', 'propellants': ['LOX', 'XYZ']}):
+        assert client.post('/api/performance', json=request).status_code == 422
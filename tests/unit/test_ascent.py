@@ -0,0 +1,40 @@
+import pytest
+import numpy as np
+from oberth.atmosphere import standard_atmosphere
+from oberth.ascent import simulate_ascent
+from oberth.mission import Vehicle
+
+VEHICLE = Vehicle.from_stage_masses([280, 340], [100000, 20000], [8000, 2000], payload=1000)
+THRUST = [1.8e6, 2.5e5]
+
+def test_standard_atmosphere_table():
+    """Verifies the tabulated atmosphere against U.S. Standard Atmosphere 1976 values."""
+    pressure, density, temperature = standard_atmosphere([0.0, 11000.0, 50000.0, 400e3])
+    assert pressure[0] == pytest.approx(101325.0)
+    assert density[0] == pytest.approx(1.225, rel=1e-3)
+    assert pressure[1] == pytest.approx(22700.0, rel=5e-3)
+    assert temperature[1] == pytest.approx(216.8, abs=0.5)
+    assert pressure[2] == pytest.approx(79.8, rel=1e-2)
+    assert pressure[3] == 0.0 and density[3] == 0.0
+
+def test_ascent_batch_matches_single_and_closes_energy_balance():
+    """
+    Verifies that each trajectory of a batch matches its own run and that the ideal delta-v
+    minus the gravity, drag and back-pressure losses reproduces the burnout speed.
+    """
+    kicks = np.radians([1.0, 1.5])
+    batch = simulate_ascent(VEHICLE, THRUST, exit_area=[1.0, 0.0], pitch_kick=kicks, dt=0.1)
+    single = simulate_ascent(VEHICLE, THRUST, exit_area=[1.0, 0.0], pitch_kick=kicks[1], dt=0.1)
+    assert batch['burnout_speed'][1] == pytest.approx(single['burnout_speed'][0], rel=1e-12)
+    assert not batch['crashed'].any()
+
+    losses = batch['gravity_loss'] + batch['drag_loss'] + batch['pressure_loss']
+    assert np.allclose(batch['ideal_delta_v'] - losses, batch['burnout_speed'], atol=5.0)
+    assert np.all(batch['pressure_loss'] > 0)
+    assert np.all(batch['burnout_altitude'] > 50e3)
+
+def test_ascent_underpowered_vehicle_crashes():
+    """Verifies that a vehicle with thrust below its weight never leaves the pad."""
+    result = simulate_ascent(VEHICLE, [1.0e6, 2.5e5], pitch_kick=[0.02, 0.05], t_max=60.0)
+    assert result['crashed'].all()
+    assert np.all(result['altitude'] <= 1.0)
@@ -0,0 +1,36 @@
+from benchmarks.harness import CALIBRATION, compare, over_budget, time_case
+
+def _run(calibration, **cases):
+    results = {name: {'seconds': seconds, 'spread': 0.05} for name, seconds in cases.items()}
+    results[CALIBRATION] = {'seconds': calibration, 'spread': 0.0}
+    return {'results': results}
+
+def test_compare_flags_regressions_after_machine_normalization():
+    """
+    Verifies that a uniformly slower machine is not flagged, while one case slowing down beyond
+    tolerance plus its recorded noise is.
+    """
+    baseline = _run(1.0, fast=1.0, slow=2.0)
+    slower_machine = _run(2.0, fast=2.0, slow=4.0)
+    assert not any(regressed for _, _, regressed in compare(slower_machine, baseline, 0.25))
+
+    regression = _run(1.0, fast=1.25, slow=3.0)
+    rows = {name: (ratio, regressed) for name, ratio, regressed in compare(regression, baseline, 0.25)}
+    assert rows['fast'] == (1.25, False)
+    assert rows['slow'] == (1.5, True)
+    assert compare(regression, baseline, 0.25, normalize=False)[1][2]
+
+def test_time_case_reports_per_call_time():
+    """Verifies that batches are sized to the minimum duration and timed per call."""
+    calls = []
+    result = time_case(lambda: calls.append(None), min_batch_seconds=1e-3, repeats=3)
+    assert result['loops'] > 1 and len(calls) >= 3 * result['loops']
+    assert 0.0 < result['seconds'] < 1e-3 and result['spread'] >= 0.0
+
+def test_budgets_are_absolute_and_normalized():
+    """Verifies that budgets flag slow cases on the baseline machine's scale, whatever the baseline."""
+    baseline = _run(1.0, scalar=5.0)
+    assert over_budget(_run(1.0, scalar=2.0), {'scalar': 1.5}, baseline) == [('scalar', 2.0, 1.5)]
+    # Twice as slow a machine: 2.0 measured is 1.0 on the baseline's
+    assert over_budget(_run(2.0, scalar=2.0), {'scalar': 1.5}, baseline) == []
+    assert over_budget(_run(2.0, scalar=2.0), {'scalar': 1.5}) == [('scalar', 2.0, 1.5)]
@@ -0,0 +1,56 @@
+from oberth.cache import MemoryCache, SQLiteCache, TieredCache, cache_key, source_fingerprint
+
+def test_memory_cache_is_bounded_by_bytes():
+    """Verifies LRU eviction by total value size rather than entry count."""
+    cache = MemoryCache(max_bytes=100)
+    cache.set('a', b'x' * 40)
+    cache.set('b', b'y' * 40)
+    assert cache.get('a') == b'x' * 40          # 'a' becomes the most recent entry
+    cache.set('c', b'z' * 40)                   # evicts 'b', the least recently used
+    assert cache.get('b') is None
+    assert cache.size_bytes == 80 and len(cache) == 2
+    cache.set('huge', b'h' * 101)               # larger than the whole budget: not stored
+    assert cache.get('huge') is None and cache.get('c') is not None
+
+def test_memory_cache_sizes_objects():
+    """Verifies that `sizeof` bounds non-bytes values such as arrays."""
+    import numpy as np
+    cache = MemoryCache(max_bytes=1000, sizeof=lambda value: value.nbytes)
+    cache.set('a', np.zeros(60))
+    cache.set('b', np.zeros(60))                # 960 bytes in total
+    assert cache.size_bytes == 960 and len(cache) == 2
+    cache.set('c', np.zeros(60))                # evicts 'a'
+    assert cache.get('a') is None and cache.size_bytes == 960
+    cache.set('c', np.zeros(10))                # replacing an entry releases its old size
+    assert cache.size_bytes == 560
+
+def test_sqlite_tier_is_shared_and_promoted(tmp_path):
+    """Verifies that a second process-level cache sees SQLite entries and promotes them."""
+    path = str(tmp_path / 'cache.sqlite')
+    key = cache_key('nozzle:json', {'expansion_ratio': 25.0, 'lines': 20})
+    assert key == cache_key('nozzle:json', {'lines': 20, 'expansion_ratio': 25.0})
+
+    writer = TieredCache([MemoryCache(), SQLiteCache(path, max_bytes=1000)])
+    writer.set(key, b'payload')
+
+    reader_memory = MemoryCache()
+    reader = TieredCache([reader_memory, SQLiteCache(path, max_bytes=1000)])
+    assert reader.get(key) == b'payload'
+    assert reader_memory.get(key) == b'payload'
+
+    for i in range(5):
+        writer.set(f'filler{i}', b'f' * 300)
+    assert writer.tiers[1].stats()['bytes'] <= 1000
+
+def test_source_fingerprint_tracks_contents(tmp_path):
+    package = tmp_path / 'package'
+    (package / 'data').mkdir(parents=True)
+    (package / 'solver.py').write_text('A = 1\n')
+    (package / 'data' / 'table.npy').write_bytes(b'\x00\x01')
+    (package / 'notes.txt').write_text('ignored')
+    first = source_fingerprint([str(package)])
+
+    (package / 'notes.txt').write_text('still ignored')
+    assert source_fingerprint([str(package)]) == first
+    (package / 'data' / 'table.npy').write_bytes(b'\x00\x02')
+    assert source_fingerprint([str(package)]) != first
@@ -50,3 +50,71 @@ def test_scan_mixture_ratio_hydrogen():
     # LH2 peak is around 5.0 (in this simplified model)
     assert 4.5 < peak_of < 5.5
     assert max(engine.results['isp']) > 400
+
+def test_scan_mixture_ratio_batch_matches_single_scans():
+    # Each row of the batched block must equal the corresponding single-design scan
+    designs = [(['LOX', 'RP-1'], [1.0, 4.0]), (['LOX', 'LH2'], [3.0, 7.0]), (['LOX', 'LCH4'], [2.0, 4.0])]
+    batch = RocketPerformance().scan_mixture_ratio_batch(
+        [pair for pair, _ in designs],
+        [of_range for _, of_range in designs]
+    )
+
+    assert batch.results['of'].shape == (3, 50)
+    assert batch.results['isp'].shape == (3, 50)
+
+    for row, (pair, of_range) in enumerate(designs):
+        single = RocketPerformance().scan_mixture_ratio(pair, of_range)
+        np.testing.assert_allclose(batch.results['of'][row], single.results['of'])
+        np.testing.assert_allclose(batch.results['isp'][row], single.results['isp'])
+
+def test_scan_mixture_ratio_batch_shared_propellants():
+    of_ranges = np.column_stack([np.linspace(1.0, 2.0, 1000), np.linspace(3.0, 4.0, 1000)])
+    engine = RocketPerformance().scan_mixture_ratio_batch(['LOX', 'RP-1'], of_ranges)
+
+    assert engine.results['isp'].shape == (1000, 50)
+    assert np.all(engine.results['isp'] <= 320)
+
+def test_scan_equilibrium_performance_map():
+    """Verifies the equilibrium Isp map: (O/F, pc) shape and an O/F optimum near 2.3-2.5."""
+    engine = RocketPerformance(pc=70e5, pe=1e5)
+    results = engine.scan_equilibrium(['LOX', 'RP-1'], [1.5, 3.5], pc=[50e5, 100e5]).results
+    assert results['isp'].shape == (50, 2)
+    assert results['converged'].all()
+    best = results['of'][np.argmax(results['isp'], axis=0)]
+    assert np.all((best > 2.1) & (best < 2.6))
+    # More expansion (higher pc for the same exit pressure) always gains Isp
+    assert np.all(results['isp'][:, 1] > results['isp'][:, 0])
+    assert 280 < results['isp'].max() < 330
+
+def test_optimize_mixture_ratio():
+    """Verifies the bracketing search lands on the curve peak within tolerance in few evaluations."""
+    engine = RocketPerformance()
+    optimum = engine.optimize_mixture_ratio(['LOX', 'RP-1'], [1.0, 8.0], tolerance=0.01)
+    assert abs(optimum['of'] - 2.3) < 0.01
+    assert optimum['bracket'][0] <= optimum['of'] <= optimum['bracket'][1]
+    # A uniform grid at the same resolution would take 700 points
+    assert optimum['evaluations'] < 60
+
+    # Equilibrium model: matches a fine brute-force scan of the same Isp
+    engine = RocketPerformance(pc=70e5, pe=1e5)
+    optimum = engine.optimize_mixture_ratio(['LOX', 'RP-1'], [1.5, 3.5], tolerance=0.005, model='equilibrium')
+    brute = engine.scan_equilibrium(['LOX', 'RP-1'], [2.2, 2.6]).results
+    assert abs(optimum['of'] - brute['of'][np.argmax(brute['isp'])]) < 0.01
+    assert optimum['isp'] >= brute['isp'].max() - 1e-6
+    assert 3400 < optimum['tc'] < 3800
+
+def test_adaptive_scan_refines_around_peak():
+    engine = RocketPerformance(pc=70e5, pe=1e5)
+    results = engine.scan_equilibrium(['LOX', 'RP-1'], [1.5, 3.5], adaptive=True, tolerance=0.01).results
+    of = results['of']
+    assert np.all(np.diff(of) > 0)
+    assert results['evaluations'] == len(of) < 50
+    # Spacing at the peak reaches the tolerance while the flanks stay coarse
+    peak = np.argmax(results['isp'])
+    assert np.diff(of)[max(peak - 1, 0)] <= 0.01
+    assert np.diff(of).max() > 0.1
+    assert abs(of[peak] - 2.37) < 0.02
+
+    # Fitted curve model
+    curve = engine.scan_mixture_ratio(['LOX', 'LH2'], [3.0, 7.0], adaptive=True).results
+    assert abs(curve['of'][np.argmax(curve['isp'])] - 5.0) < 0.01
@@ -0,0 +1,87 @@
+import pytest
+import numpy as np
+from oberth.cooling import bartz_equation, bartz_profile, regenerative_cooling
+from oberth.nozzle import MethodOfCharacteristics
+
+PROP_DATA = {'viscosity': 8e-5, 'cp': 2500, 'prandtl': 0.8, 'gamma': 1.2}
+
+def test_bartz_profile_matches_scalar_equation():
+    """
+    Verifies that the vectorized profile reproduces the scalar Bartz equation at every station
+    once the sigma correction is divided out.
+    """
+    moc = MethodOfCharacteristics(gamma=1.2, lines=30)
+    moc.solve(expansion_ratio=25)
+    profile = bartz_profile(moc, PROP_DATA, pc=100e5, c_star=1700, diameter_throat=0.1,
+                            radius_curvature=0.05, chamber_temperature=3500, wall_temperature=800)
+
+    expected = [
+        bartz_equation(d, 1.0, PROP_DATA, 100e5, 1700, 0.1, 0.05) for d in profile['diameter']
+    ]
+    assert np.allclose(profile['hg'] / profile['sigma'], expected, rtol=1e-12)
+    assert profile['mach'][0] == 1.0
+    assert profile['diameter'][-1] ** 2 / 0.1 ** 2 == pytest.approx(25, rel=5e-3)
+
+def test_bartz_profile_peaks_upstream_of_throat():
+    """
+    Verifies branch selection on a converging-diverging (x, r) contour: subsonic upstream of the
+    minimum radius, supersonic downstream, and peak heat flux just upstream of the throat.
+    """
+    x = np.linspace(-0.2, 0.5, 701)
+    contour = np.column_stack([x, 1.0 + 3.0 * x * x])
+    profile = bartz_profile(contour, PROP_DATA, pc=100e5, c_star=1700, diameter_throat=0.1,
+                            radius_curvature=0.05, chamber_temperature=3500, wall_temperature=800)
+
+    throat = np.argmin(contour[:, 1])
+    assert np.all(profile['mach'][:throat] < 1.0)
+    assert np.all(profile['mach'][throat + 1:] > 1.0)
+    assert np.argmax(profile['heat_flux']) < throat
+    assert np.all(profile['heat_flux'] > 0)
+
+def test_regenerative_cooling_batch_energy_balance():
+    """
+    Verifies that a batch of channel geometries marches to the same answers as one-at-a-time
+    solves, and that coolant enthalpy rise equals the heat absorbed through the wall.
+    """
+    x = np.linspace(-0.2, 0.5, 351)
+    contour = np.column_stack([x, 1.0 + 3.0 * x * x])
+    profile = bartz_profile(contour, PROP_DATA, pc=100e5, c_star=1700, diameter_throat=0.1,
+                            radius_curvature=0.05, chamber_temperature=3500, wall_temperature=800)
+
+    widths = np.array([1.5e-3, 2e-3, 3e-3])
+    batch = regenerative_cooling(profile, 'RP-1', 5.0, widths, 4e-3, 80, 300.0, 120e5)
+    assert batch['coolant_temperature'].shape == (351, 3)
+    assert batch['valid'].all()
+
+    single = regenerative_cooling(profile, 'RP-1', 5.0, widths[1], 4e-3, 80, 300.0, 120e5)
+    assert np.allclose(single['coolant_temperature'][:, 0], batch['coolant_temperature'][:, 1])
+
+    # Coolant flows from the exit (last station) toward the chamber
+    temperature = batch['coolant_temperature']
+    assert np.all(np.diff(temperature, axis=0) <= 0)
+    assert np.all(np.diff(batch['pressure'], axis=0) >= 0)
+    assert np.all(batch['pressure_drop'] > 0)
+
+    segment = np.hypot(np.diff(profile['x']), 0.5 * np.diff(profile['diameter']))
+    absorbed = (batch['heat_flux'][1:] * (np.pi * profile['diameter'][1:] * segment)[:, None]).sum(axis=0)
+    assert np.allclose(5.0 * 2010 * (batch['outlet_temperature'] - 300.0), absorbed)
+
+def test_regenerative_cooling_design_grid():
+    """
+    Verifies that channel arguments broadcast into a design grid and that every grid point
+    matches its own single-design solve.
+    """
+    x = np.linspace(-0.2, 0.5, 101)
+    contour = np.column_stack([x, 1.0 + 3.0 * x * x])
+    profile = bartz_profile(contour, PROP_DATA, pc=100e5, c_star=1700, diameter_throat=0.1,
+                            radius_curvature=0.05, chamber_temperature=3500, wall_temperature=800)
+
+    widths = np.array([1.5e-3, 2e-3, 3e-3])[:, None]
+    depths = np.array([2e-3, 3e-3, 4e-3, 5e-3])[None, :]
+    grid = regenerative_cooling(profile, 'RP-1', 5.0, widths, depths, 80, 300.0, 120e5)
+    assert grid['coolant_temperature'].shape == (101, 3, 4)
+    assert grid['pressure_drop'].shape == (3, 4) and grid['valid'].shape == (3, 4)
+
+    single = regenerative_cooling(profile, 'RP-1', 5.0, widths[2, 0], depths[0, 1], 80, 300.0, 120e5)
+    assert np.allclose(single['coolant_temperature'][:, 0], grid['coolant_temperature'][:, 2, 1])
+    assert single['pressure_drop'][0] == pytest.approx(grid['pressure_drop'][2, 1])
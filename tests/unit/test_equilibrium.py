@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+from oberth.equilibrium import (
+    R_UNIVERSAL, _STOICHIOMETRY, chamber_performance, load_table, reactant_mixture, solve_equilibrium
+)
+
+def test_water_formation_enthalpy():
+    """NASA-7 data reproduces the standard heat of formation of H2O(g): -241.8 kJ/mol."""
+    from oberth.equilibrium import _species_thermo, _SPECIES
+    _, h_rt, _ = _species_thermo(298.15)
+    h_water = h_rt[_SPECIES.index('H2O')] * R_UNIVERSAL * 298.15
+    assert abs(h_water + 241.8e3) < 100.0
+
+def test_equilibrium_conserves_elements():
+    b0, h0 = reactant_mixture('LOX', 'RP-1', 2.3)
+    eq = solve_equilibrium(b0, 70e5, h0=h0)
+    np.testing.assert_allclose(_STOICHIOMETRY @ eq['n'], b0, rtol=1e-5)
+
+    # LOX/RP-1 at 70 bar, O/F 2.3: Tc ~3570 K, M ~22.5 g/mol (NASA CEA)
+    assert 3450 < eq['T'] < 3700
+    assert 21.5 < eq['mw'] < 23.5
+    assert 1.1 < eq['gamma'] < eq['gamma_frozen']
+
+def test_table_matches_solver_at_grid_node():
+    table = load_table(['LOX', 'LH2'])
+    of = table.of[10]
+    pc = table.pc[6]
+    direct = chamber_performance('LOX', 'LH2', of, pc)
+    tabulated = table.chamber(of, pc)
+    for field in ('tc', 'mw', 'gamma', 'cstar'):
+        assert tabulated[field] == pytest.approx(direct[field], rel=1e-9)
+
+def test_table_lookup_broadcasts():
+    table = load_table(['RP-1', 'LOX'])
+    of = np.linspace(1.8, 3.0, 25)
+    isp = table.isp(of[:, None], 70e5, np.array([10.0, 40.0, 100.0]))
+    assert isp.shape == (25, 3)
+    # Larger expansion always delivers more vacuum Isp
+    assert np.all(np.diff(isp, axis=1) > 0)
+    assert 300 < isp.max() < 400
+
+def test_flame_temperature_grid_matches_scalar_solver():
+    """
+    Verifies that the vectorized (O/F x pc) solve reproduces point-by-point equilibrium, and
+    that higher chamber pressure suppresses dissociation (hotter flame).
+    """
+    from oberth.equilibrium import adiabatic_flame_temperature
+    of = np.array([1.6, 2.3, 3.2])
+    pc = np.array([10e5, 100e5])
+    grid = adiabatic_flame_temperature(['RP-1', 'LOX'], of[:, None], pc)
+    assert grid['tc'].shape == (3, 2) and grid['converged'].all()
+    for i, j in np.ndindex(3, 2):
+        point = chamber_performance('LOX', 'RP-1', of[i], pc[j])
+        for field in ('tc', 'mw', 'gamma', 'cstar'):
+            assert grid[field][i, j] == pytest.approx(point[field], rel=1e-10)
+    assert np.all(grid['tc'][:, 1] > grid['tc'][:, 0])
+
+def test_flame_temperature_singular_points_are_nan():
+    # O/F 1.0 is too fuel-rich for gas-phase products alone: that point fails, the others solve
+    from oberth.equilibrium import adiabatic_flame_temperature
+    grid = adiabatic_flame_temperature(['LOX', 'RP-1'], np.array([1.0, 2.3]), 70e5)
+    assert grid['converged'].tolist() == [False, True]
+    assert np.isnan(grid['tc'][0]) and 3400 < grid['tc'][1] < 3800
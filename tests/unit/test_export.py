@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from oberth.export import facet_count, iter_obj, iter_stl, read_stl, revolve, write_obj, write_stl
+from oberth.nozzle import rao_contour
+
+def test_revolve_is_watertight_and_outward():
+    """
+    Verifies that the capped surface closes: every directed edge appears once (each edge is
+    shared by two consistently wound triangles) and the enclosed volume is positive and
+    matches the integral of pi r^2 dx.
+    """
+    contour = rao_contour(25, points=80)
+    vertices, faces = revolve(contour, segments=96)
+    assert len(faces) == facet_count(contour, 96)
+
+    edges = np.concatenate([faces[:, [0, 1]], faces[:, [1, 2]], faces[:, [2, 0]]])
+    _, counts = np.unique(edges, axis=0, return_counts=True)
+    assert counts.max() == 1
+    assert len(edges) == 2 * len(np.unique(np.sort(edges, axis=1), axis=0))
+
+    corners = vertices[faces]
+    volume = np.einsum('ij,ij->i', corners[:, 0], np.cross(corners[:, 1], corners[:, 2])).sum() / 6.0
+    x, r = contour[:, 0], contour[:, 1]
+    exact = np.sum(np.pi / 3.0 * np.diff(x) * (r[:-1] ** 2 + r[:-1] * r[1:] + r[1:] ** 2))
+    assert volume == pytest.approx(exact, rel=2e-3)
+
+def test_stl_writers_agree(tmp_path):
+    contour = rao_contour(25, points=50)
+    whole, chunked = tmp_path / 'whole.stl', tmp_path / 'chunked.stl'
+    count = write_stl(str(whole), contour, segments=24)
+    write_stl(str(chunked), contour, segments=24, chunk_rows=7)
+
+    records = read_stl(str(whole))
+    assert len(records) == count and whole.stat().st_size == 84 + 50 * count
+    vertices, faces = revolve(contour, segments=24)
+    np.testing.assert_allclose(records['vertices'], vertices[faces], rtol=1e-6)
+    np.testing.assert_allclose(np.linalg.norm(records['normal'], axis=1), 1.0, rtol=1e-6)
+
+    # Chunked output holds the same facets and equals the stream
+    streamed = b''.join(bytes(chunk) for chunk in iter_stl(contour, segments=24, chunk_rows=7))
+    assert chunked.read_bytes() == streamed
+    def key(facets):
+        return np.sort(facets['vertices'].reshape(len(facets), -1), axis=0)
+    np.testing.assert_array_equal(key(read_stl(str(chunked))), key(records))
+
+def test_obj_matches_revolve(tmp_path):
+    contour = rao_contour(10, points=12)
+    path = tmp_path / 'nozzle.obj'
+    write_obj(str(path), contour, segments=8, chunk_rows=5)
+    lines = path.read_text().splitlines()
+    vertices = np.array([line.split()[1:] for line in lines if line.startswith('v ')], dtype=float)
+    faces = np.array([line.split()[1:] for line in lines if line.startswith('f ')], dtype=int) - 1
+    expected_vertices, expected_faces = revolve(contour, segments=8)
+    np.testing.assert_allclose(vertices, expected_vertices, atol=1e-8)
+    assert sorted(map(tuple, faces)) == sorted(map(tuple, expected_faces))
+    assert ''.join(iter_obj(contour, segments=8, chunk_rows=5)) == path.read_text()
@@ -1,6 +1,44 @@
+import pytest
+
 def test_area_mach_relation():
     """Verifies the Area-Mach number relation A/A* for isentropic flow."""
     from oberth.nozzle import isentropic_area_ratio
     # For Gamma=1.4, M=2.0, A/A* should be ~1.6875 (Anderson Table A.1)
     area_ratio = isentropic_area_ratio(mach=2.0, gamma=1.4)
     assert abs(area_ratio - 1.6875) < 1e-4
+    # Python numbers stay on the scalar path; arrays go to the vectorized relation
+    assert type(area_ratio) is float
+    assert isentropic_area_ratio([1.0, 2.0], 1.4) == pytest.approx([1.0, 1.6875], abs=1e-4)
+
+def test_isentropic_ratios_broadcast():
+    """Verifies the array-native property ratios against Anderson Table A.1 (Gamma=1.4)."""
+    import numpy as np
+    from oberth.isentropic import area_ratio, pressure_ratio, temperature_ratio, density_ratio
+    mach = np.array([0.0, 1.0, 2.0])
+    assert np.allclose(temperature_ratio(mach, 1.4), [1.0, 0.8333, 0.5556], atol=1e-4)
+    assert np.allclose(pressure_ratio(mach, 1.4), [1.0, 0.5283, 0.1278], atol=1e-4)
+    assert np.allclose(density_ratio(mach, 1.4), [1.0, 0.6339, 0.2300], atol=1e-4)
+    ratios = area_ratio(mach[:, None], np.array([1.2, 1.4]))
+    assert ratios.shape == (3, 2)
+    assert np.isinf(ratios[0]).all()
+    assert np.allclose(ratios[1], 1.0)
+
+def test_mach_from_area_ratio_round_trip():
+    """Verifies that the vectorized inverse recovers both branches of the Area-Mach relation."""
+    import numpy as np
+    from oberth.isentropic import area_ratio, mach_from_area_ratio
+    mach = np.concatenate([np.linspace(0.05, 0.99, 50), np.linspace(1.01, 12.0, 50)])
+    gamma = np.linspace(1.1, 1.67, 100)
+    recovered = mach_from_area_ratio(area_ratio(mach, gamma), gamma, supersonic=mach > 1.0)
+    assert np.allclose(recovered, mach, rtol=1e-10)
+    assert mach_from_area_ratio(1.0, 1.4) == 1.0
+    assert np.isnan(mach_from_area_ratio(0.5, 1.4))
+
+def test_prandtl_meyer_inverse():
+    """Verifies the Prandtl-Meyer angle (Gamma=1.4, M=2 -> 26.38 deg) and its inverse."""
+    import numpy as np
+    from oberth.isentropic import prandtl_meyer, mach_from_prandtl_meyer
+    assert abs(np.degrees(prandtl_meyer(2.0, 1.4)) - 26.38) < 1e-2
+    mach = np.array([1.1, 2.0, 5.0])
+    gamma = np.array([1.4, 1.2, 1.4])
+    assert np.allclose(mach_from_prandtl_meyer(prandtl_meyer(mach, gamma), gamma), mach, rtol=1e-10)
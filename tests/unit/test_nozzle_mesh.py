@@ -4,47 +4,181 @@ from oberth.nozzle import MethodOfCharacteristics
 
 def test_mesh_generation_unique_lines():
     """
-    Verifies that the generated mesh lines are unique, even when the requested
-    number of lines exceeds the resolution of the contour.
+    Verifies that the characteristic net has one segment per C- and C+ link and
+    that no segment is duplicated.
     """
-    # Create an instance with a large number of requested lines
     lines_requested = 200
     moc = MethodOfCharacteristics(lines=lines_requested)
-
-    # Solve to generate mesh
     moc.solve()
 
-    mesh = moc.mesh
+    mesh = moc.mesh_array
 
-    # Extract end points of the mesh lines
-    # mesh format: list of endpoints [x, y]
-    # we know start points are implicitly (0,0) due to optimization, so we check end points
-    end_points = [(line[0], line[1]) for line in mesh]
+    # mesh format: one [x1, y1, x2, y2] row per characteristic segment
+    assert mesh.shape == (lines_requested * (lines_requested + 1), 4)
+    assert np.all(np.isfinite(mesh))
 
-    # Check for uniqueness
-    unique_end_points = set(end_points)
+    unique_segments = np.unique(mesh, axis=0)
+    assert len(unique_segments) == len(mesh), f"Expected {len(mesh)} unique segments, but got {len(unique_segments)}"
 
-    # Assert that we don't have duplicate lines
-    assert len(mesh) == len(unique_end_points), f"Expected {len(unique_end_points)} unique lines, but got {len(mesh)}"
+@pytest.mark.parametrize("expansion_ratio", [1.5, 25, 200])
+def test_wall_contour_matches_expansion_ratio(expansion_ratio):
+    """
+    Verifies that the wall traced by the net is monotone and that its exit radius
+    reproduces the requested area ratio (throat radius = 1).
+    """
+    lines_requested = 60
+    moc = MethodOfCharacteristics(gamma=1.2, lines=lines_requested)
+    contour = np.asarray(moc.solve(expansion_ratio))
 
-    # Assert that the number of lines is capped by the resolution (100 points in contour)
-    # The current implementation uses 100 points for x
-    assert len(mesh) <= 100, f"Expected at most 100 lines, but got {len(mesh)}"
+    assert contour.shape == (lines_requested + 1, 2)
+    assert tuple(contour[0]) == (0.0, 1.0)
+    assert np.all(np.diff(contour[:, 0]) > 0)
+    assert np.all(np.diff(contour[:, 1]) >= 0)
+    assert contour[-1, 1] ** 2 == pytest.approx(expansion_ratio, rel=5e-3)
 
 def test_mesh_generation_lines_edge_case():
     """
-    Verifies that mesh lines are unique for edge cases like lines=99,
-    where floating point arithmetic might cause duplicates if not handled.
+    Verifies that a single-line net still produces a valid wall and mesh.
     """
-    lines_requested = 99
-    moc = MethodOfCharacteristics(lines=lines_requested)
-
+    moc = MethodOfCharacteristics(lines=1)
     moc.solve()
-    mesh = moc.mesh
 
-    end_points = [(line[0], line[1]) for line in mesh]
-    unique_end_points = set(end_points)
+    assert moc.mesh_array.shape == (2, 4)
+    assert moc.contour_array.shape == (2, 2)
+    assert moc.contour_array[-1, 1] ** 2 == pytest.approx(25, rel=5e-3)
+
+def test_compute_results_do_not_alias():
+    """
+    Verifies that `compute` leaves earlier results intact, honours `out` buffers and returns
+    read-only arrays.
+    """
+    moc = MethodOfCharacteristics(gamma=1.2, lines=40)
+    first = moc.compute(25)
+    kept = first.contour.copy()
+    second = moc.compute(100)
+    np.testing.assert_array_equal(first.contour, kept)
+    assert second.contour[-1, 1] ** 2 == pytest.approx(100, rel=5e-3)
+    assert not first.contour.flags.writeable and not first.mesh.flags.writeable
+    with pytest.raises(ValueError):
+        first.contour[0, 0] = 1.0
+
+    contour, mesh = moc.allocate()
+    solution = moc.compute(25, out=(contour, mesh))
+    assert np.shares_memory(solution.mesh, mesh)
+    np.testing.assert_array_equal(contour, kept)
+    # Results computed into `out` buffers are views of them: reusing the buffers overwrites them
+    moc.compute(9, out=(contour, mesh))
+    assert solution.contour[-1, 1] ** 2 == pytest.approx(9, rel=5e-3)
+    moc.compute(25, out=(contour, mesh))
+    with pytest.raises(ValueError):
+        moc.compute(25, out=MethodOfCharacteristics(lines=10).allocate())
+
+    # The stateful API still matches
+    assert np.asarray(moc.solve(25)) == pytest.approx(kept)
+    assert moc.theta_max == first.theta_max
+
+def test_solver_pool_concurrent_solves():
+    """
+    Verifies that concurrent pooled and shared-instance solves each get their own answer.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from oberth.nozzle import SolverPool
+
+    pool = SolverPool(max_idle=2)
+    pool.warm(1.2, 40)
+    shared = MethodOfCharacteristics(gamma=1.2, lines=40)
+    ratios = [10, 25, 50, 100] * 6
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        pooled = list(executor.map(lambda er: pool.compute(er, 1.2, 40), ratios))
+        direct = list(executor.map(shared.compute, ratios))
+    for er, a, b in zip(ratios, pooled, direct):
+        assert a.contour[-1, 1] ** 2 == pytest.approx(er, rel=5e-3)
+        np.testing.assert_array_equal(a.contour, b.contour)
+
+    stats = pool.stats()
+    assert stats['keys'] == 1 and 1 <= stats['idle'] <= 2
+    assert stats['reused'] + stats['created'] == len(ratios) + 1
+    assert stats['reused'] > 0
+
+def test_solver_pool_limits_and_out_buffers():
+    """
+    Verifies the pool's byte budget and that it refuses `out` buffers an earlier result still views.
+    """
+    from oberth.nozzle import SolverPool
+
+    size = MethodOfCharacteristics(gamma=1.2, lines=60)
+    size.compute(25)
+    pool = SolverPool(max_bytes=int(2.5 * size.nbytes))
+    pool.warm(1.2, 60, count=4)
+    assert pool.stats()['idle'] == 2 and pool.stats()['bytes'] == 2 * size.nbytes
+    pool.warm(1.2, 10)                          # evicts from the colder key to make room
+    assert pool.stats()['keys'] == 2 and pool.stats()['bytes'] <= pool.max_bytes
+    idle = pool.stats()['idle']
+    pool.warm(1.2, 200)                         # larger than the whole budget: dropped
+    assert pool.stats()['idle'] == idle
+
+    out = size.allocate()
+    solution = pool.compute(25, 1.2, 60, out=out)
+    with pytest.raises(ValueError):
+        pool.compute(9, 1.2, 60, out=out)
+    with pytest.raises(ValueError):
+        pool.compute(9, 1.2, 60, out=(out[0][:], out[1]))
+    kept = solution.contour.copy()
+    del solution
+    assert pool.compute(9, 1.2, 60, out=out).contour[-1, 1] ** 2 == pytest.approx(9, rel=5e-3)
+    assert kept[-1, 1] ** 2 == pytest.approx(25, rel=5e-3)
+
+def test_rao_contour_geometry():
+    """
+    Verifies the Rao parabola: throat start, exit at the requested area ratio and length, wall
+    angles matching theta_n at the inflection and theta_e at the exit.
+    """
+    from oberth.nozzle import TAN_15_DEG, rao_angles, rao_contour
+    theta_n, theta_e = rao_angles(25, 0.8)
+    assert 0 < theta_e < theta_n < np.radians(40)
+
+    contour = rao_contour(25, points=200)
+    assert contour.shape == (200, 2)
+    assert tuple(contour[0]) == (0.0, 1.0)
+    assert contour[-1, 1] ** 2 == pytest.approx(25)
+    assert contour[-1, 0] == pytest.approx(0.8 * 4.0 / TAN_15_DEG)
+    assert np.all(np.diff(contour[:, 0]) > 0) and np.all(np.diff(contour[:, 1]) > 0)
+    slope = np.diff(contour[:, 1]) / np.diff(contour[:, 0])
+    assert np.degrees(np.arctan(slope.max())) == pytest.approx(np.degrees(theta_n), abs=0.5)
+    assert np.degrees(np.arctan(slope[-1])) == pytest.approx(np.degrees(theta_e), abs=0.5)
+    assert rao_contour(1.0).shape == (1, 2)
+
+def test_rao_adaptive_spacing_accuracy():
+    """
+    Verifies that curvature-adaptive points cluster at the throat and reach a given accuracy
+    with far fewer points than uniform arc-length spacing.
+    """
+    from oberth.nozzle import rao_contour
+    reference = rao_contour(25, points=20001, spacing='uniform')
+
+    def error(contour):
+        return np.max(np.abs(np.interp(reference[:, 0], contour[:, 0], contour[:, 1]) - reference[:, 1]))
+
+    adaptive = rao_contour(25, points=30)
+    steps = np.hypot(*np.diff(adaptive, axis=0).T)
+    assert steps[0] < 0.2 * steps.max()
+    assert error(adaptive) < error(rao_contour(25, points=120, spacing='uniform'))
+
+def test_simplify_mesh_levels_of_detail():
+    """
+    Verifies that the mesh decimation reproduces the full net without a tolerance and shrinks
+    it at one, keeping every characteristic line.
+    """
+    from oberth.nozzle import mesh_significance, simplify_mesh
+
+    moc = MethodOfCharacteristics(gamma=1.2, lines=60)
+    moc.solve(25)
+    weights = mesh_significance(moc.mesh_array, 60)
+    full = simplify_mesh(moc.mesh_array, 60, weights=weights)
+    assert len(full) == len(moc.mesh_array)
+    assert set(map(tuple, full)) == set(map(tuple, moc.mesh_array))
 
-    assert len(mesh) == len(unique_end_points), f"Expected {len(unique_end_points)} unique lines, but got {len(mesh)}"
-    # For 99 lines with 100 points, we expect <= 99 lines (actually exactly 99 if unique)
-    assert len(mesh) <= 99
+    coarse = simplify_mesh(moc.mesh_array, 60, tolerance=0.01, weights=weights)
+    assert len(coarse) < 0.2 * len(full)
+    # 2 * lines characteristic lines, each at least one segment
+    assert len(coarse) >= 2 * 60
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from oberth.chemistry import RocketPerformance
+from oberth.isentropic import area_ratio
+from oberth.nozzle import MethodOfCharacteristics
+from oberth.offdesign import nozzle_expansion_ratio, off_design_performance
+
+def test_map_shape_is_designs_by_altitudes():
+    results = off_design_performance(np.linspace(5, 80, 7), altitude=np.linspace(0, 50000, 11),
+                                     cstar=1800.0, throat_area=0.01)
+    for key in ('cf', 'cf_vacuum', 'pe', 'pa', 'separated', 'isp', 'thrust'):
+        assert results[key].shape == (7, 11)
+    # Ambient pressure only helps as it drops
+    assert np.all(np.diff(results['cf'], axis=1) >= 0.0)
+
+def test_cf_peaks_at_optimum_expansion():
+    gamma, pc, pa = 1.2, 100e5, 1e5
+    exit_mach = np.sqrt(2.0 / (gamma - 1.0) * ((pc / pa) ** ((gamma - 1.0) / gamma) - 1.0))
+    optimum = area_ratio(exit_mach, gamma)
+    eps = optimum * np.array([0.7, 0.85, 1.0, 1.15, 1.3])
+    results = off_design_performance(eps, ambient_pressure=pa, pc=pc, gamma=gamma)
+    assert np.argmax(results['cf']) == 2
+    assert results['pe'][2] == pytest.approx(pa, rel=1e-6)
+
+def test_vacuum_cf_is_the_high_altitude_limit():
+    results = off_design_performance([10.0, 40.0], altitude=[0.0, 200000.0])
+    np.testing.assert_allclose(results['cf'][:, -1], results['cf_vacuum'][:, -1], rtol=1e-4)
+
+def test_summerfield_separation():
+    results = off_design_performance([10.0, 150.0], ambient_pressure=[1e5, 1e3], pc=50e5)
+    separated = results['separated']
+    assert separated[1, 0] and not separated[0, 0] and not separated[:, 1].any()
+    # The separated nozzle flows full only up to where the wall pressure is 0.4 pa
+    assert results['separation_area_ratio'][1, 0] < 150.0
+    assert results['separation_area_ratio'][1, 1] == 150.0
+    # Separation removes the overexpansion penalty beyond that plane
+    attached = off_design_performance(150.0, ambient_pressure=1e5, pc=50e5, separation_ratio=0.0)
+    assert results['cf'][1, 0] > attached['cf']
+
+def test_nozzle_expansion_ratio_inputs():
+    moc = MethodOfCharacteristics(lines=20)
+    moc.solve(16)
+    solution = moc.compute(9)
+    np.testing.assert_allclose(nozzle_expansion_ratio([moc, solution, 4.0]), [16.0, 9.0, 4.0], rtol=1e-3)
+    with pytest.raises(ValueError):
+        nozzle_expansion_ratio(MethodOfCharacteristics())
+
+def test_rocket_performance_off_design():
+    engine = RocketPerformance(pc=70e5, pe=1e5)
+    engine.off_design(['LOX', 'RP-1'], 2.4, altitude=np.linspace(0, 30000, 5), throat_area=0.02)
+    results = engine.results
+    assert results['cf'].shape == (1, 5)
+    # Default nozzle is expanded to the stored exit pressure
+    assert results['pe'][0, 0] == pytest.approx(1e5, rel=1e-6)
+    np.testing.assert_allclose(results['isp'], results['cf'] * results['cstar'] / 9.80665)
+    assert 280.0 < results['isp'][0, 0] < results['isp'][0, -1] < 360.0
+    np.testing.assert_allclose(results['thrust'], results['cf'] * 70e5 * 0.02)
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from oberth.simplify import select, significance, simplify_polyline
+
+def _douglas_peucker(points, tolerance):
+    # Recursive reference implementation
+    keep = np.zeros(len(points), dtype=bool)
+    keep[[0, -1]] = True
+
+    def split(i, j):
+        if j <= i + 1:
+            return
+        chord = points[j] - points[i]
+        offset = points[i + 1:j] - points[i]
+        distance = np.abs(chord[0] * offset[:, 1] - chord[1] * offset[:, 0]) / np.hypot(*chord)
+        k = int(np.argmax(distance))
+        if distance[k] > tolerance:
+            keep[i + 1 + k] = True
+            split(i, i + 1 + k)
+            split(i + 1 + k, j)
+    split(0, len(points) - 1)
+    return np.flatnonzero(keep)
+
+@pytest.mark.parametrize("tolerance", [1e-3, 1e-2, 0.1])
+def test_significance_matches_recursive_douglas_peucker(tolerance):
+    rng = np.random.default_rng(0)
+    x = np.linspace(0.0, 10.0, 1000)
+    points = np.column_stack([x, np.sin(x) + 0.01 * rng.standard_normal(len(x))])
+    np.testing.assert_array_equal(select(significance(points), tolerance), _douglas_peucker(points, tolerance))
+
+def test_simplify_polyline_budget_and_breaks():
+    x = np.linspace(0.0, 1.0, 101)
+    line = np.column_stack([x, 2.0 * x])
+    # Collinear interior points carry no significance
+    assert len(simplify_polyline(line, tolerance=0.0)) == 2
+
+    arc = np.column_stack([np.cos(x * np.pi), np.sin(x * np.pi)])
+    simplified = simplify_polyline(arc, max_points=9)
+    assert len(simplified) == 9
+    assert tuple(simplified[0]) == tuple(arc[0]) and tuple(simplified[-1]) == tuple(arc[-1])
+
+    # Separate polylines never share a segment: every end point stays
+    weights = significance(np.concatenate([line, arc]), breaks=[len(line)])
+    assert np.isinf(weights[[0, len(line) - 1, len(line), -1]]).all()
+    assert len(select(weights, max_points=2)) == 4
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+from oberth.propellants import (
+    PROPELLANTS, SPECIES, build_species_database, get_propellant, species_thermo, thermo_properties
+)
+
+def test_bundled_species_table_matches_thermo_source():
+    """Verifies that the binary species table is up to date with the NASA-7 text source."""
+    table = build_species_database(path=None)
+    assert table.dtype == SPECIES.dtype
+    assert np.array_equal(table, SPECIES)
+
+def test_thermo_properties_vectorized():
+    """
+    Verifies standard-state values against JANAF (H2O, CO2, CH4 at 298.15 K) and that one call
+    over a temperature grid matches per-temperature evaluation on both polynomial ranges.
+    """
+    standard = thermo_properties(['H2O', 'CO2', 'CH4'], 298.15)
+    assert np.allclose(standard['h'], [-241.826e3, -393.522e3, -74.873e3], rtol=5e-3)
+    assert np.allclose(standard['s'], [188.835, 213.795, 186.251], rtol=1e-3)
+    assert np.allclose(standard['cp'], [33.59, 37.12, 35.64], rtol=1e-2)
+
+    T = np.linspace(300.0, 3500.0, 17).reshape(1, 17)
+    cp, h, s = species_thermo(['OH', 'CO'], T)
+    assert cp.shape == (2, 1, 17)
+    for k, temperature in enumerate(T[0]):
+        point = species_thermo('CO', temperature)
+        assert np.allclose([cp[1, 0, k], h[1, 0, k], s[1, 0, k]], point, rtol=1e-14)
+    with pytest.raises(ValueError):
+        species_thermo('XeF2', 1000.0)
+
+def test_get_propellant_compatibility_view():
+    """Verifies the dict view over the propellant table, including name aliases."""
+    assert get_propellant('kerosene') is PROPELLANTS['RP-1']
+    assert get_propellant('LOX')['molecular_weight'] == pytest.approx(31.999)
+    assert isinstance(get_propellant('LH2')['density'], float)
+    assert get_propellant('unobtainium') is None
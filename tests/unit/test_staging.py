@@ -1,3 +1,5 @@
+import pytest
+
 def test_staging_calculation():
     from oberth.mission import Stage
 
@@ -8,3 +10,55 @@ def test_staging_calculation():
 
     assert dv > 6700
     assert dv < 6800
+
+def test_stage_array_matches_stage():
+    import numpy as np
+    from oberth.mission import Stage, StageArray, Vehicle
+
+    stages = [Stage(isp=300, wet_mass=1000, dry_mass=100), Stage(isp=350, wet_mass=200, dry_mass=0)]
+    columns = StageArray.from_stages(stages)
+    assert np.allclose(columns.delta_v(), [stage.delta_v() for stage in stages])
+
+    # Two-stage vehicle stacked from its stage masses: 1000 kg payload on top
+    vehicle = Vehicle.from_stage_masses([300, 350], [90000, 18000], [8000, 2000], payload=1000)
+    assert np.allclose(vehicle.stages.wet_mass, [119000, 21000])
+    assert np.allclose(vehicle.stages.dry_mass, [29000, 3000])
+    assert vehicle.gross_mass == 119000
+
+def test_optimal_staging_batch():
+    import numpy as np
+    from oberth.mission import optimal_staging
+
+    # Brute-force optimum of the delta-v split for one two-stage design
+    isp, eps, dv, payload = np.array([300.0, 350.0]), np.array([0.1, 0.12]), 8000.0, 1000.0
+    c = isp * 9.80665
+    split = np.linspace(0.2, 0.8, 6001)[:, None]
+    n = np.exp(np.hstack([split, 1.0 - split]) * dv / c)
+    brute = payload * np.prod(n * (1.0 - eps) / (1.0 - n * eps), axis=1).min()
+
+    eps_grid = np.array([[0.1, 0.12], [0.05, 0.05], [0.3, 0.3]])
+    result = optimal_staging(isp, eps_grid, dv, payload)
+    assert result['gross_mass'][0] == pytest.approx(brute, rel=1e-6)
+    assert list(result['feasible']) == [True, True, False]
+
+    feasible = result['feasible']
+    assert np.allclose(result['vehicle'].total_delta_v()[feasible], dv)
+
+def test_optimal_staging_leaves_unneeded_stages_unused():
+    import numpy as np
+    from oberth.mission import optimal_staging
+
+    isp, eps, payload = np.array([300.0, 350.0]), np.array([0.1, 0.1]), 1000.0
+    result = optimal_staging(isp, eps, [1.0, 1000.0], payload)
+    assert result['feasible'].all()
+    assert np.all(result['propellant_mass'] >= 0.0) and np.all(result['gross_mass'] > payload)
+    # The low-Isp stage is dropped: the upper stage alone flies the whole delta-v
+    assert np.all(result['mass_ratio'][:, 0] == 1.0)
+    assert np.allclose(result['vehicle'].total_delta_v(), [1.0, 1000.0])
+
+    # Brute-force optimum over delta-v splits with both stages allowed to burn nothing
+    c = isp * 9.80665
+    split = np.linspace(0.0, 1.0, 10001)[:, None]
+    n = np.exp(np.hstack([split, 1.0 - split]) * 1000.0 / c)
+    brute = payload * np.prod(n * (1.0 - eps) / (1.0 - n * eps), axis=1).min()
+    assert result['gross_mass'][1] == pytest.approx(brute, rel=1e-9)
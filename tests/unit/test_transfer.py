@@ -0,0 +1,46 @@
+import pytest
+import numpy as np
+from oberth.mission import DAY, hohmann_transfer_dv, hohmann_transfer_dv_array, lambert, planet_state, porkchop
+
+def test_hohmann_array_matches_scalar():
+    """Verifies that the broadcast Hohmann grid reproduces the scalar budget cell by cell."""
+    r1 = np.linspace(6.678e6, 7.0e6, 4)
+    r2 = np.array([6.0e6, 2.0e7, 4.2164e7])
+    grid = hohmann_transfer_dv_array(r1[:, None], r2[None, :])
+    assert grid.shape == (4, 3)
+    expected = [[hohmann_transfer_dv(a, b) for b in r2] for a in r1]
+    assert np.allclose(grid, expected, rtol=1e-14)
+    # LEO (300 km) to GEO ~ 3.9 km/s
+    assert 3800 < hohmann_transfer_dv_array(6.678e6, 4.2164e7) < 4000
+
+def test_lambert_curtis_example():
+    """Verifies the universal-variable Lambert solver (Curtis, Example 5.2)."""
+    r1 = np.array([5000e3, 10000e3, 2100e3])
+    r2 = np.array([-14600e3, 2500e3, 7000e3])
+    v1, v2 = lambert(np.stack([r1, r1]), np.stack([r2, r2]), np.array([3600.0, -10.0]), mu=3.986e14)
+    assert np.allclose(v1[0], [-5992.5, 1925.4, 3245.6], atol=0.5)
+    assert np.allclose(v2[0], [-3312.5, -4196.6, -385.3], atol=0.5)
+    assert np.isnan(v1[1]).all()
+
+def test_earth_mars_porkchop_2020():
+    """Verifies the 2020 Earth-Mars window: minimum departure C3 ~ 13 km^2/s^2."""
+    departure = np.linspace(7450, 7500, 51)   # days since J2000 (late June to mid August 2020)
+    arrival = np.linspace(7600, 7800, 101)
+    grid = porkchop('Earth', 'Mars', departure, arrival)
+    assert grid['c3'].shape == (51, 101)
+    assert np.nanmin(grid['c3']) / 1e6 == pytest.approx(13.2, abs=1.0)
+    assert np.all(grid['tof'] > 0)
+    assert not np.isnan(grid['c3']).any()
+
+def test_warm_started_porkchop_matches_lambert():
+    # Large enough to start from the coarse grid, with arrivals before departures
+    departure = np.linspace(8000, 8400, 201)
+    arrival = np.linspace(8150, 8800, 201)
+    grid = porkchop('Earth', 'Mars', departure, arrival)
+    rows = np.arange(0, 201, 25)
+    r1, vp1 = planet_state('Earth', departure[rows])
+    r2, _ = planet_state('Mars', arrival)
+    v1, _ = lambert(r1[:, None, :], r2[None, :, :], grid['tof'][rows] * DAY)
+    c3 = np.sum((v1 - vp1[:, None, :]) ** 2, axis=-1)
+    np.testing.assert_array_equal(np.isnan(grid['c3'][rows]), np.isnan(c3))
+    np.testing.assert_allclose(grid['c3'][rows], c3, rtol=1e-7)
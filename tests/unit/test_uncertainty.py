@@ -0,0 +1,40 @@
+import pytest
+import numpy as np
+from oberth.uncertainty import Normal, RunningStatistics, Uniform, engine_chain, monte_carlo
+
+def test_running_statistics_match_numpy():
+    """Verifies streamed moments and histogram percentiles against the full-sample values."""
+    values = np.random.default_rng(0).lognormal(0.0, 1.0, 200_000)
+    stats = RunningStatistics()
+    for chunk in np.array_split(values, 9):
+        stats.update(chunk)
+    stats.update([np.nan])
+
+    assert stats.count == values.size and stats.invalid == 1
+    assert stats.mean == pytest.approx(values.mean(), rel=1e-12)
+    assert stats.std == pytest.approx(values.std(), rel=1e-10)
+    assert np.allclose(stats.percentile([5, 50, 95]), np.percentile(values, [5, 50, 95]), atol=0.02)
+
+def test_monte_carlo_is_reproducible_across_workers():
+    """
+    Verifies that the engine chain reproduces its nominal point and that a process pool gives
+    exactly the in-process statistics for the same seed.
+    """
+    nominal = engine_chain({})
+    assert nominal['isp'] == pytest.approx(320.0)
+    assert nominal['delta_v'] == pytest.approx(320.0 * 9.80665 * np.log(10.0))
+
+    inputs = {'pc': Normal(100e5, 3e5), 'of': Normal(2.3, 0.05), 'gamma': Uniform(1.18, 1.22),
+              'dry_mass': Normal(100.0, 2.0)}
+    serial = monte_carlo(inputs, 100_000, chunk_size=16384, seed=7)
+    pooled = monte_carlo(inputs, 100_000, chunk_size=16384, seed=7, workers=2)
+    for name in ('isp', 'heat_flux', 'delta_v'):
+        assert serial[name]['count'] == 100_000
+        assert serial[name]['mean'] == pooled[name]['mean']
+        assert np.array_equal(serial[name]['percentiles'], pooled[name]['percentiles'])
+    low, median, high = serial['isp']['percentiles']
+    assert low < median < high and median == pytest.approx(320.0, rel=1e-2)
+
+def test_monte_carlo_requires_samples():
+    with pytest.raises(ValueError):
+        monte_carlo({'pc': Normal(100e5, 1e5)}, n_samples=0)